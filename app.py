@@ -7,9 +7,14 @@ print(">>> Arrancando aplicación…")
 try:
     print(">>> Importando LoginWindow…")
     from employ_toolkit.gui.login import LoginWindow
-    
+    from employ_toolkit.core.storage import init_db
+    from employ_toolkit.core.maintenance import start_scheduler
+
+    print(">>> Verificando esquema de la base…")
+    init_db()   # crea tablas y aplica migraciones pendientes
+    start_scheduler()   # optimize / ANALYZE / incremental_vacuum en segundo plano
 except Exception:
-    print(">>> FALLO al importar LoginWindow:")
+    print(">>> FALLO al importar LoginWindow / preparar la base:")
     traceback.print_exc()
     sys.exit(1)
 
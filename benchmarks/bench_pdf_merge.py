@@ -0,0 +1,124 @@
+"""
+Benchmark · memoria al fusionar el informe final
+================================================
+Genera N PDFs tipo entregable (ReportLab, 3 páginas, el mismo logo PNG en
+cada uno; con `--distinct` un logo distinto por PDF, sin nada que
+deduplicar) y los fusiona con:
+
+• `PdfMerger` de PyPDF2 (lo que hacía `final_report._merge_pdfs`);
+• `core.pdf_merge.merge_pdfs` (streaming + mmap + deduplicación).
+
+Cada estrategia corre en un proceso nuevo y reporta el pico de RSS
+(`ru_maxrss`), lo que creció ese pico durante la fusión (0 = no superó lo
+que ya ocupaban las importaciones), el tiempo y el tamaño del resultado.
+
+Uso (sólo POSIX, usa `resource`):
+    python benchmarks/bench_pdf_merge.py [--docs 200] [--distinct] [--keep DIR]
+"""
+
+import argparse
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+STRATEGIES = ("merger", "stream")
+
+
+def _rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _make_inputs(directory: Path, docs: int, distinct: bool) -> list[Path]:
+    from PIL import Image
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.platypus import Image as RLImage, PageBreak, Paragraph, SimpleDocTemplate
+
+    from employ_toolkit.core import pdf_styles
+
+    rnd = random.Random(7)
+
+    def make_logo(name: str) -> Path:           # ruido: no se comprime, ~190 KB
+        path = directory / name
+        Image.frombytes("RGB", (256, 256), rnd.randbytes(256 * 256 * 3)).save(path)
+        return path
+
+    logo = make_logo("logo.png")
+    st = pdf_styles.stylesheet()
+    paths = []
+    for i in range(docs):
+        if distinct:
+            logo = make_logo(f"logo_{i:03d}.png")
+        story = []
+        for page in range(3):
+            story += [RLImage(str(logo), 96, 96),
+                      Paragraph(f"Entregable {i} · página {page + 1}", st["Title"]),
+                      Paragraph("Texto de relleno del entregable. " * 60, st["Normal"]),
+                      PageBreak()]
+        path = directory / f"doc_{i:03d}.pdf"
+        SimpleDocTemplate(str(path), pagesize=LETTER).build(story)
+        paths.append(path)
+    return paths
+
+
+def _child(strategy: str, directory: Path) -> None:
+    from PyPDF2 import PdfMerger
+    from employ_toolkit.core.pdf_merge import merge_pdfs
+
+    sources = sorted(directory.glob("doc_*.pdf"))
+    out = directory / f"merged_{strategy}.pdf"
+    base = _rss_mb()
+    t0 = time.perf_counter()
+    if strategy == "merger":
+        merger = PdfMerger()
+        for path in sources:
+            merger.append(str(path))
+        merger.write(str(out))
+        merger.close()
+    else:
+        with out.open("wb") as fh:
+            merge_pdfs(sources, fh)
+    seconds = time.perf_counter() - t0
+    print(f"{_rss_mb():.1f} {_rss_mb() - base:.1f} {seconds:.2f} {out.stat().st_size}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--docs", type=int, default=200, help="PDFs a fusionar")
+    ap.add_argument("--distinct", action="store_true", help="un logo distinto por PDF")
+    ap.add_argument("--keep", type=Path, help="directorio de trabajo (no se borra)")
+    ap.add_argument("--child", choices=STRATEGIES, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        _child(args.child, args.keep)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.keep or Path(tmp)
+        directory.mkdir(parents=True, exist_ok=True)
+        inputs = _make_inputs(directory, args.docs, args.distinct)
+        total = sum(p.stat().st_size for p in inputs) / 1e6
+        print(f"{args.docs} PDFs de entrada, {total:.1f} MB en total\n")
+        print(f"{'estrategia':<12} {'pico RSS':>10} {'Δ RSS':>10} {'tiempo':>8} {'salida':>10}")
+        print("-" * 54)
+        for strategy in STRATEGIES:
+            line = subprocess.run(
+                [sys.executable, __file__, "--child", strategy, "--keep", str(directory)],
+                check=True, capture_output=True, text=True, cwd=ROOT,
+            ).stdout.split()
+            peak, delta, seconds, size = float(line[0]), float(line[1]), float(line[2]), int(line[3])
+            print(f"{strategy:<12} {peak:>8.1f}MB {delta:>8.1f}MB {seconds:>7.2f}s "
+                  f"{size / 1e6:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark · coste de preparación por documento PDF
+==================================================
+Compara lo que hacía cada generador por exportación (hoja de estilos de
+ejemplo + TableStyle de cabecera azul construidos de cero) con el registro
+compartido de `employ_toolkit.core.pdf_styles`.
+
+Mide dos cosas, en µs por documento:
+
+• sólo la preparación (estilos + tabla);
+• un documento completo tipo "Plan de Networking" renderizado en memoria.
+
+Uso:
+    python benchmarks/bench_pdf_styles.py [--docs 2000]
+"""
+
+import argparse
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from employ_toolkit.core import pdf_styles
+
+
+def _setup_before():
+    styles = getSampleStyleSheet()
+    table_style = TableStyle([
+        ("GRID", (0, 0), (-1, -1), 0.4, colors.grey),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0B6FA4")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ])
+    return styles, table_style
+
+
+def _setup_after():
+    return pdf_styles.stylesheet(), pdf_styles.header_table_style()
+
+
+def _render(setup):
+    styles, table_style = setup()
+    table = Table([["Meta conexiones nuevas", "10"],
+                   ["Tipos de contacto", "Reclutadores, Pares"],
+                   ["Tiempo diario disponible (min)", "30"]], colWidths=[220, 300])
+    table.setStyle(table_style)
+    story = [Paragraph("Plan de Networking – Benchmark", styles["Title"]),
+             Paragraph("Fecha: hoy", styles["Normal"]), Spacer(1, 12), table,
+             Paragraph("Mensaje base de invitación", styles["Heading3"])]
+    SimpleDocTemplate(io.BytesIO(), pagesize=LETTER).build(story)
+
+
+def _per_doc_us(func, docs: int, repeats: int = 5) -> float:
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(docs):
+            func()
+        samples.append((time.perf_counter() - t0) / docs * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--docs", type=int, default=2000,
+                    help="documentos por repetición (preparación)")
+    args = ap.parse_args()
+    full_docs = max(1, args.docs // 20)
+
+    _render(_setup_after)                  # calienta fuentes e importaciones
+    rows = [
+        ("preparación", _per_doc_us(_setup_before, args.docs),
+         _per_doc_us(_setup_after, args.docs)),
+        ("documento completo", _per_doc_us(lambda: _render(_setup_before), full_docs),
+         _per_doc_us(lambda: _render(_setup_after), full_docs)),
+    ]
+
+    print(f"{'µs / documento':<20} {'antes':>10} {'después':>10} {'ahorro':>8}")
+    print("-" * 52)
+    for name, before, after in rows:
+        print(f"{name:<20} {before:>10.1f} {after:>10.1f} {100 * (1 - after / before):>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark · lectores concurrentes + un escritor sobre empleabilidad.db
+=====================================================================
+Copia la base (por defecto employ_toolkit/empleabilidad.db) a un directorio
+temporal por cada perfil y mide:
+
+• latencia de lectura de la tabla `client` (p50 / p95 / máx) en N hilos,
+• lecturas fallidas por "database is locked",
+• inserciones de `Document` confirmadas por el escritor.
+
+El escritor simula una exportación: inserta varios documentos dentro de una
+misma transacción y la mantiene abierta unos milisegundos antes del commit.
+
+Uso:
+    python benchmarks/bench_sqlite_concurrency.py [--db RUTA] [--seconds 5]
+"""
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, SQLModel, select
+
+from employ_toolkit.core import storage
+from employ_toolkit.core.models import Client, Document
+
+
+def _reader(engine, stop, latencies, errors):
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            with Session(engine) as s:
+                s.exec(select(Client)).all()
+        except OperationalError:
+            errors.append(1)
+            continue
+        latencies.append(time.perf_counter() - t0)
+
+
+def _writer(engine, stop, client_id, commits, errors, batch, hold):
+    while not stop.is_set():
+        try:
+            with Session(engine) as s:
+                for i in range(batch):
+                    s.add(Document(
+                        client_id=client_id, module=0,
+                        doc_type="bench", path=f"bench_{i}.pdf",
+                        created_at=datetime.utcnow(),
+                    ))
+                s.flush()
+                time.sleep(hold)          # transacción "larga" de exportación
+                s.commit()
+            commits.append(batch)
+        except OperationalError:
+            errors.append(1)
+
+
+def run_profile(db: Path, profile: str, readers: int, seconds: float,
+                batch: int, hold: float) -> dict:
+    engine = storage.make_engine(db, profile)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as s:
+        client = s.exec(select(Client)).first()
+        if client is None:
+            client = Client(full_name="Bench", email="bench@example.com",
+                            phone="0", profession="QA", age=30, disc_type="D")
+            s.add(client); s.commit(); s.refresh(client)
+        client_id = client.id
+
+    stop = threading.Event()
+    latencies: list[float] = []
+    r_errors: list[int] = []
+    w_errors: list[int] = []
+    commits: list[int] = []
+
+    threads = [threading.Thread(target=_reader, args=(engine, stop, latencies, r_errors))
+               for _ in range(readers)]
+    threads.append(threading.Thread(
+        target=_writer, args=(engine, stop, client_id, commits, w_errors, batch, hold)))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    engine.dispose()
+
+    latencies.sort()
+    pct = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+    return {
+        "profile": profile,
+        "reads": len(latencies),
+        "p50_ms": pct(0.50) if latencies else float("nan"),
+        "p95_ms": pct(0.95) if latencies else float("nan"),
+        "max_ms": latencies[-1] * 1000 if latencies else float("nan"),
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else float("nan"),
+        "read_locked": len(r_errors),
+        "docs_written": sum(commits),
+        "write_locked": len(w_errors),
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--db", type=Path, default=storage.DB_PATH)
+    ap.add_argument("--profiles", nargs="+", default=["legacy", "wal"])
+    ap.add_argument("--readers", type=int, default=4)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--batch", type=int, default=20, help="documentos por transacción")
+    ap.add_argument("--hold", type=float, default=0.02, help="s con la transacción abierta")
+    args = ap.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            db = Path(tmp) / f"{profile}.db"
+            if args.db.exists():
+                shutil.copy(args.db, db)
+            rows.append(run_profile(db, profile, args.readers, args.seconds,
+                                    args.batch, args.hold))
+
+    cols = ["profile", "reads", "p50_ms", "p95_ms", "max_ms", "mean_ms",
+            "read_locked", "docs_written", "write_locked"]
+    print(" | ".join(f"{c:>12}" for c in cols))
+    for r in rows:
+        print(" | ".join(
+            f"{r[c]:>12.2f}" if isinstance(r[c], float) else f"{r[c]:>12}" for c in cols
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """
 CLI · Plataforma de Empleabilidad
 ================================
-Ejecuta, en orden, los pasos del Módulo 1:
+Ejecuta los pasos del Módulo 1 como un DAG (todos dependen sólo de intake):
 
 1. Intake & Diagnóstico            -> intake_wizard
 2. BrandCanvas (PDF + JSON)        -> brand_canvas_wizard
@@ -10,9 +10,27 @@ Ejecuta, en orden, los pasos del Módulo 1:
 5. Análisis de Demanda Laboral     -> demand_analysis
 
 Cada paso guarda su resultado en el contexto compartido del WorkflowManager.
+Los pasos que preguntan por consola (`interactive=True`) se ejecutan de uno
+en uno; el resto corre en paralelo en cuanto termina el intake y, si sus
+entradas no cambiaron desde la última ejecución, sale de la caché de pasos.
+
+Cada paso terminado queda en un checkpoint; si la ejecución se corta:
+
+    python cli.py --resume <run_id>
+
+Con `--trace run.json` se mide cada paso (tiempo real, CPU, pico de memoria),
+se imprime un resumen y se exporta un trace de Chrome (chrome://tracing).
+
+Modo lote, sin preguntas (respuestas de N clientes en CSV o JSONL):
+
+    python cli.py --batch cohorte.csv --workers 8 --log batch.ndjson
 """
 
-from employ_toolkit.core import storage, workflow
+import argparse
+
+
+from employ_toolkit.core import batch, storage, workflow
+from employ_toolkit.core.step_cache import StepCache
 from employ_toolkit.modules import (
     intake,
     brand_canvas,
@@ -22,25 +40,80 @@ from employ_toolkit.modules import (
 )
 
 
-def main() -> None:
-    # 1) Asegurar la base de datos SQLite
-    storage.init_db()
+def _print_batch_line(line: dict) -> None:
+    mark = {"ok": "✓", "partial": "~"}.get(line["status"], "✗")
+    print(f"{mark} {line['client']} ({line.get('seconds', '-')} s)")
+    for step, error in line.get("errors", {}).items():
+        print(f"    · {step}: {error}")
+
 
-    # 2) Crear gestor de flujo
-    wm = workflow.WorkflowManager()
+def build_workflow(args: argparse.Namespace) -> workflow.WorkflowManager:
+    """DAG del Módulo 1 por consola (no lo ejecuta)."""
+    wm = workflow.WorkflowManager(cache=StepCache(), checkpoint=True,
+                                  profile=bool(args.trace),
+                                  step_timeout=args.step_timeout)
 
     # -------------------------- PASOS -------------------------- #
-    wm.run_step("intake", intake.intake_wizard)
+    wm.add_step("intake", intake.intake_wizard, interactive=True)
 
-    wm.run_step("brand_canvas", brand_canvas.brand_canvas_wizard)
+    wm.add_step("brand_canvas", brand_canvas.brand_canvas_wizard,
+                depends_on=["intake"], interactive=True)
 
-    wm.run_step("content_plan", content_plan.content_plan_wizard)
+    wm.add_step("content_plan", content_plan.content_plan_wizard,
+                depends_on=["intake"], interactive=True)
 
-    wm.run_step("linkedin_networking", linkedin_networking.networking_ppt)
+    wm.add_step("linkedin_networking", linkedin_networking.networking_ppt,
+                depends_on=["intake"])
 
-    wm.run_step("demand_analysis", demand_analysis.demand_analysis)
+    wm.add_step("demand_analysis", demand_analysis.demand_analysis,
+                depends_on=["intake"], interactive=True)
+    return wm
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Módulo 1 por consola")
+    ap.add_argument("--resume", metavar="RUN_ID",
+                    help="continuar una ejecución interrumpida")
+    ap.add_argument("--trace", metavar="ARCHIVO.json",
+                    help="perfilar los pasos y exportar un trace de Chrome")
+    ap.add_argument("--batch", metavar="ARCHIVO",
+                    help="procesar sin consola los clientes de un .csv / .jsonl")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="procesos del modo lote (por defecto, núcleos)")
+    ap.add_argument("--log", default="workspace/batch.ndjson",
+                    help="NDJSON con un resultado por cliente (modo lote)")
+    ap.add_argument("--step-timeout", type=float, default=None, metavar="SEG",
+                    help="límite por paso; el paso colgado se corta y se informa")
+    args = ap.parse_args()
+
+    # 1) Asegurar la base de datos SQLite
+    storage.init_db()
+
+    if args.batch:
+        summary = batch.run_batch(
+            args.batch, args.log, workers=args.workers,
+            step_timeout=args.step_timeout,
+            on_result=_print_batch_line,
+        )
+        print(f"\n{summary.ok}/{summary.total} clientes OK, {summary.partial} parciales, "
+              f"{summary.failed} con error "
+              f"en {summary.seconds:.1f} s → {summary.log_path}")
+        return
+
+    # 2) Flujo del Módulo 1 (pasos sin cambios salen de la caché)
+    wm = build_workflow(args)
+
+    if args.resume:
+        wm.resume(args.resume)
+    else:
+        wm.run()
     # ----------------------------------------------------------- #
 
+    if args.trace:
+        print("\n=== Perfil por paso ===")
+        print(wm.summary())
+        print(f"Trace: {wm.write_trace(args.trace)}")
+
     # 3) Contexto final (debug)
     print("\n=== Contexto final ===")
     for step, result in wm.context.items():
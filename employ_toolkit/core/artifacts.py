@@ -0,0 +1,133 @@
+# employ_toolkit/core/artifacts.py
+"""
+Entregables direccionados por contenido
+---------------------------------------
+Cada exportación creaba un archivo `<nombre>_<uuid6>_<tag>` nuevo aunque
+las respuestas no hubieran cambiado. Los `generate_*` decorados con
+`@content_addressed("networking", version="1")` calculan antes una clave:
+
+    generador + versión + cliente (tipo, id, nombre) + fecha + entradas normalizadas
+
+y si ya existe un entregable con esa clave (y sus archivos siguen en
+disco) lo devuelven sin renderizar; el formulario lo registra como
+siempre. La fecha entra en la clave porque los documentos la imprimen
+("Fecha: …"): un re-export del mismo día reutiliza, uno de otro día no.
+El nombre también, porque da nombre al archivo y aparece en el documento;
+el tipo separa `CandidateProfile` (lote) y `Client` (GUI), cuyos ids no
+comparten secuencia pero sí el índice.
+
+• Normalización: strings en NFC y sin espacios en los extremos; el orden
+  de las claves de los dict no importa (`step_cache.stable_hash`).
+• Índice: un JSON por clave en `ARTIFACT_DIR`, escrito con `publish`.
+• `in_memory=True` no pasa por aquí (no hay archivo que reutilizar), ni
+  las entradas que `stable_hash` no sabe canonizar (se renderiza siempre).
+• Cambiar `version` invalida lo anterior (p.ej. al tocar el diseño).
+"""
+
+import functools
+import json
+import unicodedata
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+
+from employ_toolkit.core.publish import publish
+from employ_toolkit.core.step_cache import stable_hash
+
+ARTIFACT_DIR = Path("workspace") / ".artifacts"
+
+
+# --------------------------------------------------------------------------- #
+# Clave                                                                       #
+# --------------------------------------------------------------------------- #
+def _normalize(obj: Any) -> Any:
+    if isinstance(obj, str):
+        return unicodedata.normalize("NFC", obj).strip()
+    if isinstance(obj, dict):
+        return {_normalize(k): _normalize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(v) for v in obj]
+    return obj
+
+
+def _client_identity(client: Any) -> list:
+    """[tipo, id, nombre] del cliente tal y como entra en la clave."""
+    return [type(client).__name__, getattr(client, "id", None),
+            getattr(client, "full_name", None)]
+
+
+def content_key(generator: str, version: str, client: list, data: Any) -> str:
+    return stable_hash({
+        "generator": generator,
+        "version": version,
+        "client": _normalize(client),
+        "date": date.today().isoformat(),
+        "data": _normalize(data),
+    })
+
+
+# --------------------------------------------------------------------------- #
+# Índice                                                                      #
+# --------------------------------------------------------------------------- #
+def _encode(result: Any) -> Any:
+    """Path | dict[str, Path] → JSON; None si el resultado no es archivable."""
+    if isinstance(result, Path):
+        return str(result)
+    if isinstance(result, dict) and all(isinstance(v, Path) for v in result.values()):
+        return {k: str(v) for k, v in result.items()}
+    return None
+
+
+def _decode(raw: Any) -> Path | dict[str, Path]:
+    if isinstance(raw, str):
+        return Path(raw)
+    return {k: Path(v) for k, v in raw.items()}
+
+
+def lookup(key: str, directory: Path = ARTIFACT_DIR) -> Path | dict[str, Path] | None:
+    """Resultado guardado para `key` si todos sus archivos siguen existiendo."""
+    try:
+        raw = json.loads((Path(directory) / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    result = _decode(raw["result"])
+    paths = result.values() if isinstance(result, dict) else [result]
+    return result if all(p.is_file() for p in paths) else None
+
+
+def remember(key: str, result: Any, directory: Path = ARTIFACT_DIR) -> None:
+    encoded = _encode(result)
+    if encoded is None:
+        return
+    entry = json.dumps({"result": encoded}, ensure_ascii=False).encode("utf-8")
+    publish(entry, Path(directory) / f"{key}.json", durable=False)
+
+
+# --------------------------------------------------------------------------- #
+# Decorador                                                                   #
+# --------------------------------------------------------------------------- #
+def content_addressed(generator: str, version: str = "1") -> Callable:
+    """
+    Decorador para `generate_*(client, *args, in_memory=False, **kwargs)`:
+    reutiliza el entregable si la clave de contenido ya se generó.
+    """
+    def wrap(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def inner(client, *args, in_memory: bool = False, **kwargs):
+            if in_memory:
+                return func(client, *args, in_memory=True, **kwargs)
+            try:
+                key = content_key(generator, version, _client_identity(client),
+                                  {"args": args, "kwargs": kwargs})
+            except TypeError:                 # entradas sin forma canónica
+                return func(client, *args, **kwargs)
+            hit = lookup(key, ARTIFACT_DIR)
+            if hit is not None:
+                return hit
+            result = func(client, *args, **kwargs)
+            remember(key, result, ARTIFACT_DIR)
+            return result
+
+        inner.content_version = version
+        return inner
+    return wrap
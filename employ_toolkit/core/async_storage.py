@@ -0,0 +1,120 @@
+# employ_toolkit/core/async_storage.py
+"""
+Acceso asíncrono a la base SQLite (aiosqlite)
+---------------------------------------------
+Espejo de `core.storage` para servicios no-GUI (p.ej. FastAPI): mismo
+archivo, mismos modelos SQLModel y mismo perfil de pragmas (WAL), pero con
+`AsyncSession`. Permite atender cientos de peticiones concurrentes de listas
+de documentos o informes sin un hilo por petición.
+
+El engine se crea al primer uso, así que `aiosqlite` sólo es necesario
+cuando realmente se usa esta API.
+"""
+
+from pathlib import Path
+from typing import Sequence
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from employ_toolkit.core import storage
+from employ_toolkit.core.models import Client, Document, User
+
+_async_engine = None
+_session_factory = None
+
+
+# --------------------------------------------------------------------------- #
+# Engine y fábrica de sesiones                                                #
+# --------------------------------------------------------------------------- #
+def make_async_engine(
+    path: Path | str = storage.DB_PATH,
+    profile: storage.EngineProfile | str | None = None,
+):
+    """Crea un AsyncEngine sobre aiosqlite con los pragmas del perfil."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    profile = storage.resolve_profile(profile)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=profile.pool_timeout,
+        connect_args={"timeout": profile.busy_timeout_ms / 1000},
+    )
+    storage.install_pragmas(engine.sync_engine, profile)
+    return engine
+
+
+def configure_async_engine(
+    path: Path | str | None = None,
+    profile: storage.EngineProfile | str | None = None,
+):
+    """(Re)crea el engine asíncrono global. Llamar antes de abrir sesiones."""
+    global _async_engine, _session_factory
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    _async_engine = make_async_engine(path or storage.DB_PATH, profile)
+    _session_factory = async_sessionmaker(
+        _async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    return _async_engine
+
+
+def get_async_engine():
+    if _async_engine is None:
+        configure_async_engine()
+    return _async_engine
+
+
+def get_async_session() -> AsyncSession:
+    """Equivalente asíncrono de `storage.get_session()`."""
+    if _session_factory is None:
+        configure_async_engine()
+    return _session_factory()
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = _session_factory = None
+
+
+# --------------------------------------------------------------------------- #
+# Consultas comunes                                                           #
+# --------------------------------------------------------------------------- #
+async def _fetch(stmt, session: AsyncSession | None, *, first: bool = False):
+    """Ejecuta `stmt` en `session` o en una sesión propia de corta vida."""
+    async def run(s: AsyncSession):
+        result = await s.exec(stmt)
+        return result.first() if first else result.all()
+
+    if session is not None:
+        return await run(session)
+    async with get_async_session() as s:
+        return await run(s)
+
+
+async def list_clients(session: AsyncSession | None = None) -> Sequence[Client]:
+    """Clientes ordenados del más reciente al más antiguo."""
+    return await _fetch(select(Client).order_by(Client.id.desc()), session)
+
+
+async def documents_for_client(
+    client_id: int, session: AsyncSession | None = None
+) -> Sequence[Document]:
+    """Documentos de un cliente, más recientes primero."""
+    stmt = (
+        select(Document)
+        .where(Document.client_id == client_id)
+        .order_by(Document.created_at.desc())
+    )
+    return await _fetch(stmt, session)
+
+
+async def user_by_username(
+    username: str, session: AsyncSession | None = None
+) -> User | None:
+    stmt = select(User).where(User.username == username)
+    return await _fetch(stmt, session, first=True)
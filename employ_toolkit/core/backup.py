@@ -0,0 +1,191 @@
+# employ_toolkit/core/backup.py
+"""
+Copias de seguridad en caliente
+-------------------------------
+Usa la API de backup de SQLite (`sqlite3.Connection.backup`) por lotes de
+páginas: cada paso toma el bloqueo de lectura sólo durante `pages` páginas
+y duerme `sleep` segundos antes del siguiente, así la GUI sigue leyendo y
+escribiendo durante la copia (con WAL los escritores ni siquiera esperan).
+Si otra conexión modifica la base a mitad de copia, SQLite reinicia los
+pasos restantes por su cuenta; el resultado es siempre consistente.
+
+• `backup()`           → copia a `BACKUP_DIR/empleabilidad-AAAAmmdd-HHMMSS-ffffff.db`
+                         (ffffff = microsegundos; primero `.partial`, luego
+                         `os.replace`). El nombre ordena cronológicamente.
+• `BackupService`      → lanza `backup()` + `rotate()` en un hilo propio.
+• `rotate(keep)`       → conserva sólo las `keep` copias más recientes.
+• `restore(archivo)`   → comprueba la copia y la vuelca sobre la base activa.
+
+Uso:
+    python -m employ_toolkit.core.backup backup [--keep 7]
+    python -m employ_toolkit.core.backup list
+    python -m employ_toolkit.core.backup restore RUTA
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from employ_toolkit.core import storage
+
+BACKUP_DIR = storage.DB_PATH.parent / "backups"
+PREFIX = "empleabilidad-"
+
+Progress = Callable[[int, int, int], None]   # (status, remaining, total)
+
+
+# --------------------------------------------------------------------------- #
+# Helpers                                                                     #
+# --------------------------------------------------------------------------- #
+def active_db_path() -> Path:
+    """Archivo de la base a la que apunta `storage.engine`."""
+    database = storage.engine.url.database
+    if not database or database == ":memory:":
+        raise ValueError("La base activa está en memoria: no hay archivo que copiar")
+    return Path(database)
+
+
+def list_backups(directory: Path | str = BACKUP_DIR) -> list[Path]:
+    """Copias existentes, de la más antigua a la más reciente."""
+    return sorted(Path(directory).glob(f"{PREFIX}*.db"))
+
+
+def _copy(src: Path, dest: Path, pages: int, sleep: float,
+          progress: Progress | None) -> None:
+    source = sqlite3.connect(src)
+    target = sqlite3.connect(dest)
+    try:
+        source.backup(target, pages=pages, progress=progress, sleep=sleep)
+    finally:
+        target.close()
+        source.close()
+
+
+# --------------------------------------------------------------------------- #
+# Backup / rotación                                                           #
+# --------------------------------------------------------------------------- #
+def backup(
+    dest: Path | str | None = None,
+    *,
+    pages: int = 256,
+    sleep: float = 0.005,
+    progress: Progress | None = None,
+) -> Path:
+    """
+    Copia la base activa sin cerrarla. `dest` puede ser un archivo o un
+    directorio (por defecto `BACKUP_DIR`). Devuelve la ruta creada.
+    """
+    dest = Path(dest) if dest is not None else BACKUP_DIR
+    if dest.suffix != ".db":
+        dest.mkdir(parents=True, exist_ok=True)
+        dest = dest / f"{PREFIX}{datetime.now():%Y%m%d-%H%M%S-%f}.db"
+    else:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+    partial = dest.with_name(dest.name + ".partial")
+    partial.unlink(missing_ok=True)
+    try:
+        _copy(active_db_path(), partial, pages, sleep, progress)
+        os.replace(partial, dest)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return dest
+
+
+def rotate(keep: int = 7, directory: Path | str = BACKUP_DIR) -> list[Path]:
+    """Borra las copias más antiguas y devuelve las eliminadas."""
+    stale = list_backups(directory)[:-keep] if keep > 0 else list_backups(directory)
+    for path in stale:
+        path.unlink(missing_ok=True)
+    return stale
+
+
+class BackupService:
+    """Ejecuta backups + rotación en un hilo dedicado (uno a la vez)."""
+
+    def __init__(self, directory: Path | str = BACKUP_DIR, keep: int = 7,
+                 pages: int = 256, sleep: float = 0.005) -> None:
+        self.directory = Path(directory)
+        self.keep = keep
+        self.pages = pages
+        self.sleep = sleep
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-backup")
+
+    def submit(self, progress: Progress | None = None) -> Future:
+        """Programa una copia; el `Future` devuelve la ruta creada."""
+        return self._executor.submit(self._run, progress)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, progress: Progress | None) -> Path:
+        path = backup(self.directory, pages=self.pages, sleep=self.sleep,
+                      progress=progress)
+        rotate(self.keep, self.directory)
+        return path
+
+
+# --------------------------------------------------------------------------- #
+# Restauración                                                                #
+# --------------------------------------------------------------------------- #
+def restore(src: Path | str, *, pages: int = -1) -> Path:
+    """
+    Sustituye el contenido de la base activa por el de `src`.
+    Cierra las conexiones del pool y vacía la caché de lectura.
+    """
+    src = Path(src)
+    if not src.exists():
+        raise FileNotFoundError(src)
+    check = sqlite3.connect(f"file:{src}?mode=ro", uri=True)
+    try:
+        result = check.execute("PRAGMA integrity_check").fetchone()[0]
+    finally:
+        check.close()
+    if result != "ok":
+        raise ValueError(f"La copia {src} está dañada: {result}")
+
+    dest = active_db_path()
+    storage.session_registry.remove()
+    storage.engine.dispose()
+    _copy(src, dest, pages, 0, None)
+    storage.identity_cache.clear()
+    return dest
+
+
+# --------------------------------------------------------------------------- #
+# CLI                                                                         #
+# --------------------------------------------------------------------------- #
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Backup en caliente de empleabilidad.db")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("backup", help="crear una copia")
+    b.add_argument("--dir", type=Path, default=BACKUP_DIR)
+    b.add_argument("--keep", type=int, default=7, help="copias a conservar")
+    b.add_argument("--pages", type=int, default=256, help="páginas por paso")
+    sub.add_parser("list", help="listar copias").add_argument(
+        "--dir", type=Path, default=BACKUP_DIR)
+    r = sub.add_parser("restore", help="restaurar una copia")
+    r.add_argument("file", type=Path)
+    args = ap.parse_args()
+
+    if args.cmd == "backup":
+        t0 = time.perf_counter()
+        path = backup(args.dir, pages=args.pages)
+        removed = rotate(args.keep, args.dir)
+        print(f"✔ {path} ({path.stat().st_size / 1024:.0f} KiB, "
+              f"{time.perf_counter() - t0:.2f} s); rotadas: {len(removed)}")
+    elif args.cmd == "list":
+        for path in list_backups(args.dir):
+            print(f"{path.name}  {path.stat().st_size / 1024:>8.0f} KiB")
+    else:
+        print(f"✔ Restaurada {args.file} → {restore(args.file)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+# employ_toolkit/core/batch.py
+"""
+Ejecución por lotes del Módulo 1 (sin consola)
+----------------------------------------------
+Lee las respuestas de N clientes desde CSV o JSONL y ejecuta para cada uno
+el mismo DAG que `cli.py` (intake → brand canvas, plan de contenidos,
+PPT de networking y análisis de demanda) en un `ProcessPoolExecutor`.
+
+Formato de entrada (una fila / línea por cliente; claves con punto):
+
+    intake.full_name, intake.email, intake.location, intake.disc_type
+    brand_canvas.<pregunta>          (propósito, objetivos, audiencia…)
+    content_plan.pilares / .formatos (listas; en CSV separadas por ";")
+    content_plan.freq / .semanas     (enteros)
+    demand_analysis.cargos           (lista)
+
+En JSONL también valen los objetos anidados: {"intake": {...}, ...}.
+
+Salida: un NDJSON con una línea por cliente en cuanto termina (no en el
+orden de entrada), con `status` "ok" | "partial" | "error", las rutas
+generadas y, por paso fallido, su mensaje en `errors`. Un paso que falla o
+supera `step_timeout` sólo omite a sus dependientes; el resto del cliente y
+del lote sigue. Los renders (BrandCanvas, PPT) corren en un proceso propio
+para poder matarlos si se cuelgan.
+
+El BrandCanvas se genera con ReportLab (`generate_brand_canvas`): el lote
+no depende de WeasyPrint ni de sus librerías nativas.
+"""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from sqlmodel import SQLModel
+
+from employ_toolkit.core import storage
+from employ_toolkit.core.workflow import WorkflowManager
+from employ_toolkit.modules import (
+    brand_canvas,
+    content_plan,
+    demand_analysis,
+    intake,
+    linkedin_networking,
+)
+
+LIST_FIELDS = {"content_plan.pilares", "content_plan.formatos", "demand_analysis.cargos"}
+INT_FIELDS = {"content_plan.freq", "content_plan.semanas"}
+PLAN_DEFAULTS = {"freq": 3, "formatos": ["Post"], "semanas": 4}
+
+
+# --------------------------------------------------------------------------- #
+# Lectura de la cohorte                                                       #
+# --------------------------------------------------------------------------- #
+def _nest(flat: dict) -> dict:
+    """{"intake.email": x} → {"intake": {"email": x}} (con listas y enteros)."""
+    record: dict[str, Any] = {}
+    for key, value in flat.items():
+        if key is None or value is None:
+            continue
+        if isinstance(value, dict):
+            for sub, v in _nest({f"{key}.{k}": v for k, v in value.items()}).items():
+                record.setdefault(sub, {}).update(v)
+            continue
+        if key in LIST_FIELDS and isinstance(value, str):
+            value = [v.strip() for v in value.split(";") if v.strip()]
+        elif key in INT_FIELDS and value != "":
+            value = int(value)
+        section, _, field = key.partition(".")
+        if field:
+            record.setdefault(section, {})[field] = value
+        else:
+            record[section] = value
+    return record
+
+
+def read_records(path: Path | str) -> Iterator[dict]:
+    """Registros anidados de un `.csv` o `.jsonl` (una línea por cliente)."""
+    path = Path(path)
+    with path.open(encoding="utf-8-sig", newline="") as fh:
+        if path.suffix.lower() == ".csv":
+            for row in csv.DictReader(fh):
+                yield _nest(row)
+            return
+        for number, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                yield _nest(json.loads(line))
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{number}: JSON inválido ({exc.msg})") from None
+
+
+# --------------------------------------------------------------------------- #
+# Pasos sin consola                                                           #
+# --------------------------------------------------------------------------- #
+def _brand_canvas_step(context: dict, answers: dict) -> dict:
+    return brand_canvas.generate_brand_canvas(context["intake"], answers)
+
+
+def _content_plan_step(context: dict, params: dict) -> dict:
+    return content_plan.generate_content_plan(context["intake"],
+                                              {**PLAN_DEFAULTS, **params})
+
+
+def build_workflow(record: dict, **wm_kwargs) -> WorkflowManager:
+    """El DAG de `cli.py` con las respuestas de `record` en vez de `input()`."""
+    wm = WorkflowManager(**wm_kwargs)
+    wm.add_step("intake", intake.intake_from_answers,
+                answers=record.get("intake", {}))
+    if record.get("brand_canvas"):
+        wm.add_step("brand_canvas", _brand_canvas_step, depends_on=["intake"],
+                    isolate=True, answers=record["brand_canvas"])
+    if record.get("content_plan", {}).get("pilares"):
+        wm.add_step("content_plan", _content_plan_step, depends_on=["intake"],
+                    params=record["content_plan"])
+    wm.add_step("linkedin_networking", linkedin_networking.networking_ppt,
+                depends_on=["intake"], isolate=True)
+    wm.add_step("demand_analysis", demand_analysis.demand_analysis_from_titles,
+                depends_on=["intake"],
+                cargos=record.get("demand_analysis", {}).get("cargos", []))
+    return wm
+
+
+# --------------------------------------------------------------------------- #
+# Trabajador (un proceso por núcleo)                                          #
+# --------------------------------------------------------------------------- #
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, SQLModel):
+        return value.model_dump()
+    return repr(value)
+
+
+def _init_worker(db_path: str | None) -> None:
+    # tras un fork las conexiones del padre no se tocan: pool nuevo
+    storage.engine.dispose(close=False)
+    if db_path and storage.engine.url.database != db_path:
+        storage.bind_engine(storage.make_engine(db_path))
+
+
+def run_client(index: int, record: dict, step_workers: int = 2,
+               step_timeout: float | None = None) -> dict:
+    """Ejecuta el pipeline de un cliente y devuelve su línea de log."""
+    who = record.get("intake", {}).get("email") or f"#{index}"
+    t0 = time.perf_counter()
+    line: dict[str, Any] = {"index": index, "client": who}
+    try:
+        wm = build_workflow(record, step_timeout=step_timeout)
+        results = wm.run(max_workers=step_workers, keep_going=True)
+    except Exception as exc:                   # DAG inválido, base caída…
+        line.update(status="error", errors={"*": f"{type(exc).__name__}: {exc}"})
+    else:
+        profile = results.pop("intake", None)
+        errors = {name: str(exc.__cause__ or exc) for name, exc in wm.errors.items()}
+        line.update(
+            status="error" if profile is None else ("partial" if errors else "ok"),
+            profile_id=getattr(profile, "id", None),
+            outputs=json.loads(json.dumps(results, default=_json_default)),
+            errors=errors,
+        )
+    line["seconds"] = round(time.perf_counter() - t0, 3)
+    return line
+
+
+# --------------------------------------------------------------------------- #
+# Lote                                                                        #
+# --------------------------------------------------------------------------- #
+@dataclass
+class BatchSummary:
+    total: int
+    ok: int
+    partial: int
+    failed: int
+    seconds: float
+    log_path: Path
+
+
+def run_batch(
+    source: Path | str,
+    log_path: Path | str,
+    *,
+    workers: int | None = None,
+    step_workers: int = 2,
+    step_timeout: float | None = None,
+    on_result: Callable[[dict], None] | None = None,
+) -> BatchSummary:
+    """
+    Procesa todos los clientes de `source` en `workers` procesos y escribe
+    cada resultado en `log_path` (NDJSON) en cuanto llega.
+    """
+    records = list(read_records(source))
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    db_path = storage.engine.url.database
+    counts = {"ok": 0, "partial": 0, "error": 0}
+    t0 = time.perf_counter()
+
+    with log_path.open("a", encoding="utf-8") as log, ProcessPoolExecutor(
+        max_workers=min(workers, max(1, len(records))),
+        initializer=_init_worker, initargs=(db_path,),
+    ) as pool:
+        futures = {pool.submit(run_client, i, rec, step_workers, step_timeout): i
+                   for i, rec in enumerate(records, 1)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                line = future.result()
+            except Exception as exc:           # el proceso murió (BrokenProcessPool…)
+                line = {"index": index, "client": f"#{index}", "status": "error",
+                        "errors": {"*": f"{type(exc).__name__}: {exc}"}}
+            counts[line["status"]] += 1
+            log.write(json.dumps(line, ensure_ascii=False, default=_json_default) + "\n")
+            log.flush()
+            if on_result is not None:
+                on_result(line)
+
+    return BatchSummary(len(records), counts["ok"], counts["partial"], counts["error"],
+                        round(time.perf_counter() - t0, 3), log_path)
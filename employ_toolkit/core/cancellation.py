@@ -0,0 +1,184 @@
+# employ_toolkit/core/cancellation.py
+"""
+Límites de tiempo y cancelación de pasos
+----------------------------------------
+• `CancellationToken` → se pasa al paso si su función acepta `cancel`.
+  El paso consulta `token.cancelled` (o llama a `token.check()`) entre
+  tareas largas y se retira limpio. Vence solo al pasar su plazo y se
+  puede cancelar a mano con `cancel()`. En otro proceso sólo viaja el
+  plazo: la cancelación manual no cruza procesos.
+• `guard(future, …)` → Future que falla con `StepTimeout` al vencer el
+  plazo aunque el hilo del paso siga colgado (el hilo queda abandonado).
+• `run_isolated(…)` → ejecuta el paso en un proceso propio; si vence el
+  plazo o se cancela, el proceso se mata. Es la única forma de cortar de
+  verdad un render bloqueado (WeasyPrint, LibreOffice…).
+"""
+
+import inspect
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+class Cancelled(Exception):
+    """El paso se canceló (a mano o por plazo) antes de terminar."""
+
+
+class StepTimeout(Cancelled):
+    """El paso superó su límite de tiempo."""
+
+    def __init__(self, step: str, timeout: float) -> None:
+        super().__init__(f"superó el límite de {timeout:g} s")
+        self.step = step
+        self.timeout = timeout
+
+    def __reduce__(self):
+        return StepTimeout, (self.step, self.timeout)
+
+
+class CancellationToken:
+    """Aviso cooperativo de cancelación con plazo opcional."""
+
+    def __init__(self, timeout: float | None = None) -> None:
+        # plazo en reloj de pared: es comparable entre procesos
+        self.deadline = None if timeout is None else time.time() + timeout
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or (
+            self.deadline is not None and time.time() >= self.deadline)
+
+    def remaining(self) -> float | None:
+        """Segundos hasta el plazo (None si no tiene)."""
+        return None if self.deadline is None else max(0.0, self.deadline - time.time())
+
+    def check(self) -> None:
+        """Lanza `Cancelled` si el paso debe dejar de trabajar."""
+        if self.cancelled:
+            raise Cancelled("paso cancelado")
+
+    def __getstate__(self) -> dict:
+        return {"deadline": self.deadline, "set": self._event.is_set()}
+
+    def __setstate__(self, state: dict) -> None:
+        self.deadline = state["deadline"]
+        self._event = threading.Event()
+        if state["set"]:
+            self._event.set()
+
+
+def accepts_cancel(func: Callable[..., Any]) -> bool:
+    """¿La función del paso declara el parámetro `cancel`?"""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return "cancel" in params
+
+
+# --------------------------------------------------------------------------- #
+# Plazo sobre un Future de hilo                                               #
+# --------------------------------------------------------------------------- #
+def guard(inner: Future, step: str, timeout: float | None,
+          token: CancellationToken) -> Future:
+    """Future que copia a `inner` o falla con `StepTimeout` al vencer."""
+    if timeout is None:
+        return inner
+    outer: Future = Future()
+    outer.set_running_or_notify_cancel()
+
+    def expire() -> None:
+        token.cancel()
+        if not outer.done():
+            outer.set_exception(StepTimeout(step, timeout))
+
+    timer = threading.Timer(timeout, expire)
+    timer.daemon = True
+
+    def relay(done: Future) -> None:
+        timer.cancel()
+        if outer.done():
+            return
+        exc = done.exception()
+        if exc is not None:
+            outer.set_exception(exc)
+        else:
+            outer.set_result(done.result())
+
+    timer.start()
+    inner.add_done_callback(relay)
+    return outer
+
+
+# --------------------------------------------------------------------------- #
+# Paso en un proceso propio                                                   #
+# --------------------------------------------------------------------------- #
+def _isolated_entry(conn, call: Callable[..., Any], args: tuple) -> None:
+    # las conexiones SQLite heredadas del padre no se usan tras el fork
+    from employ_toolkit.core import storage
+    storage.engine.dispose(close=False)
+    try:
+        conn.send((True, call(*args)))
+    except BaseException as exc:
+        try:
+            conn.send((False, exc))
+        except Exception:              # excepción no serializable
+            conn.send((False, RuntimeError(f"{type(exc).__name__}: {exc}")))
+    finally:
+        conn.close()
+
+
+def run_isolated(step: str, call: Callable[..., Any], args: tuple,
+                 timeout: float | None, token: CancellationToken,
+                 poll: float = 0.05) -> Future:
+    """
+    Ejecuta `call(*args)` en un proceso nuevo y devuelve un Future. Al vencer
+    `timeout` o cancelarse `token`, el proceso se mata.
+    """
+    ctx = multiprocessing.get_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_isolated_entry, args=(sender, call, args),
+                       name=f"step-{step}", daemon=True)
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+    proc.start()
+    sender.close()
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def kill(exc: BaseException) -> None:
+        proc.kill()
+        proc.join()
+        future.set_exception(exc)
+
+    def watch() -> None:
+        try:
+            while True:
+                if receiver.poll(poll):
+                    try:
+                        ok, payload = receiver.recv()
+                    except EOFError:           # murió sin responder
+                        proc.join()
+                        future.set_exception(RuntimeError(
+                            f"el proceso del paso terminó con código {proc.exitcode}"))
+                        return
+                    proc.join()
+                    if ok:
+                        future.set_result(payload)
+                    else:
+                        future.set_exception(payload)
+                    return
+                if deadline is not None and time.monotonic() >= deadline:
+                    return kill(StepTimeout(step, timeout))
+                if token.cancelled:
+                    return kill(Cancelled("paso cancelado"))
+        finally:
+            receiver.close()
+
+    threading.Thread(target=watch, name=f"watch-{step}", daemon=True).start()
+    return future
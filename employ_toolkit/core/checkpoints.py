@@ -0,0 +1,138 @@
+# employ_toolkit/core/checkpoints.py
+"""
+Checkpoints de ejecuciones del WorkflowManager
+----------------------------------------------
+Tras cada paso terminado se guarda su resultado en `WorkflowCheckpoint`
+(JSON). Si la ejecución muere, `WorkflowManager.resume(run_id)` recarga el
+contexto y sólo ejecuta los pasos que faltan.
+
+Serialización:
+• `Path`                    → {"__path__": "..."}
+• modelos SQLModel con id   → {"__model__": "CandidateProfile", "id": 3}
+                              (se vuelven a leer de la base al reanudar)
+• modelos sin id            → {"__model_data__": "...", "fields": {...}}
+• dict / list / tuple / fechas, recursivamente
+• cualquier otra cosa       → pickle en base64 (último recurso)
+"""
+
+import base64
+import json
+import pickle
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, select
+
+from employ_toolkit.core import models
+from employ_toolkit.core.models import WorkflowCheckpoint, WorkflowRun
+from employ_toolkit.core.storage import SessionFactory, unit_of_work
+
+
+# --------------------------------------------------------------------------- #
+# Serialización                                                               #
+# --------------------------------------------------------------------------- #
+def encode(value: Any) -> Any:
+    """Convierte un resultado de paso en algo serializable como JSON."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Path):
+        return {"__path__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, SQLModel):
+        name = type(value).__name__
+        ident = getattr(value, "id", None)
+        if getattr(models, name, None) is type(value) and ident is not None:
+            return {"__model__": name, "id": ident}
+        if getattr(models, name, None) is type(value):
+            return {"__model_data__": name, "fields": encode(value.model_dump())}
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {k: encode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [encode(v) for v in value]}
+    return {"__pickle__": base64.b64encode(pickle.dumps(value)).decode()}
+
+
+def decode(data: Any, session: Session) -> Any:
+    """Inverso de `encode`; los modelos se leen con `session`."""
+    if isinstance(data, list):
+        return [decode(v, session) for v in data]
+    if not isinstance(data, dict):
+        return data
+    if "__path__" in data:
+        return Path(data["__path__"])
+    if "__datetime__" in data:
+        return datetime.fromisoformat(data["__datetime__"])
+    if "__date__" in data:
+        return date.fromisoformat(data["__date__"])
+    if "__model__" in data:
+        return session.get(getattr(models, data["__model__"]), data["id"])
+    if "__model_data__" in data:
+        return getattr(models, data["__model_data__"])(**decode(data["fields"], session))
+    if "__tuple__" in data:
+        return tuple(decode(v, session) for v in data["__tuple__"])
+    if "__pickle__" in data:
+        return pickle.loads(base64.b64decode(data["__pickle__"]))
+    return {k: decode(v, session) for k, v in data.items()}
+
+
+# --------------------------------------------------------------------------- #
+# Persistencia                                                                #
+# --------------------------------------------------------------------------- #
+def start_run(run_id: str | None = None) -> str:
+    """Registra una ejecución nueva (o reabre una existente) y devuelve su id."""
+    run_id = run_id or uuid.uuid4().hex[:12]
+    with unit_of_work() as s:
+        run = s.get(WorkflowRun, run_id)
+        if run is None:
+            s.add(WorkflowRun(run_id=run_id))
+        else:
+            run.status, run.finished_at, run.error = "running", None, None
+    return run_id
+
+
+def save(run_id: str, step: str, value: Any) -> None:
+    """Guarda (o reemplaza) el resultado de `step`."""
+    payload = json.dumps(encode(value), ensure_ascii=False)
+    with unit_of_work() as s:
+        row = s.exec(select(WorkflowCheckpoint).where(
+            WorkflowCheckpoint.run_id == run_id, WorkflowCheckpoint.step == step)).first()
+        if row is None:
+            position = s.exec(select(func.count()).where(
+                WorkflowCheckpoint.run_id == run_id)).one()
+            s.add(WorkflowCheckpoint(run_id=run_id, step=step, position=position,
+                                     payload=payload))
+        else:
+            row.payload, row.created_at = payload, datetime.utcnow()
+
+
+def load(run_id: str) -> dict[str, Any]:
+    """Contexto reconstruido de una ejecución, en el orden en que terminó."""
+    with SessionFactory() as s:
+        if s.get(WorkflowRun, run_id) is None:
+            raise LookupError(f"No existe la ejecución {run_id!r}")
+        rows = s.exec(select(WorkflowCheckpoint)
+                      .where(WorkflowCheckpoint.run_id == run_id)
+                      .order_by(WorkflowCheckpoint.position)).all()
+        return {row.step: decode(json.loads(row.payload), s) for row in rows}
+
+
+def finish(run_id: str, error: BaseException | None = None) -> None:
+    with unit_of_work() as s:
+        run = s.get(WorkflowRun, run_id)
+        run.status = "failed" if error is not None else "done"
+        run.error = None if error is None else f"{type(error).__name__}: {error}"
+        run.finished_at = datetime.utcnow()
+
+
+def recent_runs(limit: int = 10) -> list[WorkflowRun]:
+    with SessionFactory() as s:
+        return list(s.exec(select(WorkflowRun)
+                           .order_by(WorkflowRun.started_at.desc()).limit(limit)).all())
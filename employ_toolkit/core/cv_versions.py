@@ -0,0 +1,233 @@
+# employ_toolkit/core/cv_versions.py
+"""
+Historial comprimido del CV estructurado
+----------------------------------------
+Cada guardado del formulario de CV crea una `CVVersion`:
+
+• la versión 1 (y una de cada `KEYFRAME_EVERY`) se guarda completa;
+• el resto, como delta estructural respecto a la anterior;
+• todo payload va en JSON compacto comprimido con zlib.
+
+Reconstruir una versión lee el keyframe más cercano y, como mucho,
+`KEYFRAME_EVERY - 1` deltas en una sola consulta. Los textos multilínea
+(experiencia, educación…) se guardan como ediciones por líneas, así que
+retocar un puesto no vuelve a guardar el bloque entero.
+
+`CVData` sigue guardando la última versión en claro (la usa la búsqueda).
+
+API:
+    save_version(client_id, data)         → CVVersion (o la última si no cambió)
+    load_version(client_id, version=None) → dict
+    history(client_id)                    → [VersionInfo]
+    diff(old, new) / diff_versions(client_id, a, b) → [Change]
+"""
+
+import difflib
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterator
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from employ_toolkit.core.models import CVData, CVVersion
+from employ_toolkit.core.storage import SessionFactory, unit_of_work
+
+KEYFRAME_EVERY = 16
+_MISSING = object()
+
+
+# --------------------------------------------------------------------------- #
+# Diff estructural                                                            #
+# --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class Change:
+    op: str            # add | remove | change
+    path: tuple        # claves de dict / índices de lista
+    old: Any = None
+    new: Any = None
+
+
+def _walk(old: Any, new: Any, path: tuple) -> Iterator[Change]:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            a, b = old.get(key, _MISSING), new.get(key, _MISSING)
+            if a is _MISSING:
+                yield Change("add", path + (key,), None, b)
+            elif b is _MISSING:
+                yield Change("remove", path + (key,), a, None)
+            else:
+                yield from _walk(a, b, path + (key,))
+    elif isinstance(old, list) and isinstance(new, list):
+        for i in range(min(len(old), len(new))):
+            yield from _walk(old[i], new[i], path + (i,))
+        for i in range(len(old), len(new)):
+            yield Change("add", path + (i,), None, new[i])
+        for i in reversed(range(len(new), len(old))):
+            yield Change("remove", path + (i,), old[i], None)
+    elif old != new or type(old) is not type(new):
+        yield Change("change", path, old, new)
+
+
+def diff(old: dict, new: dict) -> list[Change]:
+    """Cambios para pasar de `old` a `new`, ordenados por ruta."""
+    return sorted(_walk(old, new, ()), key=lambda c: [str(p) for p in c.path])
+
+
+# --------------------------------------------------------------------------- #
+# Codificación de deltas                                                      #
+# --------------------------------------------------------------------------- #
+def _text_edits(old: str, new: str) -> list:
+    a, b = old.splitlines(keepends=True), new.splitlines(keepends=True)
+    ops = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    return [[i1, i2, b[j1:j2]] for tag, i1, i2, j1, j2 in ops if tag != "equal"]
+
+
+def _encode(changes: list[Change]) -> list:
+    ops = []
+    for c in changes:
+        if c.op == "remove":
+            ops.append(["del", list(c.path)])
+        elif c.op == "change" and isinstance(c.old, str) and isinstance(c.new, str) \
+                and "\n" in c.old:
+            ops.append(["txt", list(c.path), _text_edits(c.old, c.new)])
+        else:
+            ops.append(["set", list(c.path), c.new])
+    return ops
+
+
+def _apply(doc: Any, ops: list) -> Any:
+    for op, path, *arg in ops:
+        if not path:                       # cambio de la raíz
+            doc = arg[0]
+            continue
+        parent = doc
+        for key in path[:-1]:
+            parent = parent[key]
+        last = path[-1]
+        if op == "del":
+            del parent[last]
+        elif op == "set":
+            if isinstance(parent, list) and last == len(parent):
+                parent.append(arg[0])
+            else:
+                parent[last] = arg[0]
+        else:                              # txt
+            lines = parent[last].splitlines(keepends=True)
+            for i1, i2, repl in reversed(arg[0]):
+                lines[i1:i2] = repl
+            parent[last] = "".join(lines)
+    return doc
+
+
+def _pack(obj: Any) -> bytes:
+    raw = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(raw.encode("utf-8"), 9)
+
+
+def _unpack(payload: bytes) -> Any:
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+# --------------------------------------------------------------------------- #
+# Persistencia                                                                #
+# --------------------------------------------------------------------------- #
+def _latest_number(s: Session, client_id: int) -> int:
+    stmt = select(func.max(CVVersion.version)).where(CVVersion.client_id == client_id)
+    return s.exec(stmt).one() or 0
+
+
+def _reconstruct(s: Session, client_id: int, version: int) -> dict:
+    keyframe = s.exec(
+        select(func.max(CVVersion.version)).where(
+            CVVersion.client_id == client_id,
+            CVVersion.version <= version,
+            CVVersion.kind == "full",
+        )
+    ).one()
+    if keyframe is None:
+        raise LookupError(f"El cliente {client_id} no tiene la versión {version} del CV")
+    rows = s.exec(
+        select(CVVersion.kind, CVVersion.payload)
+        .where(CVVersion.client_id == client_id,
+               CVVersion.version.between(keyframe, version))
+        .order_by(CVVersion.version)
+    ).all()
+    doc = None
+    for kind, payload in rows:
+        doc = _unpack(payload) if kind == "full" else _apply(doc, _unpack(payload))
+    return doc
+
+
+def save_version(client_id: int, data: dict, *, docx_path: str = "",
+                 pdf_path: str = "") -> CVVersion:
+    """
+    Guarda `data` como nueva versión del CV del cliente. Si no cambió nada
+    respecto a la última, la devuelve sin crear otra.
+    """
+    with unit_of_work() as s:
+        last = _latest_number(s, client_id)
+        number = last + 1
+        full = _pack(data)
+        kind, payload = "full", full
+        if last:
+            previous = _reconstruct(s, client_id, last)
+            changes = list(_walk(previous, data, ()))   # orden aplicable, no el de diff()
+            if not changes:
+                return s.exec(select(CVVersion).where(
+                    CVVersion.client_id == client_id, CVVersion.version == last)).one()
+            delta = _pack(_encode(changes))
+            if (number - 1) % KEYFRAME_EVERY and len(delta) < len(full):
+                kind, payload = "delta", delta
+
+        row = CVVersion(client_id=client_id, version=number, kind=kind, payload=payload)
+        s.add(row)
+
+        # Última versión en claro para la búsqueda de texto completo
+        snapshot = s.exec(select(CVData).where(CVData.client_id == client_id)).first()
+        if snapshot is None:
+            snapshot = CVData(client_id=client_id, updated_at=date.today(), json_blob="",
+                              pdf_path=pdf_path, docx_path=docx_path)
+            s.add(snapshot)
+        snapshot.updated_at = date.today()
+        snapshot.json_blob = json.dumps(data, ensure_ascii=False)
+        snapshot.docx_path = docx_path or snapshot.docx_path
+        snapshot.pdf_path = pdf_path or snapshot.pdf_path
+    return row
+
+
+def load_version(client_id: int, version: int | None = None) -> dict | None:
+    """CV de la versión pedida (por defecto la última); None si no hay."""
+    with SessionFactory() as s:
+        version = version or _latest_number(s, client_id)
+        if not version:
+            return None
+        return _reconstruct(s, client_id, version)
+
+
+@dataclass(frozen=True)
+class VersionInfo:
+    version: int
+    kind: str
+    size: int               # bytes comprimidos
+    created_at: datetime
+
+
+def history(client_id: int) -> list[VersionInfo]:
+    """Versiones del cliente, de la más antigua a la más reciente."""
+    with SessionFactory() as s:
+        rows = s.exec(
+            select(CVVersion.version, CVVersion.kind,
+                   func.length(CVVersion.payload), CVVersion.created_at)
+            .where(CVVersion.client_id == client_id)
+            .order_by(CVVersion.version)
+        ).all()
+    return [VersionInfo(*row) for row in rows]
+
+
+def diff_versions(client_id: int, a: int, b: int) -> list[Change]:
+    """Cambios estructurales entre dos versiones del CV."""
+    with SessionFactory() as s:
+        return diff(_reconstruct(s, client_id, a), _reconstruct(s, client_id, b))
@@ -0,0 +1,289 @@
+# employ_toolkit/core/doc_backends.py
+"""
+Backends de `core.docspec`: PDF (ReportLab), DOCX (python-docx) y PPTX
+(python-pptx). Escriben en un stream binario (ver `docspec.render_bytes`).
+Cada uno importa su librería al primer uso, así que un proceso que sólo
+genera PDF no carga python-pptx.
+
+Correspondencias que no son obvias:
+• DOCX  → `Chart` se escribe como tabla etiqueta | valor (python-docx no
+          tiene gráficos nativos).
+• PPTX  → `Heading(0)` abre la portada y los párrafos siguientes van de
+          subtítulo; `Heading(1|2)` abre diapositiva; `Table` y `Chart`
+          van en una diapositiva propia con el último título.
+"""
+
+import html
+import re
+from functools import lru_cache
+from typing import BinaryIO
+
+from employ_toolkit.core import pdf_styles
+from employ_toolkit.core.docspec import (
+    Bullets, Chart, DocSpec, Heading, PageBreak, Paragraph, Spacer, Table,
+    register_backend,
+)
+
+_TAG = re.compile(r"<br\s*/?>|</?[bi]>|<[^>]*>", re.IGNORECASE)
+
+
+def _lines(text: str, markup: bool = True) -> list[list[tuple[str, bool, bool]]]:
+    """Mini-marcado → líneas de fragmentos `(texto, negrita, cursiva)`."""
+    if not markup:
+        return [[(line, False, False)] for line in text.split("\n")]
+    lines: list[list[tuple[str, bool, bool]]] = [[]]
+    bold = italic = False
+    pos = 0
+    for match in [*_TAG.finditer(text), None]:
+        end = match.start() if match else len(text)
+        for i, chunk in enumerate(html.unescape(text[pos:end]).split("\n")):
+            if i:
+                lines.append([])
+            if chunk:
+                lines[-1].append((chunk, bold, italic))
+        if match is None:
+            break
+        tag = match.group().lower().replace(" ", "")
+        if tag.startswith("<br"):
+            lines.append([])
+        elif tag in ("<b>", "</b>"):
+            bold = tag == "<b>"
+        elif tag in ("<i>", "</i>"):
+            italic = tag == "<i>"
+        pos = match.end()
+    return lines
+
+
+def _plain(text: str, markup: bool = True) -> str:
+    return "\n".join("".join(t for t, _, _ in line) for line in _lines(text, markup))
+
+
+# --------------------------------------------------------------------------- #
+# PDF                                                                         #
+# --------------------------------------------------------------------------- #
+_PDF_HEADINGS = {0: "Title", 1: "Heading1", 2: "Heading2"}
+
+
+@lru_cache(maxsize=None)
+def _plain_table_style(commands: tuple):
+    from reportlab.platypus import TableStyle
+    return TableStyle(list(commands))
+
+
+def _pdf_table_style(t: Table):
+    from reportlab.lib import colors
+
+    extra = []
+    if t.align:
+        extra.append(("ALIGN", (0, 0), (-1, -1), t.align))
+    if t.valign:
+        extra.append(("VALIGN", (0, 0), (-1, -1), t.valign))
+    if t.padding:
+        extra += [("LEFTPADDING", (0, 0), (-1, -1), t.padding[0]),
+                  ("TOPPADDING", (0, 0), (-1, -1), t.padding[1])]
+    if t.header and t.grid is not None:
+        return pdf_styles.header_table_style(*extra, header=t.header_color, grid=t.grid,
+                                             grid_color=colors.toColor(t.grid_color))
+    if t.grid is not None:
+        extra.insert(0, ("GRID", (0, 0), (-1, -1), t.grid, colors.toColor(t.grid_color)))
+    return _plain_table_style(tuple(extra))
+
+
+def _pdf_chart(c: Chart):
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib import colors
+
+    drawing = Drawing(460, 240)
+    chart = VerticalBarChart()
+    chart.x, chart.y, chart.width, chart.height = 40, 30, 400, 190
+    chart.data = [list(c.values)]
+    chart.categoryAxis.categoryNames = list(c.labels)
+    chart.valueAxis.valueMin = 0
+    chart.bars[0].fillColor = colors.HexColor(pdf_styles.HEADER_BLUE)
+    drawing.add(chart)
+    return drawing
+
+
+@register_backend("pdf")
+def render_pdf(spec: DocSpec, out: BinaryIO) -> None:
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab import platypus as rl
+
+    st = pdf_styles.stylesheet()
+    story = []
+    for block in spec.blocks:
+        if isinstance(block, Heading):
+            story.append(rl.Paragraph(block.text, st[_PDF_HEADINGS.get(block.level, "Heading3")]))
+        elif isinstance(block, Paragraph):
+            text = block.text if block.markup else \
+                html.escape(block.text, quote=False).replace("\n", "<br/>")
+            story.append(rl.Paragraph(text, st[block.style]))
+        elif isinstance(block, Bullets):
+            indent = {} if block.indent is None else {"leftIndent": block.indent}
+            story.append(rl.ListFlowable(
+                [rl.ListItem(rl.Paragraph(item, st[block.style]), **indent)
+                 for item in block.items],
+                bulletType="bullet"))
+        elif isinstance(block, Table):
+            table = rl.Table([list(r) for r in block.rows], colWidths=block.col_widths)
+            table.setStyle(_pdf_table_style(block))
+            story.append(table)
+        elif isinstance(block, Chart):
+            if block.title:
+                story.append(rl.Paragraph(block.title, st["Heading3"]))
+            story.append(_pdf_chart(block))
+        elif isinstance(block, Spacer):
+            story.append(rl.Spacer(1, block.height))
+        elif isinstance(block, PageBreak):
+            story.append(rl.PageBreak())
+    meta = {"title": spec.title} if spec.title else {}
+    rl.SimpleDocTemplate(out, pagesize=LETTER, **meta).build(story)
+
+
+# --------------------------------------------------------------------------- #
+# DOCX                                                                        #
+# --------------------------------------------------------------------------- #
+def _docx_runs(paragraph, text: str, markup: bool = True, italic: bool = False) -> None:
+    for i, line in enumerate(_lines(text, markup)):
+        if i:
+            paragraph.add_run().add_break()
+        for chunk, b, it in line:
+            run = paragraph.add_run(chunk)
+            run.bold = b or None
+            run.italic = (it or italic) or None
+
+
+def _docx_table(doc, rows, header: bool, grid: bool) -> None:
+    width = max(len(r) for r in rows)
+    table = doc.add_table(rows=len(rows), cols=width)
+    if grid:
+        table.style = "Table Grid"
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            cell = table.cell(r, c)
+            cell.text = ""
+            _docx_runs(cell.paragraphs[0], str(value))
+            if header and r == 0:
+                for run in cell.paragraphs[0].runs:
+                    run.bold = True
+
+
+@register_backend("docx")
+def render_docx(spec: DocSpec, out: BinaryIO) -> None:
+    from docx import Document
+
+    doc = Document()
+    if spec.title:
+        doc.core_properties.title = spec.title
+    for block in spec.blocks:
+        if isinstance(block, Heading):
+            doc.add_heading(_plain(block.text), level=min(block.level, 9))
+        elif isinstance(block, Paragraph):
+            _docx_runs(doc.add_paragraph(), block.text, block.markup,
+                       italic=block.style == "Italic")
+        elif isinstance(block, Bullets):
+            for item in block.items:
+                _docx_runs(doc.add_paragraph(style="List Bullet"), item)
+        elif isinstance(block, Table):
+            _docx_table(doc, block.rows, block.header, block.grid is not None)
+        elif isinstance(block, Chart):
+            if block.title:
+                doc.add_heading(block.title, level=3)
+            _docx_table(doc, [["", block.series],
+                              *[[l, f"{v:g}"] for l, v in zip(block.labels, block.values)]],
+                        header=True, grid=True)
+        elif isinstance(block, PageBreak):
+            doc.add_page_break()
+    doc.save(out)
+
+
+# --------------------------------------------------------------------------- #
+# PPTX                                                                        #
+# --------------------------------------------------------------------------- #
+class _Deck:
+    """Estado del armado de diapositivas."""
+
+    def __init__(self) -> None:
+        from pptx import Presentation
+        self.prs = Presentation()
+        self.title = ""
+        self.body = None            # text_frame donde van los párrafos
+        self.fresh = False          # el primer párrafo del frame está vacío
+
+    def slide(self, layout: int):
+        slide = self.prs.slides.add_slide(self.prs.slide_layouts[layout])
+        slide.shapes.title.text = self.title
+        return slide
+
+    def paragraph(self):
+        if self.body is None:
+            self.body = self.slide(1).placeholders[1].text_frame
+            self.body.clear()
+            self.fresh = True
+        if self.fresh:
+            self.fresh = False
+            return self.body.paragraphs[0]
+        return self.body.add_paragraph()
+
+    def text(self, text: str, markup: bool = True, *, bold: bool = False,
+             size: float | None = None) -> None:
+        from pptx.util import Pt
+        for line in _lines(text, markup):
+            p = self.paragraph()
+            for chunk, b, it in line:
+                run = p.add_run()
+                run.text = chunk
+                run.font.bold = (b or bold) or None
+                run.font.italic = it or None
+                if size:
+                    run.font.size = Pt(size)
+
+
+@register_backend("pptx")
+def render_pptx(spec: DocSpec, out: BinaryIO) -> None:
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches, Pt
+
+    deck = _Deck()
+    for block in spec.blocks:
+        if isinstance(block, Heading) and block.level == 0:
+            deck.title = _plain(block.text)
+            deck.body = deck.slide(0).placeholders[1].text_frame
+            deck.fresh = True
+        elif isinstance(block, Heading) and block.level <= 2:
+            deck.title, deck.body = _plain(block.text), None
+        elif isinstance(block, Heading):
+            deck.text(block.text, bold=True)
+        elif isinstance(block, Paragraph):
+            deck.text(block.text, block.markup)
+        elif isinstance(block, Bullets):
+            for item in block.items:
+                deck.text(item, size=14)
+        elif isinstance(block, Table):
+            slide = deck.slide(5)
+            cols = max(len(r) for r in block.rows)
+            shape = slide.shapes.add_table(len(block.rows), cols, Inches(0.5), Inches(1.6),
+                                           Inches(9), Inches(0.4) * len(block.rows))
+            for r, row in enumerate(block.rows):
+                for c, value in enumerate(row):
+                    shape.table.cell(r, c).text = _plain(str(value))
+            deck.body = None
+        elif isinstance(block, Chart):
+            slide = deck.slide(5)
+            if block.title:
+                slide.shapes.title.text = block.title
+            data = CategoryChartData()
+            data.categories = list(block.labels)
+            data.add_series(block.series, list(block.values))
+            chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1),
+                                           Inches(2), Inches(8), Inches(4), data).chart
+            chart.category_axis.tick_labels.font.size = Pt(12)
+            chart.value_axis.tick_labels.font.size = Pt(12)
+            chart.value_axis.has_major_gridlines = False
+            deck.body = None
+        elif isinstance(block, PageBreak):
+            deck.body = None
+    deck.prs.save(out)
+
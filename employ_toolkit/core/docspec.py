@@ -0,0 +1,164 @@
+# employ_toolkit/core/docspec.py
+"""
+Especificación declarativa de documentos
+----------------------------------------
+Los generadores describen QUÉ contiene el entregable con bloques simples y
+`render()` lo escribe en el formato que pida la extensión del archivo:
+
+    spec = DocSpec([
+        Heading(f"Plan de Networking – {client.full_name}", 0),
+        Paragraph(f"Fecha: {date.today()}"),
+        Spacer(12),
+        Table.key_value([("Meta", "10"), ("Tiempo", "30")]),
+        Bullets(["Buscar contactos", "Personalizar mensaje"]),
+        Chart(["Junior", "Senior"], [30, 50], title="Salarios"),
+    ])
+    render(spec, output_path(OUTPUT_DIR, client, "networking", "pdf"))
+
+Backends (ver `core.doc_backends`): `.pdf` (ReportLab), `.docx`
+(python-docx) y `.pptx` (python-pptx); se registran con
+`@register_backend("ext")`. Cada uno importa su librería al usarse.
+
+Memoria: `render_bytes(spec, "pdf")` devuelve un `BytesIO`; `render()` a
+una ruta renderiza en memoria y publica con `core.publish` (atómico).
+`emit()` junta ambos modos para los `generate_*(…, in_memory=False)`.
+
+Texto: `Paragraph.text` admite el mini-marcado de ReportLab (<b>, <i>,
+<br/>); con `markup=False` se toma literal y los saltos de línea se
+respetan en todos los formatos.
+"""
+
+import uuid
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Sequence
+
+from employ_toolkit.core.pdf_styles import HEADER_BLUE
+from employ_toolkit.core.publish import publish
+
+
+# --------------------------------------------------------------------------- #
+# Bloques                                                                     #
+# --------------------------------------------------------------------------- #
+@dataclass
+class Heading:
+    text: str
+    level: int = 1          # 0 = título del documento
+
+
+@dataclass
+class Paragraph:
+    text: str
+    style: str = "Normal"   # Normal | BodyText | Italic
+    markup: bool = True
+
+
+@dataclass
+class Bullets:
+    items: Sequence[str]
+    style: str = "Normal"
+    indent: float | None = None
+
+
+@dataclass
+class Table:
+    rows: Sequence[Sequence[str]]
+    col_widths: Sequence[float] | None = None
+    header: bool = True                  # primera fila con fondo azul
+    header_color: str = HEADER_BLUE
+    grid: float | None = 0.4             # None = sin rejilla
+    grid_color: str = "grey"
+    align: str | None = None             # LEFT | CENTER | RIGHT
+    valign: str | None = None            # TOP | MIDDLE | BOTTOM
+    padding: tuple[float, float] | None = None   # (izquierda, arriba)
+
+    @classmethod
+    def key_value(cls, pairs: Sequence[tuple[str, str]], **look) -> "Table":
+        """Tabla de dos columnas `clave | valor`."""
+        return cls([list(pair) for pair in pairs], **look)
+
+
+@dataclass
+class Chart:
+    labels: Sequence[str]
+    values: Sequence[float]
+    title: str = ""
+    series: str = "Serie 1"
+    kind: str = "bar"
+
+
+@dataclass
+class Spacer:
+    height: float = 12
+
+
+@dataclass
+class PageBreak:
+    pass
+
+
+Block = Heading | Paragraph | Bullets | Table | Chart | Spacer | PageBreak
+
+
+@dataclass
+class DocSpec:
+    blocks: list[Block] = field(default_factory=list)
+    title: str = ""                 # metadatos del archivo
+
+    def add(self, *blocks: Block) -> "DocSpec":
+        self.blocks.extend(blocks)
+        return self
+
+
+# --------------------------------------------------------------------------- #
+# Rutas y despacho                                                            #
+# --------------------------------------------------------------------------- #
+def output_path(directory: Path, client, tag: str, ext: str) -> Path:
+    """`<dir>/<nombre>_<id6>_<tag>.<ext>`, el patrón de todos los entregables."""
+    return Path(directory) / f"{client.full_name}_{uuid.uuid4().hex[:6]}_{tag}.{ext}"
+
+
+BACKENDS: dict[str, Callable[[DocSpec, BytesIO], None]] = {}
+
+
+def register_backend(ext: str) -> Callable:
+    """Decorador: backend para archivos `.<ext>`."""
+    def mark(func: Callable[[DocSpec, BytesIO], None]) -> Callable:
+        BACKENDS[ext.lower().lstrip(".")] = func
+        return func
+    return mark
+
+
+def render_bytes(spec: DocSpec, fmt: str) -> BytesIO:
+    """Renderiza `spec` en memoria (`fmt` = "pdf", "docx" o "pptx")."""
+    from employ_toolkit.core import doc_backends  # noqa: F401  (registra backends)
+
+    backend = BACKENDS.get(fmt.lower().lstrip("."))
+    if backend is None:
+        raise ValueError(f"Formato no soportado: {fmt!r} "
+                         f"(disponibles: {', '.join(sorted(BACKENDS))})")
+    buffer = BytesIO()
+    backend(spec, buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def render(spec: DocSpec, *paths: Path | str) -> list[Path]:
+    """
+    Escribe `spec` en cada ruta según su extensión y devuelve las rutas.
+    Si el render falla no queda ningún archivo a medias.
+    """
+    paths = [Path(p) for p in paths]
+    buffers = [render_bytes(spec, p.suffix) for p in paths]   # todo o nada
+    return [publish(buffer, path) for buffer, path in zip(buffers, paths)]
+
+
+def emit(spec: DocSpec, directory: Path, client, tag: str, ext: str,
+         in_memory: bool = False) -> Path | BytesIO:
+    """Salida de un generador: `BytesIO` o archivo nuevo en `directory`."""
+    if in_memory:
+        return render_bytes(spec, ext)
+    path = output_path(directory, client, tag, ext)
+    render(spec, path)
+    return path
@@ -0,0 +1,229 @@
+# employ_toolkit/core/instrumentation.py
+"""
+Instrumentación de sentencias SQL
+---------------------------------
+Se activa con variables de entorno; apagada no registra ningún listener, así
+que no cuesta nada:
+
+    EMPLEABILIDAD_SQL_TRACE=1         activa la instrumentación
+    EMPLEABILIDAD_SQL_SLOW_MS=50      umbral del log de consultas lentas
+    EMPLEABILIDAD_SQL_N_PLUS_ONE=10   repeticiones de una misma sentencia en
+                                      una transacción que cuentan como N+1
+    EMPLEABILIDAD_SQL_LOG=ruta        archivo del log (por defecto sql_trace.log
+                                      junto a la base)
+
+• Histograma de latencia por sentencia (`stats()`, `report()`).
+• Consultas lentas → logger `employ_toolkit.sql`, con el módulo:línea que
+  las lanzó (el primer frame fuera de SQLAlchemy/SQLModel y de
+  `core.storage` / `core.registry`).
+• N+1: la misma sentencia ejecutada muchas veces dentro de una transacción
+  (contador en `conn.info`, reiniciado en commit/rollback/checkin).
+"""
+
+import atexit
+import bisect
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+log = logging.getLogger("employ_toolkit.sql")
+
+LOG_PATH = Path(__file__).parent.parent / "sql_trace.log"
+
+# Límites superiores de cada cubeta (ms); la última recoge el resto
+BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+# además del ORM, las capas de acceso propias (sesiones, caché, buffer de
+# documentos): interesa quién las llamó
+_SKIP_PREFIXES = ("sqlalchemy", "sqlmodel", __name__, "contextlib",
+                  "employ_toolkit.core.storage", "employ_toolkit.core.registry")
+
+
+# --------------------------------------------------------------------------- #
+# Estadísticas                                                                #
+# --------------------------------------------------------------------------- #
+@dataclass
+class StatementStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Cota superior (ms) de la cubeta que contiene el percentil `q`."""
+        target, seen = q * self.count, 0
+        for bound, n in zip(BUCKETS_MS + (float("inf"),), self.buckets):
+            seen += n
+            if seen >= target:
+                return bound if bound != float("inf") else self.max_ms
+        return self.max_ms
+
+
+@dataclass
+class _Config:
+    slow_ms: float = 50.0
+    n_plus_one: int = 10
+
+
+_config = _Config()
+_stats: dict[str, StatementStats] = {}
+_lock = threading.Lock()
+_enabled = False
+_handler: logging.Handler | None = None
+
+
+def stats() -> dict[str, StatementStats]:
+    """Copia de las estadísticas por sentencia."""
+    with _lock:
+        return {sql: StatementStats(s.count, s.total_ms, s.max_ms, list(s.buckets))
+                for sql, s in _stats.items()}
+
+
+def reset() -> None:
+    with _lock:
+        _stats.clear()
+
+
+def report(top: int = 20) -> str:
+    """Tabla de las sentencias con más tiempo acumulado."""
+    rows = sorted(stats().items(), key=lambda kv: kv[1].total_ms, reverse=True)[:top]
+    lines = [f"{'n':>7} {'total ms':>10} {'media':>8} {'p95≤':>7} {'máx':>8}  sentencia"]
+    for sql, s in rows:
+        lines.append(f"{s.count:>7} {s.total_ms:>10.1f} {s.mean_ms:>8.2f} "
+                     f"{s.percentile(0.95):>7g} {s.max_ms:>8.1f}  {_short(sql)}")
+    return "\n".join(lines)
+
+
+# --------------------------------------------------------------------------- #
+# Listeners                                                                   #
+# --------------------------------------------------------------------------- #
+def _short(sql: str, width: int = 120) -> str:
+    sql = " ".join(sql.split())
+    return sql if len(sql) <= width else sql[: width - 1] + "…"
+
+
+def caller() -> str:
+    """`módulo:línea` del primer frame fuera del ORM y de la capa de acceso."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(_SKIP_PREFIXES):
+            return f"{module}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _params, _context, _executemany):
+    conn.info.setdefault("instr_t0", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, _params, _context, _executemany):
+    ms = (time.perf_counter() - conn.info["instr_t0"].pop()) * 1000
+    with _lock:
+        entry = _stats.get(statement)
+        if entry is None:
+            entry = _stats[statement] = StatementStats()
+        entry.add(ms)
+
+    if ms >= _config.slow_ms:
+        log.warning("SLOW %.1f ms [%s] %s", ms, caller(), _short(statement))
+
+    seen = conn.info.setdefault("instr_tx", Counter())
+    seen[statement] += 1
+    if seen[statement] == _config.n_plus_one:
+        log.warning("N+1 ×%d en una transacción [%s] %s",
+                    _config.n_plus_one, caller(), _short(statement))
+
+
+def _reset_transaction(conn, *_args) -> None:
+    conn.info.pop("instr_tx", None)
+
+
+def _reset_on_checkin(_dbapi_conn, record) -> None:
+    record.info.pop("instr_tx", None)
+    record.info.pop("instr_t0", None)     # restos de sentencias que fallaron
+
+
+_LISTENERS = [
+    (Engine, "before_cursor_execute", _before_cursor_execute),
+    (Engine, "after_cursor_execute", _after_cursor_execute),
+    (Engine, "commit", _reset_transaction),
+    (Engine, "rollback", _reset_transaction),
+    (Pool, "checkin", _reset_on_checkin),
+]
+
+
+# --------------------------------------------------------------------------- #
+# Activación                                                                  #
+# --------------------------------------------------------------------------- #
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(
+    *,
+    slow_ms: float | None = None,
+    n_plus_one: int | None = None,
+    log_path: Path | str | None = None,
+) -> None:
+    """Registra los listeners en todos los engines (actuales y futuros)."""
+    global _enabled, _handler
+    if slow_ms is not None:
+        _config.slow_ms = slow_ms
+    if n_plus_one is not None:
+        _config.n_plus_one = n_plus_one
+    if _enabled:
+        return
+    for target, name, fn in _LISTENERS:
+        event.listen(target, name, fn)
+    if log_path is not None:
+        _handler = logging.FileHandler(log_path, encoding="utf-8")
+        _handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        log.addHandler(_handler)
+        log.setLevel(logging.INFO)
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled, _handler
+    if not _enabled:
+        return
+    for target, name, fn in _LISTENERS:
+        event.remove(target, name, fn)
+    if _handler is not None:
+        log.removeHandler(_handler)
+        _handler.close()
+        _handler = None
+    _enabled = False
+
+
+def enable_from_env() -> bool:
+    """Activa la instrumentación si EMPLEABILIDAD_SQL_TRACE lo pide."""
+    if os.environ.get("EMPLEABILIDAD_SQL_TRACE", "").lower() not in {"1", "true", "on", "yes"}:
+        return False
+    enable(
+        slow_ms=float(os.environ.get("EMPLEABILIDAD_SQL_SLOW_MS", _config.slow_ms)),
+        n_plus_one=int(os.environ.get("EMPLEABILIDAD_SQL_N_PLUS_ONE", _config.n_plus_one)),
+        log_path=os.environ.get("EMPLEABILIDAD_SQL_LOG", LOG_PATH),
+    )
+    atexit.register(lambda: log.info("Resumen SQL\n%s", report()))
+    return True
@@ -0,0 +1,260 @@
+# employ_toolkit/core/maintenance.py
+"""
+Mantenimiento de la base SQLite
+-------------------------------
+`empleabilidad.db` sólo crecía: los documentos borrados dejaban páginas
+libres que nunca se devolvían y el planificador no tenía estadísticas.
+
+• `run_maintenance()`  → PRAGMA optimize, ANALYZE (acotado con
+                         `analysis_limit`) e `incremental_vacuum`; guarda un
+                         `MaintenanceRun` con páginas y freelist antes/después.
+• `MaintenanceScheduler` → hilo en segundo plano que lo ejecuta cada
+                         `interval` segundos o cuando la base lleva `idle_after`
+                         segundos sin escrituras tras haber cambiado.
+
+`incremental_vacuum` sólo libera espacio con `auto_vacuum=INCREMENTAL`
+(migración v4 en `core.migrations`).
+
+Uso manual:
+    python -m employ_toolkit.core.maintenance [--no-analyze] [--history]
+"""
+
+import argparse
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import select
+
+from employ_toolkit.core import storage
+from employ_toolkit.core.models import MaintenanceRun
+
+log = logging.getLogger(__name__)
+
+
+# --------------------------------------------------------------------------- #
+# Estadísticas del archivo                                                    #
+# --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class DbStats:
+    page_size: int
+    page_count: int
+    freelist_count: int
+
+    @property
+    def size_bytes(self) -> int:
+        return self.page_size * self.page_count
+
+    @property
+    def free_bytes(self) -> int:
+        return self.page_size * self.freelist_count
+
+
+def db_stats(conn: Connection) -> DbStats:
+    pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+    return DbStats(pragma("page_size"), pragma("page_count"), pragma("freelist_count"))
+
+
+# páginas liberadas por transacción: entre tandas se suelta el bloqueo de
+# escritura para que la GUI no espere a que se vacíe toda la freelist
+VACUUM_BATCH = 256
+
+
+def _incremental_vacuum(conn: Connection, pages: int) -> None:
+    # Cada página liberada es una fila sin columnas y sqlite3 sólo da un paso
+    # por execute() (fetchall() no continúa): se repite una vez por página,
+    # en transacciones de `VACUUM_BATCH` páginas como mucho.
+    cursor = conn.connection.cursor()
+    try:
+        while pages > 0:
+            step = min(pages, VACUUM_BATCH)
+            cursor.execute("BEGIN IMMEDIATE")
+            for _ in range(step):
+                cursor.execute("PRAGMA incremental_vacuum(1)")
+            cursor.execute("COMMIT")
+            pages -= step
+    except BaseException:
+        if conn.connection.driver_connection.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    finally:
+        cursor.close()
+
+
+# --------------------------------------------------------------------------- #
+# Una pasada                                                                  #
+# --------------------------------------------------------------------------- #
+def run_maintenance(
+    *,
+    trigger: str = "manual",
+    analyze: bool = True,
+    analysis_limit: int = 1000,
+    vacuum_pages: int | None = None,
+) -> MaintenanceRun:
+    """
+    Ejecuta el mantenimiento sobre `storage.engine` y registra el resultado.
+    `vacuum_pages=None` libera toda la freelist; un número la trocea.
+    """
+    tasks = ["optimize"]
+    t0 = time.perf_counter()
+    with storage.engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        before = db_stats(conn)
+
+        if analyze:
+            conn.exec_driver_sql(f"PRAGMA analysis_limit = {int(analysis_limit)}")
+            conn.exec_driver_sql("ANALYZE")
+            tasks.append("analyze")
+        conn.exec_driver_sql("PRAGMA optimize")
+
+        if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2:
+            _incremental_vacuum(conn, before.freelist_count
+                                if vacuum_pages is None else vacuum_pages)
+            tasks.append("incremental_vacuum")
+
+        after = db_stats(conn)
+
+    run = MaintenanceRun(
+        duration_ms=(time.perf_counter() - t0) * 1000,
+        trigger=trigger,
+        tasks=",".join(tasks),
+        page_size=after.page_size,
+        page_count_before=before.page_count,
+        freelist_before=before.freelist_count,
+        page_count_after=after.page_count,
+        freelist_after=after.freelist_count,
+    )
+    with storage.unit_of_work() as s:
+        s.add(run)
+    log.info("Mantenimiento (%s): %d→%d páginas, freelist %d→%d, %.0f ms",
+             trigger, run.page_count_before, run.page_count_after,
+             run.freelist_before, run.freelist_after, run.duration_ms)
+    return run
+
+
+def recent_runs(limit: int = 10) -> list[MaintenanceRun]:
+    """Últimas pasadas, la más reciente primero."""
+    with storage.SessionFactory() as s:
+        stmt = select(MaintenanceRun).order_by(MaintenanceRun.id.desc()).limit(limit)
+        return list(s.exec(stmt).all())
+
+
+# --------------------------------------------------------------------------- #
+# Planificador                                                                #
+# --------------------------------------------------------------------------- #
+class MaintenanceScheduler:
+    """
+    Hilo daemon que lanza `run_maintenance()`:
+    • por calendario, cada `interval` segundos;
+    • por inactividad, si hubo commits con cambios desde la última pasada
+      y no ha habido ninguno en `idle_after` segundos.
+    """
+
+    def __init__(self, interval: float = 6 * 3600, idle_after: float = 300,
+                 poll: float = 30, **run_kwargs) -> None:
+        self.interval = interval
+        self.idle_after = idle_after
+        self.poll = poll
+        self.run_kwargs = run_kwargs
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_run = time.monotonic()
+        self._last_write: float | None = None    # None = sin cambios pendientes
+
+    # ------------------------------------------------------------------ #
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        event.listen(OrmSession, "after_flush", self._on_flush)
+        event.listen(OrmSession, "after_commit", self._on_commit)
+        event.listen(OrmSession, "after_rollback", self._on_rollback)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="db-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        event.remove(OrmSession, "after_flush", self._on_flush)
+        event.remove(OrmSession, "after_commit", self._on_commit)
+        event.remove(OrmSession, "after_rollback", self._on_rollback)
+
+    def touch(self) -> None:
+        """Marca actividad de escritura (lo hace solo en cada commit con cambios)."""
+        self._last_write = time.monotonic()
+
+    # ------------------------------------------------------------------ #
+    def due(self, now: float | None = None) -> str | None:
+        """Motivo por el que toca una pasada ahora, o None."""
+        now = time.monotonic() if now is None else now
+        if now - self._last_run >= self.interval:
+            return "schedule"
+        if self._last_write is not None and now - self._last_write >= self.idle_after:
+            return "idle"
+        return None
+
+    # `unit_of_work()` confirma también los bloques de sólo lectura: cuenta
+    # únicamente el commit de una sesión que llegó a escribir algo
+    def _on_flush(self, session, _context) -> None:
+        session.info["maintenance_dirty"] = True
+
+    def _on_commit(self, session) -> None:
+        if session.info.pop("maintenance_dirty", False):
+            self.touch()
+
+    def _on_rollback(self, session) -> None:
+        session.info.pop("maintenance_dirty", None)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.poll):
+            trigger = self.due()
+            if trigger is None:
+                continue
+            try:
+                run_maintenance(trigger=trigger, **self.run_kwargs)
+            except Exception:
+                log.exception("Fallo en el mantenimiento de la base")
+            # incluye el commit del propio MaintenanceRun
+            self._last_run = time.monotonic()
+            self._last_write = None
+
+
+# --------------------------------------------------------------------------- #
+# Instancia compartida                                                        #
+# --------------------------------------------------------------------------- #
+scheduler = MaintenanceScheduler()
+
+
+def start_scheduler() -> MaintenanceScheduler:
+    scheduler.start()
+    return scheduler
+
+
+# --------------------------------------------------------------------------- #
+# CLI                                                                         #
+# --------------------------------------------------------------------------- #
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Mantenimiento de empleabilidad.db")
+    ap.add_argument("--no-analyze", action="store_true", help="omitir ANALYZE")
+    ap.add_argument("--history", action="store_true", help="sólo listar pasadas previas")
+    args = ap.parse_args()
+
+    storage.init_db()
+    runs = recent_runs() if args.history else [run_maintenance(analyze=not args.no_analyze)]
+    for r in runs:
+        print(f"{r.started_at:%Y-%m-%d %H:%M}  {r.trigger:<8}  "
+              f"páginas {r.page_count_before}→{r.page_count_after}  "
+              f"libres {r.freelist_before}→{r.freelist_after}  "
+              f"{r.duration_ms:.0f} ms  [{r.tasks}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# employ_toolkit/core/migrations.py
+"""
+Migraciones en sitio
+--------------------
+`SQLModel.metadata.create_all` crea las tablas que faltan pero nunca altera
+las existentes, así que las bases ya instaladas no reciben índices nuevos.
+
+Cada migración es una función `(conn) -> None` registrada en orden con
+`@migration`. La versión aplicada se guarda en `PRAGMA user_version`, y
+`migrate()` (llamado desde `storage.init_db()`) ejecuta sólo las pendientes,
+cada una en su propia transacción. Las que no pueden ir dentro de una
+transacción (VACUUM) se registran con `@migration(transactional=False)` y
+corren en modo autocommit.
+"""
+
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import SQLModel
+
+from employ_toolkit.core import models  # noqa: F401  (registra las tablas)
+from employ_toolkit.core import search
+
+MIGRATIONS: list[Callable[[Connection], None]] = []
+
+
+def migration(func: Callable[[Connection], None] | None = None, *,
+              transactional: bool = True):
+    """Registra `func` como la siguiente versión del esquema."""
+    def register(f: Callable[[Connection], None]) -> Callable[[Connection], None]:
+        f.transactional = transactional
+        MIGRATIONS.append(f)
+        return f
+
+    return register(func) if func is not None else register
+
+
+# --------------------------------------------------------------------------- #
+# Helpers                                                                     #
+# --------------------------------------------------------------------------- #
+def ensure_indexes(conn: Connection) -> None:
+    """Crea los índices declarados en los modelos que aún no existan."""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def schema_version(conn: Connection) -> int:
+    return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+# --------------------------------------------------------------------------- #
+# Migraciones (el orden es la versión: 1, 2, …)                               #
+# --------------------------------------------------------------------------- #
+@migration
+def _lookup_indexes(conn: Connection) -> None:
+    """v1 · Índices de Document, Client.email, CandidateProfile.email y RelevantPosition."""
+    ensure_indexes(conn)
+
+
+@migration
+def _full_text_index(conn: Connection) -> None:
+    """v2 · Índice FTS5 sobre Client, Document y CVData (+ carga inicial)."""
+    search.install(conn)
+    search.rebuild(conn)
+
+
+@migration
+def _client_name_index(conn: Connection) -> None:
+    """v3 · Índice de Client.full_name para paginar por nombre."""
+    ensure_indexes(conn)
+
+
+@migration(transactional=False)
+def _incremental_auto_vacuum(conn: Connection) -> None:
+    """v4 · auto_vacuum=INCREMENTAL para que `core.maintenance` libere espacio."""
+    if conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2:
+        return
+    conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.exec_driver_sql("VACUUM")      # sólo así cambia en una base existente
+
+
+# --------------------------------------------------------------------------- #
+# Runner                                                                      #
+# --------------------------------------------------------------------------- #
+def migrate(engine: Engine) -> int:
+    """Aplica las migraciones pendientes y devuelve la versión final."""
+    with engine.connect() as conn:
+        version = schema_version(conn)
+
+    for number, step in enumerate(MIGRATIONS[version:], start=version + 1):
+        if getattr(step, "transactional", True):
+            with engine.begin() as conn:
+                step(conn)
+                conn.exec_driver_sql(f"PRAGMA user_version = {number}")
+        else:
+            with engine.connect() as conn:
+                conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+                step(conn)
+                conn.exec_driver_sql(f"PRAGMA user_version = {number}")
+        version = number
+    return version
@@ -2,6 +2,7 @@
 from typing import Optional
 from datetime import datetime, date
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 
 
@@ -11,13 +12,17 @@ from sqlmodel import SQLModel, Field
 class CandidateProfile(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     full_name: str
-    email: str
+    email: str = Field(index=True)
     location: str
     disc_type: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
 class RelevantPosition(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_relevantposition_candidate_id_score", "candidate_id", "score"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     candidate_id: int = Field(foreign_key="candidateprofile.id")
     title: str
@@ -37,8 +42,8 @@ class User(SQLModel, table=True):
 
 class Client(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    full_name: str
-    email: str
+    full_name: str = Field(index=True)   # orden/paginación de la tabla principal
+    email: str = Field(index=True)   # búsqueda en IntakeForm.save
     phone: str
     profession: str
     age: int
@@ -49,6 +54,14 @@ class Client(SQLModel, table=True):
 # Documentos generados                                                        #
 # --------------------------------------------------------------------------- #
 class Document(SQLModel, table=True):
+    __table_args__ = (
+        # Informe final: WHERE client_id ORDER BY module, created_at
+        Index("ix_document_client_id_module_created_at",
+              "client_id", "module", "created_at"),
+        # Lista de documentos: WHERE client_id ORDER BY created_at DESC
+        Index("ix_document_client_id_created_at", "client_id", "created_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     client_id: int = Field(foreign_key="client.id")
     module: int               # 1, 2 o 3
@@ -71,3 +84,66 @@ class CVData(SQLModel, table=True):
     json_blob: str            # CV estructurado (texto JSON)
     pdf_path: str             # archivo PDF generado
     docx_path: str            # archivo DOCX generado
+
+
+# --------------------------------------------------------------------------- #
+# Mantenimiento de la base (core.maintenance)                                 #
+# --------------------------------------------------------------------------- #
+class MaintenanceRun(SQLModel, table=True):
+    """Una pasada de optimize / ANALYZE / incremental_vacuum y su efecto."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    duration_ms: float = 0.0
+    trigger: str              # schedule | idle | manual
+    tasks: str                # p.ej. "optimize,analyze,incremental_vacuum"
+    page_size: int
+    page_count_before: int
+    freelist_before: int
+    page_count_after: int
+    freelist_after: int
+
+
+# --------------------------------------------------------------------------- #
+# Historial de CV (core.cv_versions)                                          #
+# --------------------------------------------------------------------------- #
+class CVVersion(SQLModel, table=True):
+    """
+    Una versión del CV estructurado de un cliente. `kind="full"` guarda el
+    JSON completo; `kind="delta"` sólo los cambios respecto a la anterior.
+    `payload` va comprimido con zlib.
+    """
+    __table_args__ = (
+        Index("ux_cvversion_client_id_version", "client_id", "version", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    client_id: int = Field(foreign_key="client.id")
+    version: int              # 1, 2, … por cliente
+    kind: str                 # full | delta
+    payload: bytes
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# --------------------------------------------------------------------------- #
+# Checkpoints del WorkflowManager (core.checkpoints)                          #
+# --------------------------------------------------------------------------- #
+class WorkflowRun(SQLModel, table=True):
+    run_id: str = Field(primary_key=True)
+    status: str = "running"   # running | done | failed
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class WorkflowCheckpoint(SQLModel, table=True):
+    """Resultado serializado (JSON) de un paso terminado."""
+    __table_args__ = (
+        Index("ux_workflowcheckpoint_run_id_step", "run_id", "step", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    run_id: str = Field(foreign_key="workflowrun.run_id")
+    step: str
+    position: int             # orden de llegada dentro de la ejecución
+    payload: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
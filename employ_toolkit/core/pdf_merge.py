@@ -0,0 +1,354 @@
+# employ_toolkit/core/pdf_merge.py
+"""
+Utilidades PDF para el informe final
+------------------------------------
+`merge_pdfs(sources, out)` une PDFs en streaming, con memoria acotada:
+
+• cada origen se abre de uno en uno con un `PdfReader` sobre `mmap` (el
+  sistema pagina el archivo; no se copia entero al heap) y se suelta al
+  terminar con él;
+• cada objeto se escribe en `out` en cuanto se copia: en memoria sólo
+  quedan los offsets de la xref y un sha256 por objeto único;
+• recursos compartidos (fuentes, imágenes, /ExtGState…) se deduplican por
+  contenido: dos objetos que serializan igual (con sus referencias ya
+  renumeradas) se escriben una sola vez. Los 40 entregables ReportLab de
+  un cliente comparten las mismas fuentes y el logo.
+
+`append_pdfs(target, sources)` añade las páginas de `sources` al final de
+`target` con una *actualización incremental* (PDF 1.7 §7.5.6): no se
+reescribe nada de lo existente, sólo se anexan
+
+    objetos nuevos (páginas y todo lo que referencian, renumerados a
+    partir del /Size anterior) + el árbol /Pages raíz actualizado +
+    una sección xref nueva y un trailer con /Prev a la anterior.
+
+El coste es el de leer y copiar los documentos nuevos, de uno en uno y
+sobre `mmap` como en `merge_pdfs`; del informe ya
+generado (abierto sobre `mmap`, sin copiarlo al heap) sólo se leen la
+xref, el trailer y el nodo /Pages raíz. Requisitos del destino: sin
+cifrar y con tabla xref clásica (lo que escribe PyPDF2). Si la escritura
+falla, el archivo se trunca a su tamaño original.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+from PyPDF2 import PdfReader
+from PyPDF2.generic import (
+    ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject,
+    StreamObject,
+)
+
+# atributos que una página puede heredar de sus nodos /Pages (§7.7.3.4)
+_INHERITABLE = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF\s*$")
+
+
+def _last_startxref(path: Path) -> int:
+    with path.open("rb") as fh:
+        fh.seek(max(0, path.stat().st_size - 1024))
+        match = _STARTXREF.search(fh.read())
+    if match is None:
+        raise ValueError(f"{path}: no se encontró 'startxref'")
+    return int(match.group(1))
+
+
+def _leaf_pages(node: DictionaryObject, inherited: dict) -> Iterable[tuple[IndirectObject, dict]]:
+    """(referencia, atributos heredados) de cada página, en orden."""
+    inherited = {**inherited, **{k: node.raw_get(k) for k in _INHERITABLE if k in node}}
+    for ref in node["/Kids"]:
+        kid = ref.get_object()
+        if kid.get("/Type") == "/Pages":
+            yield from _leaf_pages(kid, inherited)
+        else:
+            yield ref, inherited
+
+
+class _Copier:
+    """Copia objetos de un `PdfReader` con números nuevos desde `next_id`."""
+
+    def __init__(self, next_id: int) -> None:
+        self.next_id = next_id
+        self.ids: dict[tuple[int, int, int], int] = {}
+        self.queue: deque[tuple[int, object]] = deque()
+
+    def ref(self, ref: IndirectObject, obj=None) -> IndirectObject:
+        key = (id(ref.pdf), ref.idnum, ref.generation)
+        if key not in self.ids:
+            self.ids[key] = self.next_id
+            self.next_id += 1
+            self.queue.append((self.ids[key], ref.get_object() if obj is None else obj))
+        return IndirectObject(self.ids[key], 0, None)
+
+    def copy(self, obj):
+        if isinstance(obj, IndirectObject):
+            # pdf=None: ya es una referencia del destino (p.ej. /Parent)
+            return obj if obj.pdf is None else self.ref(obj)
+        if isinstance(obj, StreamObject):
+            new = type(obj)()
+            new._data = obj._data                      # bytes ya codificados
+            new.update({NameObject(k): self.copy(v) for k, v in obj.items() if k != "/Length"})
+            return new
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({NameObject(k): self.copy(v) for k, v in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self.copy(v) for v in obj)
+        return obj
+
+
+@contextmanager
+def _mapped_reader(path: Path | str) -> Iterator[PdfReader]:
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        reader = PdfReader(mm)
+        if reader.is_encrypted:
+            raise ValueError(f"{path}: PDF cifrado")
+        yield reader
+
+
+def _write_obj(fh, number: int, generation: int, obj) -> int:
+    offset = fh.tell()
+    fh.write(f"{number} {generation} obj\n".encode())
+    obj.write_to_stream(fh, None)
+    fh.write(b"\nendobj\n")
+    return offset
+
+
+def _write_xref(fh, offsets: dict[int, tuple[int, int]]) -> int:
+    start = fh.tell()
+    # la subsección "0 1" (objeto 0 libre) evita que lectores antiguos
+    # tomen la tabla por mal indexada
+    fh.write(b"xref\n0 1\n0000000000 65535 f\r\n")
+    numbers = sorted(offsets)
+    run: list[int] = []
+    for number in numbers + [None]:
+        if run and (number is None or number != run[-1] + 1):
+            fh.write(f"{run[0]} {len(run)}\n".encode())
+            for n in run:
+                offset, generation = offsets[n]
+                fh.write(f"{offset:010d} {generation:05d} n\r\n".encode())
+            run = []
+        if number is not None:
+            run.append(number)
+    return start
+
+
+def append_pdfs(target: Path | str, sources: Iterable[Path | str]) -> int:
+    """Anexa las páginas de `sources` a `target`. Devuelve cuántas añadió."""
+    target = Path(target)
+    prev = _last_startxref(target)
+    with _mapped_reader(target) as base:
+        trailer = base.trailer
+        pages_ref = trailer["/Root"].raw_get("/Pages")
+        pages = pages_ref.get_object()
+        size_id = int(trailer["/Size"])
+        new_trailer = DictionaryObject({
+            NameObject(k): trailer.raw_get(k) for k in ("/Root", "/Info", "/ID") if k in trailer
+        })
+        updated = DictionaryObject({NameObject(k): v for k, v in pages.items()})
+        old_kids, old_count = list(pages["/Kids"]), int(pages["/Count"])
+
+    copier = _Copier(size_id)
+    parent = IndirectObject(pages_ref.idnum, pages_ref.generation, None)
+    new_kids: list[IndirectObject] = []
+    size = target.stat().st_size
+    with target.open("r+b") as fh:
+        try:
+            fh.seek(0, os.SEEK_END)
+            fh.write(b"\n")
+            offsets: dict[int, tuple[int, int]] = {}
+            # un origen a la vez: se copia y escribe entero antes de abrir el siguiente
+            for source in sources:
+                with _mapped_reader(source) as reader:
+                    root = reader.trailer["/Root"]["/Pages"]
+                    for ref, inherited in _leaf_pages(root, {}):
+                        page = ref.get_object()
+                        flat = DictionaryObject({**inherited, **{k: v for k, v in page.items()
+                                                                  if k != "/Parent"}})
+                        flat[NameObject("/Parent")] = parent
+                        new_kids.append(copier.ref(ref, flat))
+                    while copier.queue:
+                        number, obj = copier.queue.popleft()
+                        offsets[number] = (_write_obj(fh, number, 0, copier.copy(obj)), 0)
+                copier.ids.clear()           # claves con id(reader): no reutilizar
+
+            if not new_kids:
+                fh.truncate(size)
+                return 0
+
+            updated[NameObject("/Kids")] = ArrayObject([*old_kids, *new_kids])
+            updated[NameObject("/Count")] = NumberObject(old_count + len(new_kids))
+            offsets[pages_ref.idnum] = (_write_obj(fh, pages_ref.idnum,
+                                                   pages_ref.generation, updated),
+                                        pages_ref.generation)
+
+            new_trailer[NameObject("/Size")] = NumberObject(copier.next_id)
+            new_trailer[NameObject("/Prev")] = NumberObject(prev)
+            start = _write_xref(fh, offsets)
+            fh.write(b"trailer\n")
+            new_trailer.write_to_stream(fh, None)
+            fh.write(f"\nstartxref\n{start}\n%%EOF\n".encode())
+            fh.flush()
+            os.fsync(fh.fileno())
+        except BaseException:
+            fh.truncate(size)
+            raise
+    return len(new_kids)
+
+
+# --------------------------------------------------------------------------- #
+# Fusión en streaming                                                         #
+# --------------------------------------------------------------------------- #
+_CATALOG, _PAGES = 1, 2
+
+
+@dataclass
+class MergeStats:
+    pages: int = 0
+    objects: int = 0              # objetos escritos
+    deduplicated: int = 0         # objetos reutilizados en vez de reescritos
+
+
+def _serialize(obj) -> bytes:
+    buffer = BytesIO()
+    obj.write_to_stream(buffer, None)
+    return buffer.getvalue()
+
+
+class _StreamWriter:
+    """Destino de `merge_pdfs`: escribe objetos al vuelo y recuerda offsets."""
+
+    def __init__(self, out: BinaryIO) -> None:
+        self.out = out
+        self.offsets = [0, 0, 0]              # índice = número de objeto
+        self.digests: dict[bytes, int] = {}
+        self.stats = MergeStats()
+        out.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    def allocate(self) -> int:
+        self.offsets.append(0)
+        return len(self.offsets) - 1
+
+    def write(self, number: int, data: bytes) -> None:
+        self.offsets[number] = self.out.tell()
+        self.out.write(b"%d 0 obj\n" % number)
+        self.out.write(data)
+        self.out.write(b"\nendobj\n")
+        self.stats.objects += 1
+
+    def store(self, data: bytes) -> int:
+        """Número del objeto con estos bytes; lo escribe sólo si es nuevo."""
+        digest = hashlib.sha256(data).digest()
+        number = self.digests.get(digest)
+        if number is not None:
+            self.stats.deduplicated += 1
+            return number
+        number = self.allocate()
+        self.write(number, data)
+        self.digests[digest] = number
+        return number
+
+    def finish(self, kids: list[int]) -> None:
+        self.write(_PAGES, _serialize(DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): ArrayObject(IndirectObject(n, 0, None) for n in kids),
+            NameObject("/Count"): NumberObject(len(kids)),
+        })))
+        self.write(_CATALOG, _serialize(DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): IndirectObject(_PAGES, 0, None),
+        })))
+        start = self.out.tell()
+        self.out.write(b"xref\n0 %d\n0000000000 65535 f\r\n" % len(self.offsets))
+        for offset in self.offsets[1:]:
+            self.out.write(b"%010d 00000 n\r\n" % offset)
+        self.out.write(b"trailer\n")
+        DictionaryObject({
+            NameObject("/Size"): NumberObject(len(self.offsets)),
+            NameObject("/Root"): IndirectObject(_CATALOG, 0, None),
+        }).write_to_stream(self.out, None)
+        self.out.write(b"\nstartxref\n%d\n%%%%EOF\n" % start)
+
+
+class _SourceCopier:
+    """Copia los objetos de un origen (post-orden, para poder deduplicar)."""
+
+    def __init__(self, writer: _StreamWriter) -> None:
+        self.w = writer
+        self.ids: dict[tuple[int, int], int] = {}
+        self.active: set[tuple[int, int]] = set()
+        self.reserved: dict[tuple[int, int], int] = {}
+
+    def ref(self, ref: IndirectObject) -> IndirectObject:
+        key = (ref.idnum, ref.generation)
+        if key in self.ids:
+            return IndirectObject(self.ids[key], 0, None)
+        if key in self.active:                 # ciclo: número fijo, sin deduplicar
+            if key not in self.reserved:
+                self.reserved[key] = self.w.allocate()
+            return IndirectObject(self.reserved[key], 0, None)
+        self.active.add(key)
+        try:
+            data = _serialize(self.copy(ref.get_object()))
+        finally:
+            self.active.discard(key)
+        number = self.reserved.pop(key, None)
+        if number is None:
+            number = self.w.store(data)
+        else:
+            self.w.write(number, data)
+        self.ids[key] = number
+        return IndirectObject(number, 0, None)
+
+    def copy(self, obj):
+        if isinstance(obj, IndirectObject):
+            return obj if obj.pdf is None else self.ref(obj)
+        if isinstance(obj, StreamObject):
+            new = type(obj)()
+            new._data = obj._data
+            new.update({NameObject(k): self.copy(v) for k, v in obj.items() if k != "/Length"})
+            return new
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({NameObject(k): self.copy(v) for k, v in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self.copy(v) for v in obj)
+        return obj
+
+    def pages(self, reader: PdfReader) -> list[int]:
+        leaves = list(_leaf_pages(reader.trailer["/Root"]["/Pages"], {}))
+        # números de página antes de copiar nada: /P de anotaciones, /Dest…
+        for ref, _ in leaves:
+            self.ids[(ref.idnum, ref.generation)] = self.w.allocate()
+        parent = IndirectObject(_PAGES, 0, None)
+        numbers = []
+        for ref, inherited in leaves:
+            page = ref.get_object()
+            flat = DictionaryObject({**inherited, **{k: v for k, v in page.items()
+                                                      if k != "/Parent"}})
+            flat[NameObject("/Parent")] = parent
+            number = self.ids[(ref.idnum, ref.generation)]
+            self.w.write(number, _serialize(self.copy(flat)))
+            numbers.append(number)
+        return numbers
+
+
+def merge_pdfs(sources: Iterable[Path | str], out: BinaryIO) -> MergeStats:
+    """
+    Escribe en `out` (binario, con `tell()`) las páginas de `sources` en
+    orden. Sólo un origen está abierto a la vez.
+    """
+    writer = _StreamWriter(out)
+    kids: list[int] = []
+    for source in sources:
+        with _mapped_reader(source) as reader:
+            kids += _SourceCopier(writer).pages(reader)
+    writer.finish(kids)
+    writer.stats.pages = len(kids)
+    return writer.stats
@@ -0,0 +1,85 @@
+# employ_toolkit/core/pdf_styles.py
+"""
+Estilos ReportLab compartidos
+-----------------------------
+Todos los generadores PDF usan la misma hoja de estilos de ejemplo y la
+misma tabla con cabecera azul. Aquí se construyen una sola vez por proceso:
+
+• `stylesheet()`          → `getSampleStyleSheet()` cacheada. Es compartida:
+                            no se modifica; para variar un estilo usa
+                            `derive("Normal", fontSize=9)`.
+• `header_table_style()`  → `TableStyle` de cabecera azul, cacheado por
+                            parámetros (`Table.setStyle` sólo lo lee).
+• `register_fonts()`      → carga las fuentes una vez (idempotente).
+
+Ejemplo:
+    st = pdf_styles.stylesheet()
+    tbl.setStyle(pdf_styles.header_table_style(("VALIGN", (0, 0), (-1, -1), "TOP")))
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from reportlab.lib import colors
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import TableStyle
+
+HEADER_BLUE = "#0B6FA4"
+HEADER_DARK_BLUE = "#005B8F"
+FONT = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+
+# fuentes estándar que usa la hoja de ejemplo
+_BUILTIN_FONTS = ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique",
+                  "Helvetica-BoldOblique", "Courier", "Times-Roman")
+
+
+@lru_cache(maxsize=None)
+def register_fonts(*ttf: tuple[str, str]) -> tuple[str, ...]:
+    """
+    Carga las fuentes estándar y registra las TTF `(nombre, ruta)` pedidas.
+    Sólo trabaja la primera vez por combinación; devuelve los nombres.
+    """
+    for name in _BUILTIN_FONTS:
+        pdfmetrics.getFont(name)
+    for name, path in ttf:
+        if name not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont(name, str(Path(path))))
+    return _BUILTIN_FONTS + tuple(name for name, _ in ttf)
+
+
+@lru_cache(maxsize=1)
+def stylesheet() -> StyleSheet1:
+    """Hoja de estilos de ejemplo, construida una sola vez (no modificar)."""
+    register_fonts()
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def derive(base: str, **overrides) -> ParagraphStyle:
+    """Variante cacheada de un estilo de `stylesheet()`."""
+    parent = stylesheet()[base]
+    suffix = ",".join(f"{k}={v}" for k, v in sorted(overrides.items()))
+    return ParagraphStyle(f"{parent.name}[{suffix}]", parent=parent, **overrides)
+
+
+@lru_cache(maxsize=None)
+def header_table_style(
+    *extra: tuple,
+    header: str = HEADER_BLUE,
+    grid: float = 0.4,
+    grid_color: colors.Color = colors.grey,
+) -> TableStyle:
+    """
+    Tabla con rejilla y primera fila azul en negrita, más los comandos
+    `extra` (p.ej. `("VALIGN", (0, 0), (-1, -1), "TOP")`).
+    """
+    return TableStyle([
+        ("GRID", (0, 0), (-1, -1), grid, grid_color),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(header)),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), FONT_BOLD),
+        *extra,
+    ])
@@ -0,0 +1,148 @@
+# employ_toolkit/core/profiling.py
+"""
+Perfil de pasos del WorkflowManager
+-----------------------------------
+Con `WorkflowManager(profile=True)` cada paso registra un `StepProfile`:
+
+• wall   → tiempo real (perf_counter)
+• cpu    → CPU del hilo que ejecuta el paso (thread_time)
+• peak   → pico de tracemalloc durante el paso. tracemalloc es global al
+           proceso: con pasos concurrentes en hilos el pico incluye lo que
+           asignen los vecinos; con `executor="process"` es exacto.
+
+Exportación:
+• `chrome_trace()` / `write_chrome_trace()` → JSON de trace events (abrir en
+  chrome://tracing o https://ui.perfetto.dev).
+• `summary_table()` → tabla ordenada por tiempo real.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0      # pasos en curso que necesitan tracemalloc
+_tracing_owned = False  # lo arrancamos aquí (si ya estaba activo, no se para)
+
+
+@dataclass
+class StepProfile:
+    name: str
+    start_us: int            # epoch en µs (alinea hilos y procesos)
+    wall_s: float
+    cpu_s: float
+    peak_bytes: int
+    pid: int
+    tid: int
+    cached: bool = False
+    error: str | None = None
+
+
+def cached_profile(name: str) -> StepProfile:
+    """Perfil de un paso servido desde la caché (sin coste propio)."""
+    return StepProfile(name, time.time_ns() // 1000, 0.0, 0.0, 0,
+                       os.getpid(), threading.get_ident(), cached=True)
+
+
+# --------------------------------------------------------------------------- #
+# Medición                                                                    #
+# --------------------------------------------------------------------------- #
+def _acquire_tracing() -> None:
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+        if _tracing_users == 1:
+            tracemalloc.reset_peak()
+
+
+def _release_tracing() -> None:
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+
+
+def profiled_call(name: str, func: Callable[..., Any], context: dict,
+                  kwargs: dict) -> tuple[Any, StepProfile]:
+    """
+    Ejecuta `func(context, **kwargs)` y devuelve `(resultado, perfil)`.
+    Si falla, el perfil viaja en `exc.step_profile`.
+    """
+    _acquire_tracing()
+    base = tracemalloc.get_traced_memory()[0]
+    start_us = time.time_ns() // 1000
+    wall0, cpu0 = time.perf_counter(), time.thread_time()
+
+    def profile(error: str | None = None) -> StepProfile:
+        return StepProfile(
+            name=name, start_us=start_us,
+            wall_s=time.perf_counter() - wall0,
+            cpu_s=time.thread_time() - cpu0,
+            peak_bytes=max(0, tracemalloc.get_traced_memory()[1] - base),
+            pid=os.getpid(), tid=threading.get_ident(), error=error,
+        )
+
+    try:
+        result = func(context, **kwargs)
+    except BaseException as exc:
+        exc.step_profile = profile(f"{type(exc).__name__}: {exc}")
+        raise
+    else:
+        return result, profile()
+    finally:
+        _release_tracing()
+
+
+# --------------------------------------------------------------------------- #
+# Exportación                                                                 #
+# --------------------------------------------------------------------------- #
+def chrome_trace(profiles: Iterable[StepProfile]) -> dict:
+    """Trace events ("X" = evento completo) en el formato de Chrome."""
+    events = []
+    for p in profiles:
+        events.append({
+            "name": p.name,
+            "cat": "cache" if p.cached else "step",
+            "ph": "X",
+            "ts": p.start_us,
+            "dur": max(1, round(p.wall_s * 1_000_000)),
+            "pid": p.pid,
+            "tid": p.tid,
+            "args": {
+                "cpu_ms": round(p.cpu_s * 1000, 3),
+                "peak_kib": round(p.peak_bytes / 1024, 1),
+                "cached": p.cached,
+                **({"error": p.error} if p.error else {}),
+            },
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(profiles: Iterable[StepProfile], path: Path | str) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(chrome_trace(profiles), ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def summary_table(profiles: Iterable[StepProfile]) -> str:
+    """Tabla de pasos, del más lento al más rápido."""
+    rows = sorted(profiles, key=lambda p: p.wall_s, reverse=True)
+    total = sum(p.wall_s for p in rows) or 1.0
+    lines = [f"{'paso':<24} {'real s':>8} {'cpu s':>8} {'%':>6} {'pico MiB':>9}  nota",
+             "-" * 68]
+    for p in rows:
+        note = "caché" if p.cached else ("ERROR" if p.error else "")
+        lines.append(f"{p.name:<24} {p.wall_s:>8.3f} {p.cpu_s:>8.3f} "
+                     f"{100 * p.wall_s / total:>5.1f}% {p.peak_bytes / 2**20:>9.2f}  {note}")
+    return "\n".join(lines)
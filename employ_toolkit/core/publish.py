@@ -0,0 +1,72 @@
+# employ_toolkit/core/publish.py
+"""
+Publicación atómica de entregables
+----------------------------------
+Los generadores renderizan en memoria (`BytesIO`) y sólo al final el
+resultado se escribe en disco:
+
+    temporal en el mismo directorio → fsync → os.replace → fsync del directorio
+
+Así un error a mitad de render no deja archivos a medias en `workspace/`,
+y quien sólo quiere los bytes (HTTP, ZIP) no toca el disco.
+
+Para salidas grandes que no conviene tener en memoria (informe final),
+`atomic_writer(path)` entrega el archivo temporal para escribir en él.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+def _fsync_dir(directory: Path) -> None:
+    if os.name != "posix":             # Windows no abre directorios
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_writer(path: Path | str, *, durable: bool = True) -> Iterator[BinaryIO]:
+    """
+    `with atomic_writer(p) as fh: ...` escribe en un temporal y sólo al
+    salir sin error lo mueve a `p`; si hay excepción, `p` no cambia.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            if os.name == "posix":          # mkstemp crea con 0600
+                os.fchmod(fh.fileno(), 0o644)
+            yield fh
+            fh.flush()
+            if durable:
+                os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    if durable:
+        _fsync_dir(path.parent)
+
+
+def publish(data: BytesIO | bytes | memoryview, path: Path | str, *,
+            durable: bool = True) -> Path:
+    """
+    Escribe `data` en `path` de forma atómica y devuelve la ruta. Con
+    `durable=False` se omiten los fsync (tests, archivos temporales).
+    """
+    view = data.getbuffer() if isinstance(data, BytesIO) else memoryview(data)
+    try:
+        with atomic_writer(path, durable=durable) as fh:
+            fh.write(view)
+    finally:
+        view.release()
+    return Path(path)
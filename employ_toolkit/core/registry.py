@@ -0,0 +1,183 @@
+# employ_toolkit/core/registry.py
+"""
+DocumentRegistry
+----------------
+Cada formulario registraba su `Document` con una sesión y un commit propios
+(un fsync por archivo). El registro acumula las altas en memoria y las
+confirma juntas en una sola transacción cuando:
+
+• se alcanzan `max_pending` registros,
+• pasan `max_age` segundos desde el primer registro pendiente, o
+• alguien llama a `flush()` (p.ej. antes de listar documentos).
+
+Si falla un flush (p.ej. la BD bloqueada), lo dispare el timer, el tamaño
+o una llamada explícita, los registros siguen pendientes y se programa un
+reintento con espera creciente (`max_age` · 2ⁿ, hasta `max_backoff`); el
+primer flush que funcione la reinicia.
+
+Un mismo archivo se registra una sola vez por cliente: si ya hay un
+`Document` (pendiente o confirmado) con esa ruta, `register` devuelve ése.
+Pasa al reutilizar entregables idénticos (`core.artifacts`).
+
+`documents` es la instancia compartida del proceso; los batch pueden crear
+la suya con umbrales más grandes.
+"""
+
+import atexit
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+from employ_toolkit.core.models import Document
+from employ_toolkit.core.storage import get_documents, unit_of_work
+
+log = logging.getLogger("employ_toolkit.registry")
+
+
+class DocumentRegistry:
+    """Buffer de registros `Document` confirmados por lotes."""
+
+    def __init__(self, max_pending: int = 50, max_age: float = 1.0,
+                 max_backoff: float = 30.0) -> None:
+        self.max_pending = max_pending
+        self.max_age = max_age
+        self.max_backoff = max_backoff
+        self._failures = 0
+        self._pending: list[Document] = []
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+
+    # ------------------------------------------------------------------ #
+    def register(
+        self,
+        client_id: int,
+        module: int,
+        doc_type: str,
+        path: Path | str,
+        created_at: datetime | None = None,
+    ) -> Document:
+        """Encola un documento; se insertará en el próximo flush."""
+        stored = self._stored(client_id)               # BD fuera del lock
+        with self._lock:
+            existing = self._known(client_id, str(path), stored)
+            if existing is not None:
+                return existing
+            doc = Document(
+                client_id=client_id,
+                module=module,
+                doc_type=doc_type,
+                path=str(path),
+                created_at=created_at or datetime.utcnow(),
+            )
+            self._enqueue([doc])
+            return doc
+
+    def register_many(
+        self, client_id: int, module: int, items: Iterable[tuple[str, Path | str]]
+    ) -> list[Document]:
+        """Encola varios `(doc_type, path)` del mismo cliente y módulo."""
+        now = datetime.utcnow()
+        docs, fresh = [], []
+        stored = self._stored(client_id)
+        with self._lock:
+            for doc_type, path in items:
+                doc = self._known(client_id, str(path), stored) or next(
+                    (d for d in fresh if d.path == str(path)), None)
+                if doc is None:
+                    doc = Document(client_id=client_id, module=module, doc_type=doc_type,
+                                   path=str(path), created_at=now)
+                    fresh.append(doc)
+                docs.append(doc)
+            if fresh:
+                self._enqueue(fresh)
+        return docs
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    # ------------------------------------------------------------------ #
+    def flush(self) -> int:
+        """Inserta todo lo pendiente en una transacción. Devuelve cuántos."""
+        with self._lock:
+            self._cancel_timer()
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                with unit_of_work() as s:
+                    s.add_all(batch)
+            except BaseException:
+                self._pending[:0] = batch   # se reintentará en el próximo flush
+                self._retry_later()
+                raise
+            self._failures = 0
+            return len(batch)
+
+    def close(self) -> None:
+        self.flush()
+
+    # ------------------------------------------------------------------ #
+    def _enqueue(self, docs: list[Document]) -> None:
+        with self._lock:
+            self._pending.extend(docs)
+            if len(self._pending) >= self.max_pending:
+                self.flush()
+            elif self._timer is None:
+                self._start_timer(self.max_age)
+
+    def _start_timer(self, delay: float) -> None:
+        self._timer = threading.Timer(delay, self._timed_flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _retry_later(self) -> None:
+        """Tras un flush fallido (lo dispare quien lo dispare): timer con backoff."""
+        self._failures += 1
+        delay = min(self.max_age * 2 ** self._failures, self.max_backoff)
+        log.warning("Flush de documentos fallido (%d); reintento en %.1f s",
+                    self._failures, delay)
+        if self._timer is None:
+            self._start_timer(delay)
+
+    def _timed_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception:               # ya reprogramado; aquí no hay a quién avisar
+            log.exception("Flush de documentos fallido")
+
+    @staticmethod
+    def _stored(client_id: int) -> dict[str, Document]:
+        """Documentos confirmados del cliente por ruta (caché de `storage`)."""
+        return {d.path: d for d in get_documents(client_id)}
+
+    def _known(self, client_id: int, path: str,
+               stored: dict[str, Document]) -> Document | None:
+        """Documento ya registrado del cliente para `path` (pendiente o en BD)."""
+        for doc in self._pending:
+            if doc.client_id == client_id and doc.path == path:
+                return doc
+        return stored.get(path)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+# --------------------------------------------------------------------------- #
+# Instancia compartida                                                        #
+# --------------------------------------------------------------------------- #
+documents = DocumentRegistry()
+atexit.register(documents.close)
+
+
+def register_document(client_id: int, module: int, doc_type: str,
+                      path: Path | str) -> Document:
+    return documents.register(client_id, module, doc_type, path)
+
+
+def flush_documents() -> int:
+    return documents.flush()
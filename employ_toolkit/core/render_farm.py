@@ -0,0 +1,149 @@
+# employ_toolkit/core/render_farm.py
+"""
+RenderFarm · procesos calientes para generar entregables
+--------------------------------------------------------
+ReportLab, python-docx y python-pptx renderizan en el hilo de quien llama,
+así que los ~15 entregables de un cliente salían de uno en uno. La granja
+mantiene un pool fijo de procesos que ya importaron reportlab, docx, pptx
+y openpyxl y registraron las fuentes; cada trabajo es sólo datos:
+
+    with RenderFarm(workers=4) as farm:
+        pdf = farm.submit(RenderJob("networking", {"id": 1, "full_name": "Ana"},
+                                    (data,))).result()
+        results = farm.render([RenderJob("ats", client, (ats_data,)), ...])
+
+• `generator` es un nombre de `GENERATORS` o un `"modulo:funcion"`.
+• `client` es un dict (id, full_name…); en el trabajador se convierte en
+  un objeto con atributos, que es lo que leen los `generate_*`.
+• Cada trabajador se recicla tras `max_tasks_per_child` trabajos para
+  acotar la memoria (fuentes, cachés de ReportLab, árboles XML…).
+
+Los trabajadores arrancan con "forkserver" (o "spawn" donde no existe):
+`max_tasks_per_child` no admite "fork" y así no heredan conexiones ni
+hilos del proceso principal. Trabajan en el directorio actual del padre.
+"""
+
+import importlib
+import multiprocessing as mp
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable, Mapping
+
+# nombre → "modulo:funcion"; la función recibe (client, *args, **kwargs)
+GENERATORS: dict[str, str] = {
+    "ats": "employ_toolkit.modules.ats_guides:generate_ats_pdf",
+    "brand_canvas": "employ_toolkit.modules.brand_canvas:generate_brand_canvas",
+    "cold_msgs": "employ_toolkit.modules.cold_msg_guides:generate_cold_pdf",
+    "comm_style": "employ_toolkit.modules.comm_style:generate_comm_style_pdf",
+    "content_plan": "employ_toolkit.modules.content_plan:generate_content_plan",
+    "cv": "employ_toolkit.modules.cv_builder:generate_cv_files",
+    "disc": "employ_toolkit.modules.disc_comp:generate_disc_comp_pdf",
+    "image": "employ_toolkit.modules.image_guidelines:generate_image_guidelines_pdf",
+    "interview": "employ_toolkit.modules.interview:generate_interview_pdf",
+    "kpis": "employ_toolkit.modules.kpi_panel:generate_kpi_xlsx",
+    "networking": "employ_toolkit.modules.networking:generate_networking_pdf",
+    "strategy": "employ_toolkit.modules.personal_brand:generate_brand_strategy_pdf",
+    "search": "employ_toolkit.modules.search_guide:generate_search_pdf",
+    "sector": "employ_toolkit.modules.sector_market:generate_sector_ppt",
+    "selection": "employ_toolkit.modules.selection_route:generate_selection_pdf",
+    "skills": "employ_toolkit.modules.skills_matrix:generate_skill_matrix_pdf",
+}
+
+# lo que cada trabajador importa al arrancar (no dependen del cwd)
+WARM_MODULES = (
+    "reportlab.platypus",
+    "reportlab.graphics.charts.barcharts",
+    "docx",
+    "pptx",
+    "pptx.chart.data",
+    "openpyxl",
+)
+
+
+@dataclass
+class RenderJob:
+    generator: str
+    client: Mapping[str, Any]
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+
+
+# --------------------------------------------------------------------------- #
+# Lado trabajador                                                             #
+# --------------------------------------------------------------------------- #
+def resolve(generator: str) -> Callable:
+    """Nombre de `GENERATORS` o `"modulo:funcion"` → función."""
+    target = GENERATORS.get(generator, generator)
+    module, sep, attr = target.partition(":")
+    if not sep:
+        raise KeyError(f"Generador desconocido: {generator!r}")
+    return getattr(importlib.import_module(module), attr)
+
+
+def _warm_worker(cwd: str) -> None:
+    os.chdir(cwd)
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    from employ_toolkit.core import doc_backends  # noqa: F401  (registra backends)
+    from employ_toolkit.core import pdf_styles
+    pdf_styles.stylesheet()                       # también registra las fuentes
+
+
+def _run_job(generator: str, client: Mapping[str, Any], args: tuple, kwargs: dict) -> Any:
+    return resolve(generator)(SimpleNamespace(**client), *args, **kwargs)
+
+
+# --------------------------------------------------------------------------- #
+# Granja                                                                      #
+# --------------------------------------------------------------------------- #
+def _context() -> mp.context.BaseContext:
+    if "forkserver" in mp.get_all_start_methods():
+        ctx = mp.get_context("forkserver")
+        ctx.set_forkserver_preload(list(WARM_MODULES))
+        return ctx
+    return mp.get_context("spawn")
+
+
+class RenderFarm:
+    """Pool fijo de procesos con las librerías de render ya cargadas."""
+
+    def __init__(self, workers: int | None = None, max_tasks_per_child: int | None = 25) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=_context(),
+            initializer=_warm_worker,
+            initargs=(os.getcwd(),),
+            max_tasks_per_child=max_tasks_per_child,
+        )
+
+    def submit(self, job: RenderJob) -> Future:
+        if job.generator not in GENERATORS and ":" not in job.generator:
+            raise KeyError(f"Generador desconocido: {job.generator!r}")
+        return self._pool.submit(_run_job, job.generator, dict(job.client),
+                                 tuple(job.args), dict(job.kwargs))
+
+    def render(self, jobs: Iterable[RenderJob]) -> list[Any]:
+        """
+        Ejecuta `jobs` en paralelo y devuelve sus resultados en el mismo
+        orden; un trabajo que falla deja su excepción en su posición.
+        """
+        futures = [self.submit(job) for job in jobs]
+        results: list[Any] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    def close(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "RenderFarm":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
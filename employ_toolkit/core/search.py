@@ -0,0 +1,209 @@
+# employ_toolkit/core/search.py
+"""
+Búsqueda de texto completo (SQLite FTS5)
+---------------------------------------
+Tabla virtual `search_index` con una fila por Client, Document y CVData,
+mantenida por triggers. El `rowid` codifica (tipo, id) para que los
+triggers de UPDATE/DELETE localicen la fila sin recorrer el índice.
+
+• `search()`          → resultados mixtos ordenados por bm25.
+• `search_clients()`  → clientes que coinciden por sus datos, sus
+                        documentos o su CV, ordenados por relevancia.
+"""
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel, Session, select
+
+from employ_toolkit.core.models import Client
+
+# Código de tipo embebido en el rowid: rowid = id * 4 + código
+KINDS = {"client": 1, "document": 2, "cv": 3}
+
+_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        kind UNINDEXED, ref_id UNINDEXED, client_id UNINDEXED, title, body,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    # ----- Client --------------------------------------------------------
+    """
+    CREATE TRIGGER IF NOT EXISTS search_client_ai AFTER INSERT ON client BEGIN
+        INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+        VALUES (new.id * 4 + 1, 'client', new.id, new.id, new.full_name,
+                new.id || ' ' || new.email || ' ' || new.profession || ' '
+                || new.phone || ' ' || new.disc_type);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_client_au AFTER UPDATE ON client BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+        INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+        VALUES (new.id * 4 + 1, 'client', new.id, new.id, new.full_name,
+                new.id || ' ' || new.email || ' ' || new.profession || ' '
+                || new.phone || ' ' || new.disc_type);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_client_ad AFTER DELETE ON client BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+    END
+    """,
+    # ----- Document ------------------------------------------------------
+    """
+    CREATE TRIGGER IF NOT EXISTS search_document_ai AFTER INSERT ON document BEGIN
+        INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+        VALUES (new.id * 4 + 2, 'document', new.id, new.client_id,
+                new.doc_type, new.path);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_document_au AFTER UPDATE ON document BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+        VALUES (new.id * 4 + 2, 'document', new.id, new.client_id,
+                new.doc_type, new.path);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_document_ad AFTER DELETE ON document BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+    END
+    """,
+    # ----- CVData --------------------------------------------------------
+    """
+    CREATE TRIGGER IF NOT EXISTS search_cv_ai AFTER INSERT ON cvdata BEGIN
+        INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+        VALUES (new.id * 4 + 3, 'cv', new.id, new.client_id, 'cv', new.json_blob);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_cv_au AFTER UPDATE ON cvdata BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+        INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+        VALUES (new.id * 4 + 3, 'cv', new.id, new.client_id, 'cv', new.json_blob);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_cv_ad AFTER DELETE ON cvdata BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+    END
+    """,
+]
+
+_BACKFILL = [
+    "DELETE FROM search_index",
+    """
+    INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+    SELECT id * 4 + 1, 'client', id, id, full_name,
+           id || ' ' || email || ' ' || profession || ' ' || phone || ' ' || disc_type
+    FROM client
+    """,
+    """
+    INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+    SELECT id * 4 + 2, 'document', id, client_id, doc_type, path FROM document
+    """,
+    """
+    INSERT INTO search_index(rowid, kind, ref_id, client_id, title, body)
+    SELECT id * 4 + 3, 'cv', id, client_id, 'cv', json_blob FROM cvdata
+    """,
+]
+
+
+# --------------------------------------------------------------------------- #
+# Esquema                                                                     #
+# --------------------------------------------------------------------------- #
+def install(conn: Connection) -> None:
+    """Crea la tabla FTS y sus triggers (idempotente)."""
+    for stmt in _DDL:
+        conn.exec_driver_sql(stmt)
+
+
+def rebuild(conn: Connection) -> None:
+    """Vuelve a poblar el índice desde las tablas de origen."""
+    for stmt in _BACKFILL:
+        conn.exec_driver_sql(stmt)
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _install_after_create(_metadata, conn, **_kw):
+    # Bases nuevas (y las de tests) obtienen el índice con create_all
+    install(conn)
+
+
+# --------------------------------------------------------------------------- #
+# Consultas                                                                   #
+# --------------------------------------------------------------------------- #
+@dataclass
+class SearchHit:
+    kind: str        # client | document | cv
+    ref_id: int
+    client_id: int
+    title: str
+    snippet: str
+    rank: float      # bm25: más negativo = más relevante
+
+
+def to_match_query(raw: str) -> str:
+    """Convierte texto libre en una consulta FTS5 segura (AND de prefijos)."""
+    tokens = re.findall(r"\w+", raw, flags=re.UNICODE)
+    return " ".join(f'"{tok}"*' for tok in tokens)
+
+
+# título (nombre, tipo de documento) pesa más que el cuerpo
+_RANK = "bm25(search_index, 0, 0, 0, 5.0, 1.0)"
+
+
+def search(
+    session: Session,
+    query: str,
+    *,
+    kinds: tuple[str, ...] | None = None,
+    limit: int = 20,
+) -> list[SearchHit]:
+    """Resultados de cualquier tipo, del más al menos relevante."""
+    match = to_match_query(query)
+    if not match:
+        return []
+    sql = f"""
+        SELECT kind, ref_id, client_id, title,
+               snippet(search_index, 4, '[', ']', '…', 8) AS snip,
+               {_RANK} AS rank
+        FROM search_index
+        WHERE search_index MATCH :match
+    """
+    params: dict = {"match": match, "limit": limit}
+    if kinds:
+        sql += " AND kind IN ({})".format(", ".join(f":k{i}" for i in range(len(kinds))))
+        params.update({f"k{i}": k for i, k in enumerate(kinds)})
+    sql += " ORDER BY rank LIMIT :limit"
+    rows = session.connection().execute(text(sql), params).all()
+    return [SearchHit(*row) for row in rows]
+
+
+def search_clients(session: Session, query: str, *, limit: int = 200) -> list[Client]:
+    """Clientes cuyo registro, documentos o CV coinciden con `query`."""
+    match = to_match_query(query)
+    if not match:
+        return []
+    rows = session.connection().execute(text(f"""
+        WITH hits AS MATERIALIZED (      -- bm25 no se admite dentro de MIN()
+            SELECT client_id, {_RANK} AS rank
+            FROM search_index
+            WHERE search_index MATCH :match
+        )
+        SELECT client_id, MIN(rank) AS best
+        FROM hits
+        GROUP BY client_id
+        ORDER BY best
+        LIMIT :limit
+    """), {"match": match, "limit": limit}).all()
+    ids = [row[0] for row in rows]
+    if not ids:
+        return []
+    by_id = {c.id: c for c in session.exec(select(Client).where(Client.id.in_(ids)))}
+    return [by_id[i] for i in ids if i in by_id]
@@ -0,0 +1,267 @@
+# employ_toolkit/core/step_cache.py
+"""
+Memoización persistente de pasos del WorkflowManager
+----------------------------------------------------
+Clave = nombre del paso + función (nombre y hash de su bytecode) + versión
+del generador + hash de sus entradas (contexto que recibe y kwargs). Si nada cambió, el paso devuelve
+el resultado guardado sin volver a generar PDF / PPTX / DOCX.
+
+• Valores: un pickle por entrada en `CACHE_DIR`.
+• Índice: `CACHE_DIR/index.sqlite` (tamaño, último uso, artefactos).
+• Artefactos: las `Path` del resultado se guardan con tamaño y mtime; si un
+  archivo desaparece o cambia, la entrada deja de valer.
+• Desalojo LRU cuando se supera `max_entries` o `max_bytes`.
+
+El hash de entradas es de contenido: los modelos SQLModel se hashean por
+sus campos sin los autogenerados (clave primaria, `created_at`…), las rutas
+por ruta+tamaño+mtime. Lo que no tiene forma canónica lanza `TypeError`
+(un `repr` con direcciones de memoria daría claves distintas cada vez); el
+WorkflowManager ejecuta entonces el paso sin caché.
+
+Editar el cuerpo de un paso cambia su clave sin tocar `version`; ésta sigue
+haciendo falta cuando cambia algo que el paso importa (plantillas, otros
+módulos).
+"""
+
+import dataclasses
+import functools
+import hashlib
+import inspect
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable, Iterator
+
+from sqlalchemy import inspect as sa_inspect
+from sqlmodel import SQLModel
+
+CACHE_DIR = Path("workspace") / ".step_cache"
+
+
+def step_version(version: str) -> Callable:
+    """Decorador: versión del generador (cambiarla invalida su caché)."""
+    def mark(func: Callable) -> Callable:
+        func.step_version = version
+        return func
+    return mark
+
+
+# --------------------------------------------------------------------------- #
+# Hash estable de entradas                                                    #
+# --------------------------------------------------------------------------- #
+def _canonical(obj: Any) -> Any:
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, Path):
+        try:
+            st = obj.stat()
+            return {"__path__": str(obj), "size": st.st_size, "mtime": st.st_mtime_ns}
+        except OSError:
+            return {"__path__": str(obj)}
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((_canonical(v) for v in obj), key=json.dumps)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, bytes):
+        return {"__bytes__": hashlib.sha256(obj).hexdigest()}
+    if isinstance(obj, SQLModel):
+        # fuera lo autogenerado: clave primaria y default_factory (created_at…)
+        fields = obj.model_dump(exclude=_generated_fields(type(obj)))
+        return {"__model__": type(obj).__qualname__, **_canonical(fields)}
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {"__dataclass__": type(obj).__qualname__,
+                **_canonical(dataclasses.asdict(obj))}
+    raise TypeError(f"Sin forma canónica para hashear: {type(obj).__qualname__}")
+
+
+def _generated_fields(model: type[SQLModel]) -> set[str]:
+    generated = {name for name, info in model.model_fields.items()
+                 if info.default_factory is not None}
+    mapper = sa_inspect(model, raiseerr=False)
+    if mapper is not None:
+        generated.update(column.key for column in mapper.primary_key)
+    return generated
+
+
+def stable_hash(obj: Any) -> str:
+    raw = json.dumps(_canonical(obj), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _code_hash(func: Callable) -> str | None:
+    """Hash del bytecode, constantes y nombres usados (incluidas funciones anidadas)."""
+    while isinstance(func, functools.partial):
+        func = func.func
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:                      # builtins, objetos invocables…
+        return None
+    h = hashlib.sha256()
+    stack = [code]
+    while stack:
+        c = stack.pop()
+        h.update(c.co_code)
+        h.update(json.dumps(c.co_names).encode())
+        for const in c.co_consts:
+            if isinstance(const, CodeType):
+                stack.append(const)
+            else:
+                try:                      # frozenset: orden estable
+                    h.update(json.dumps(_canonical(const)).encode())
+                except TypeError:         # Ellipsis, complex: repr determinista
+                    h.update(repr(const).encode())
+    return h.hexdigest()
+
+
+def _artifacts(value: Any) -> list[list]:
+    """Rutas existentes dentro del resultado, con tamaño y mtime."""
+    found: list[list] = []
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Path):
+            if item.exists():
+                st = item.stat()
+                found.append([str(item), st.st_size, st.st_mtime_ns])
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+    return found
+
+
+def _artifacts_intact(recorded: list[list]) -> bool:
+    for path, size, mtime in recorded:
+        try:
+            st = Path(path).stat()
+        except OSError:
+            return False
+        if st.st_size != size or st.st_mtime_ns != mtime:
+            return False
+    return True
+
+
+# --------------------------------------------------------------------------- #
+# Caché                                                                       #
+# --------------------------------------------------------------------------- #
+class StepCache:
+    """Caché en disco de resultados de pasos, con índice SQLite y LRU."""
+
+    def __init__(self, directory: Path | str = CACHE_DIR, *,
+                 max_entries: int = 2000, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # una conexión por caché (protegida por _lock): abrir/cerrar cada vez
+        # cuesta un checkpoint + fsync, más que el propio acierto
+        self._conn = sqlite3.connect(self.directory / "index.sqlite", timeout=10,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._db() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS entry (
+                    key TEXT PRIMARY KEY, step TEXT, size INTEGER,
+                    artifacts TEXT, created REAL, last_used REAL)
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS ix_entry_last_used ON entry(last_used)")
+
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        with self._conn:                  # commit / rollback
+            yield self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _file(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def key_for(name: str, func: Callable, context: dict, kwargs: dict,
+                version: str | None = None) -> str:
+        version = version or getattr(func, "step_version", "1")
+        ident = f"{getattr(func, '__module__', '?')}.{getattr(func, '__qualname__', func)!s}"
+        return stable_hash([name, ident, _code_hash(func), version, context, kwargs])
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """`(True, valor)` si hay una entrada válida; si no `(False, None)`."""
+        with self._lock, self._db() as db:
+            row = db.execute("SELECT artifacts FROM entry WHERE key = ?", (key,)).fetchone()
+            if row is not None and _artifacts_intact(json.loads(row[0])):
+                try:
+                    value = pickle.loads(self._file(key).read_bytes())
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    value = None
+                else:
+                    db.execute("UPDATE entry SET last_used = ? WHERE key = ?",
+                               (time.time(), key))
+                    self.hits += 1
+                    return True, value
+            if row is not None:
+                self._drop(db, [key])
+            self.misses += 1
+            return False, None
+
+    def put(self, key: str, step: str, value: Any) -> bool:
+        """Guarda `value`; devuelve False si no se puede serializar."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        now = time.time()
+        with self._lock, self._db() as db:
+            tmp = self._file(key).with_suffix(".tmp")
+            tmp.write_bytes(blob)
+            tmp.replace(self._file(key))
+            db.execute(
+                "INSERT OR REPLACE INTO entry VALUES (?, ?, ?, ?, ?, ?)",
+                (key, step, len(blob), json.dumps(_artifacts(value)), now, now),
+            )
+            self._evict(db)
+        return True
+
+    def clear(self) -> None:
+        with self._lock, self._db() as db:
+            self._drop(db, [k for (k,) in db.execute("SELECT key FROM entry")])
+
+    def stats(self) -> dict:
+        with self._lock, self._db() as db:
+            entries, size = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entry").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+
+    # ------------------------------------------------------------------ #
+    def _drop(self, db: sqlite3.Connection, keys: list[str]) -> None:
+        db.executemany("DELETE FROM entry WHERE key = ?", [(k,) for k in keys])
+        for key in keys:
+            self._file(key).unlink(missing_ok=True)
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        entries, size = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entry").fetchone()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+        stale = []
+        for key, entry_size in db.execute("SELECT key, size FROM entry ORDER BY last_used"):
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            stale.append(key)
+            entries -= 1
+            size -= entry_size
+        self._drop(db, stale)
@@ -1,11 +1,482 @@
+# employ_toolkit/core/storage.py
+"""
+Acceso a la base SQLite
+-----------------------
+• Un único `engine` por proceso, creado con un perfil de pragmas.
+• El perfil por defecto activa WAL: los lectores (tabla de clientes,
+  listas de documentos) no esperan a las escrituras de `Document`.
+• `configure_engine()` permite cambiar ruta o perfil (tests, batch,
+  benchmarks). El perfil también se elige con EMPLEABILIDAD_DB_PROFILE.
+• Sesiones: una por hilo (`session_registry`); `unit_of_work()` delimita
+  una transacción explícita. `pool_status()` reporta la espera en el pool.
+  Latencias, consultas lentas y N+1: ver `core.instrumentation`.
+• Caché LRU de lectura (`get_client`, `get_documents`) invalidada por los
+  eventos `after_flush` / `after_commit` de las filas afectadas.
+• Paginación por clave (`paginate_clients`, `paginate_documents`): cada
+  página cuesta lo mismo sin importar cuánto se haya avanzado.
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from sqlmodel import SQLModel, Session, create_engine
+from typing import Any, Callable, Hashable, Iterator
+
+from sqlalchemy import event, inspect as sa_inspect, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session as OrmSession, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from employ_toolkit.core import instrumentation, migrations
+from employ_toolkit.core.models import Client, Document
 
 DB_PATH = Path(__file__).parent.parent / "empleabilidad.db"
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
 
+
+# --------------------------------------------------------------------------- #
+# Perfiles de motor                                                           #
+# --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class EngineProfile:
+    """Pragmas que se aplican a cada conexión SQLite nueva."""
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"           # seguro con WAL, un fsync por checkpoint
+    cache_size_kib: int = 64 * 1024       # caché de páginas por conexión
+    mmap_size: int = 256 * 1024 * 1024    # lecturas vía memoria mapeada
+    busy_timeout_ms: int = 5_000          # espera antes de "database is locked"
+    temp_store: str = "MEMORY"
+    # Pool de conexiones (compartido por GUI e hilos de render)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+
+    def pragmas(self) -> list[str]:
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA cache_size=-{self.cache_size_kib}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            f"PRAGMA temp_store={self.temp_store}",
+        ]
+
+
+PROFILES: dict[str, EngineProfile] = {
+    # Concurrencia lectores/escritor (por defecto)
+    "wal": EngineProfile(),
+    # Comportamiento original de sqlite3 (rollback journal)
+    "legacy": EngineProfile(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        cache_size_kib=2_000,
+        mmap_size=0,
+        temp_store="DEFAULT",
+    ),
+}
+
+DEFAULT_PROFILE = os.environ.get("EMPLEABILIDAD_DB_PROFILE", "wal")
+
+
+def resolve_profile(profile: EngineProfile | str | None) -> EngineProfile:
+    if profile is None:
+        profile = DEFAULT_PROFILE
+    if isinstance(profile, str):
+        try:
+            return PROFILES[profile]
+        except KeyError:
+            raise ValueError(
+                f"Perfil de base de datos desconocido: {profile!r} "
+                f"(disponibles: {', '.join(PROFILES)})"
+            ) from None
+    return profile
+
+
+def install_pragmas(engine: Engine, profile: EngineProfile) -> None:
+    """Hook `connect`: ejecuta los pragmas del perfil en cada conexión."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        try:
+            for stmt in profile.pragmas():
+                cur.execute(stmt)
+        finally:
+            cur.close()
+
+
+# --------------------------------------------------------------------------- #
+# Pool con medición de espera                                                 #
+# --------------------------------------------------------------------------- #
+class _TimedQueuePool(QueuePool):
+    """QueuePool que acumula el tiempo de espera de cada checkout."""
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def connect(self):
+        t0 = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - t0
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+def make_engine(
+    path: Path | str = DB_PATH,
+    profile: EngineProfile | str | None = None,
+    *,
+    echo: bool = False,
+) -> Engine:
+    """Crea un engine SQLite con el perfil indicado (WAL por defecto)."""
+    profile = resolve_profile(profile)
+    new_engine = create_engine(
+        f"sqlite:///{path}",
+        echo=echo,
+        poolclass=_TimedQueuePool,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=profile.pool_timeout,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": profile.busy_timeout_ms / 1000,
+        },
+    )
+    install_pragmas(new_engine, profile)
+    return new_engine
+
+
+instrumentation.enable_from_env()    # sin EMPLEABILIDAD_SQL_TRACE no hace nada
+engine = make_engine()
+
+# Una sesión por hilo: la GUI y los hilos de render reutilizan conexiones
+SessionFactory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+session_registry = scoped_session(SessionFactory)
+_uow_state = threading.local()
+
+
+def bind_engine(new_engine: Engine) -> Engine:
+    """Apunta el engine global y las sesiones nuevas a `new_engine`."""
+    global engine
+    session_registry.remove()
+    engine = new_engine
+    SessionFactory.configure(bind=new_engine)
+    identity_cache.clear()
+    return new_engine
+
+
+def configure_engine(
+    path: Path | str | None = None,
+    profile: EngineProfile | str | None = None,
+) -> Engine:
+    """Reemplaza el engine global (p.ej. otra ruta o perfil) y lo devuelve."""
+    old = engine
+    bind_engine(make_engine(path or DB_PATH, profile))
+    old.dispose()
+    return engine
+
+
+# --------------------------------------------------------------------------- #
+# API pública                                                                 #
+# --------------------------------------------------------------------------- #
 def init_db() -> None:
+    """Crea las tablas que falten y aplica las migraciones pendientes."""
     SQLModel.metadata.create_all(engine)
+    migrations.migrate(engine)
 
 def get_session() -> Session:
-    return Session(engine)
+    """
+    Sesión nueva e independiente (`with get_session() as s:` la cierra al
+    salir sin tocar la del hilo). Para transacciones, `unit_of_work()`.
+    """
+    return SessionFactory()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Session]:
+    """
+    Transacción explícita sobre la sesión del hilo.
+    Commit al salir, rollback si hay excepción. Anidable: sólo el bloque
+    más externo confirma y devuelve la conexión al pool.
+    """
+    session = session_registry()
+    depth = getattr(_uow_state, "depth", 0)
+    _uow_state.depth = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            session.commit()
+    except BaseException:
+        if depth == 0:
+            session.rollback()
+        raise
+    finally:
+        _uow_state.depth = depth
+        if depth == 0:
+            session.close()
+
+
+def pool_status() -> dict:
+    """Ocupación del pool y tiempos de espera de checkout (ms)."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):      # p.ej. StaticPool en tests
+        return {"pool": pool.status()}
+    status = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    if isinstance(pool, _TimedQueuePool):
+        with pool._stats_lock:
+            status.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                wait_avg_ms=pool.wait_total / pool.checkouts * 1000 if pool.checkouts else 0.0,
+                wait_max_ms=pool.wait_max * 1000,
+            )
+    return status
+
+
+# --------------------------------------------------------------------------- #
+# Caché de lectura (Client / Document)                                        #
+# --------------------------------------------------------------------------- #
+class IdentityCache:
+    """LRU acotado de instancias desacopladas, con estadísticas."""
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.RLock()
+        self._generation = 0            # cambia con cada invalidación
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            generation = self._generation
+        value = loader()                # fuera del lock: I/O
+        with self._lock:
+            # si hubo un commit mientras cargábamos, el valor puede ser viejo
+            if generation == self._generation:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate(self, keys) -> None:
+        """
+        Elimina las entradas cuyo prefijo `(kind, id)` coincide (incluye
+        páginas como `(kind, id, cursor, limit)`); `(kind, None)` borra
+        todo ese tipo.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                if key[1] is None:
+                    stale = [k for k in self._data if k[0] == key[0]]
+                else:
+                    stale = [k for k in self._data if k[:2] == key]
+                for k in stale:
+                    del self._data[k]
+                self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+identity_cache = IdentityCache()
+
+
+def _affected_keys(obj) -> set:
+    if isinstance(obj, Client):
+        return {("client", obj.id)}
+    if isinstance(obj, Document):
+        keys = {("documents", obj.client_id)}
+        history = sa_inspect(obj).attrs.client_id.history
+        keys.update(("documents", old) for old in history.deleted or ())
+        return keys
+    return set()
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _cache_after_flush(session, _flush_context):
+    keys = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        keys |= _affected_keys(obj)
+    if keys:
+        identity_cache.invalidate(keys)
+        session.info.setdefault("cache_keys", set()).update(keys)
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _cache_bulk_statements(state):
+    # delete()/update() masivos no pasan por el flush: invalidar por tipo
+    if (state.is_delete or state.is_update) and state.bind_mapper is not None:
+        kind = {Client: "client", Document: "documents"}.get(state.bind_mapper.class_)
+        if kind:
+            session = state.session
+            session.info.setdefault("cache_keys", set()).add((kind, None))
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _cache_after_commit(session):
+    keys = session.info.pop("cache_keys", None)
+    if keys:
+        identity_cache.invalidate(keys)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _cache_after_rollback(session):
+    session.info.pop("cache_keys", None)
+
+
+def get_client(client_id: int) -> Client | None:
+    """Client por id, vía caché (instancia desacoplada, sólo lectura)."""
+    def load():
+        with SessionFactory() as s:
+            return s.get(Client, client_id)
+    return identity_cache.get_or_load(("client", client_id), load)
+
+
+def get_documents(client_id: int) -> tuple[Document, ...]:
+    """Documentos de un cliente, más recientes primero, vía caché."""
+    def load():
+        with SessionFactory() as s:
+            return tuple(s.exec(
+                select(Document)
+                .where(Document.client_id == client_id)
+                .order_by(Document.created_at.desc())
+            ).all())
+    return identity_cache.get_or_load(("documents", client_id), load)
+
+
+def cache_stats() -> dict:
+    return identity_cache.stats()
+
+
+# --------------------------------------------------------------------------- #
+# Paginación por clave (keyset / seek)                                        #
+# --------------------------------------------------------------------------- #
+@dataclass
+class Page:
+    items: list = field(default_factory=list)
+    next_cursor: str | None = None      # opaco; None = no hay más
+
+
+# Columnas de orden permitidas: todas respaldadas por un índice
+# (id = rowid; los índices secundarios incluyen el rowid como desempate).
+CLIENT_SORTS = {
+    "id": (Client.id,),
+    "full_name": (Client.full_name, Client.id),
+}
+
+
+def _encode_cursor(values: list) -> str:
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> list:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Cursor de paginación inválido: {cursor!r}") from exc
+
+
+def _seek(stmt, columns, values: list | None, descending: bool, limit: int):
+    """Aplica WHERE (cols) < / > (values), ORDER BY y LIMIT limit+1."""
+    if values is not None:
+        key = tuple_(*columns)
+        stmt = stmt.where(key < tuple_(*values) if descending else key > tuple_(*values))
+    order = [c.desc() if descending else c.asc() for c in columns]
+    return stmt.order_by(*order).limit(limit + 1)
+
+
+def _page(rows: list, columns, limit: int) -> Page:
+    if len(rows) <= limit:
+        return Page(list(rows), None)
+    rows = rows[:limit]
+    last = rows[-1]
+    return Page(list(rows), _encode_cursor([getattr(last, c.key) for c in columns]))
+
+
+def paginate_clients(
+    cursor: str | None = None,
+    *,
+    limit: int = 100,
+    order_by: str = "id",
+    descending: bool = True,
+) -> Page:
+    """Página de clientes; pasar `page.next_cursor` para la siguiente."""
+    try:
+        columns = CLIENT_SORTS[order_by]
+    except KeyError:
+        raise ValueError(
+            f"Orden no indexado: {order_by!r} (disponibles: {', '.join(CLIENT_SORTS)})"
+        ) from None
+    with SessionFactory() as s:
+        values = _decode_cursor(cursor) if cursor is not None else None
+        rows = s.exec(_seek(select(Client), columns, values, descending, limit)).all()
+    return _page(rows, columns, limit)
+
+
+def paginate_documents(
+    client_id: int, cursor: str | None = None, *, limit: int = 100
+) -> Page:
+    """Documentos de un cliente (más recientes primero), vía caché."""
+    columns = (Document.created_at, Document.id)
+
+    def load():
+        values = None
+        if cursor is not None:
+            created_at, doc_id = _decode_cursor(cursor)
+            values = [datetime.fromisoformat(created_at), doc_id]
+        stmt = select(Document).where(Document.client_id == client_id)
+        with SessionFactory() as s:
+            rows = s.exec(_seek(stmt, columns, values, True, limit)).all()
+        return _page(rows, columns, limit)
+
+    return identity_cache.get_or_load(("documents", client_id, cursor, limit), load)
@@ -1,12 +1,411 @@
-from typing import Dict, Any, Callable
+# employ_toolkit/core/workflow.py
+"""
+WorkflowManager
+---------------
+Encadena pasos (sub-módulos) y comparte sus resultados.
+
+• `run_step()`  → ejecuta un paso ya mismo (modo original, secuencial).
+• `add_step()` + `run()` → los pasos declaran `depends_on` y el gestor los
+  ejecuta como un DAG: todo paso cuyas dependencias terminaron se lanza en
+  el pool (hilos o procesos), así que la duración total es la de la cadena
+  más larga y no la suma de todos los pasos.
+
+Determinismo: cada paso recibe un `dict` propio con los resultados de sus
+dependencias (directas e indirectas), nunca el contexto compartido, y
+`context` se rellena en orden topológico (el de registro) al terminar.
+Los pasos `interactive=True` (los que usan `input()`) se ejecutan en el
+hilo que llama a `run()` y nunca a la vez que otro paso.
+
+Con `WorkflowManager(cache=StepCache())` los pasos se memoizan por nombre,
+versión del generador y hash de sus entradas (ver `core.step_cache`). Los
+interactivos no se memoizan salvo `cache=True`: sus respuestas no están en
+el contexto.
+
+Con `checkpoint=True` cada resultado se guarda en SQLite al terminar su paso
+(ver `core.checkpoints`); `resume(run_id)` recarga el contexto de una
+ejecución interrumpida y sólo ejecuta lo que falta.
+
+Con `profile=True` cada paso guarda tiempo real, CPU y pico de memoria en
+`profiles`; `summary()` y `write_trace()` los exportan (ver `core.profiling`).
+
+Límites de tiempo (ver `core.cancellation`): `add_step(timeout=…)` o
+`WorkflowManager(step_timeout=…)`. Si la función del paso acepta `cancel`,
+recibe un `CancellationToken`. Al vencer, el paso falla con `StepTimeout`;
+con `isolate=True` (o `executor="process"`) corre en un proceso propio que
+se mata, sin él el hilo colgado queda abandonado. Con `run(keep_going=True)`
+un fallo no detiene el flujo: se anota en `errors`, sus dependientes se
+omiten y el resto sigue.
+"""
+
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict
+
+from employ_toolkit.core import checkpoints
+from employ_toolkit.core.cancellation import (
+    CancellationToken, StepTimeout, accepts_cancel, guard, run_isolated,
+)
+from employ_toolkit.core.profiling import (
+    StepProfile, cached_profile, profiled_call, summary_table, write_chrome_trace,
+)
+from employ_toolkit.core.step_cache import StepCache
+
+
+class WorkflowError(Exception):
+    """Fallo de un paso del flujo (el original va en `__cause__`)."""
+
+    def __init__(self, step: str, message: str) -> None:
+        super().__init__(f"[{step}] {message}")
+        self.step = step
+
+
+@dataclass
+class Step:
+    name: str
+    func: Callable[..., Any]
+    depends_on: tuple[str, ...] = ()
+    kwargs: dict = field(default_factory=dict)
+    interactive: bool = False
+    cache: bool = True
+    version: str | None = None      # por defecto `func.step_version` o "1"
+    timeout: float | None = None    # segundos; None = sin límite
+    isolate: bool = False           # proceso propio (se puede matar)
+
+
+def _invoke(func: Callable[..., Any], context: dict, kwargs: dict,
+            profile_as: str | None = None,
+            token: CancellationToken | None = None) -> Any:
+    # nivel de módulo: tiene que poder enviarse a un ProcessPoolExecutor
+    if token is not None and accepts_cancel(func):
+        kwargs = {**kwargs, "cancel": token}
+    if profile_as is not None:
+        return profiled_call(profile_as, func, context, kwargs)   # (valor, perfil)
+    return func(context, **kwargs)
+
 
 class WorkflowManager:
     """Encadena pasos (sub-módulos) y comparte contexto."""
-    def __init__(self) -> None:
+    def __init__(self, cache: StepCache | None = None, checkpoint: bool = False,
+                 profile: bool = False, step_timeout: float | None = None) -> None:
         self.context: Dict[str, Any] = {}
+        self.steps: Dict[str, Step] = {}
+        self.cache = cache
+        self.checkpoint = checkpoint
+        self.run_id: str | None = None
+        self._restored: set[str] = set()
+        self.profile = profile
+        self.profiles: list[StepProfile] = []
+        self.step_timeout = step_timeout
+        self.errors: Dict[str, BaseException] = {}
+        self._tokens: Dict[str, CancellationToken] = {}
+        self._lock = threading.RLock()
 
-    def run_step(self, name: str, func: Callable[..., Any], **kwargs) -> Any:
-        print(f"▶ Ejecutando {name}…")
-        output = func(self.context, **kwargs)
-        self.context[name] = output
+    # ------------------------------------------------------------------ #
+    # Modo secuencial                                                    #
+    # ------------------------------------------------------------------ #
+    def run_step(self, name: str, func: Callable[..., Any], *,
+                 use_cache: bool = True, cache_version: str | None = None,
+                 **kwargs) -> Any:
+        with self._lock:
+            if name in self._restored:          # terminado antes de reanudar
+                print(f"↻ {name} (checkpoint)")
+                return self.context[name]
+            snapshot = dict(self.context)
+        step = Step(name, func, kwargs=kwargs, cache=use_cache, version=cache_version)
+        # su propio resultado anterior no cuenta como entrada
+        key, hit, output = self._lookup(
+            step, {k: v for k, v in snapshot.items() if k != name})
+        if not hit:
+            print(f"▶ Ejecutando {name}…")
+            output = self._unwrap(name, lambda: _invoke(func, snapshot, kwargs,
+                                                        self._profile_as(name)))
+            self._store(step, key, output)
+        with self._lock:
+            self.context[name] = output
+        self._checkpoint(name, output)
+        return output
+
+    # ------------------------------------------------------------------ #
+    # Perfil                                                             #
+    # ------------------------------------------------------------------ #
+    def summary(self) -> str:
+        """Tabla de tiempos y memoria por paso (requiere `profile=True`)."""
+        return summary_table(self.profiles)
+
+    def write_trace(self, path) -> Any:
+        """Exporta los perfiles como trace-event JSON de Chrome."""
+        return write_chrome_trace(self.profiles, path)
+
+    def _profile_as(self, name: str) -> str | None:
+        return name if self.profile else None
+
+    def _unwrap(self, name: str, call: Callable[[], Any]) -> Any:
+        """Ejecuta `call` y separa el perfil del resultado si se perfila."""
+        try:
+            output = call()
+        except BaseException as exc:
+            profile = getattr(exc, "step_profile", None)
+            if profile is not None:
+                with self._lock:
+                    self.profiles.append(profile)
+            raise
+        if not self.profile:
+            return output
+        output, profile = output
+        with self._lock:
+            self.profiles.append(profile)
         return output
+
+    # ------------------------------------------------------------------ #
+    # Checkpoints                                                        #
+    # ------------------------------------------------------------------ #
+    def resume(self, run_id: str, **run_kwargs) -> Dict[str, Any]:
+        """
+        Recarga el contexto guardado de `run_id` y continúa: con pasos
+        registrados (`add_step`) ejecuta los que faltan; con `run_step`,
+        los ya terminados devuelven su resultado sin ejecutarse.
+        """
+        restored = checkpoints.load(run_id)
+        self.checkpoint = True
+        self.run_id = checkpoints.start_run(run_id)
+        with self._lock:
+            self.context.update(restored)
+            self._restored.update(restored)
+        print(f"↻ Reanudando {run_id}: {len(restored)} paso(s) ya terminados")
+        if self.steps:
+            self.run(**run_kwargs)
+        return dict(self.context)
+
+    def _checkpoint(self, name: str, value: Any) -> None:
+        if not self.checkpoint:
+            return
+        with self._lock:
+            if self.run_id is None:
+                self.run_id = checkpoints.start_run()
+                print(f"• Ejecución {self.run_id} (reanudar con --resume {self.run_id})")
+        checkpoints.save(self.run_id, name, value)
+
+    # ------------------------------------------------------------------ #
+    # DAG                                                                #
+    # ------------------------------------------------------------------ #
+    def add_step(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: tuple[str, ...] | list[str] = (),
+        *,
+        interactive: bool = False,
+        cache: bool | None = None,
+        version: str | None = None,
+        timeout: float | None = None,
+        isolate: bool = False,
+        **kwargs,
+    ) -> Step:
+        """
+        Registra un paso; las dependencias pueden registrarse después.
+        `timeout` (s) no aplica a los interactivos: sólo avisa por el token.
+        """
+        if name in self.steps:
+            raise ValueError(f"Paso duplicado: {name!r}")
+        step = Step(name, func, tuple(depends_on), kwargs, interactive,
+                    cache=not interactive if cache is None else cache, version=version,
+                    timeout=self.step_timeout if timeout is None else timeout,
+                    isolate=isolate)
+        self.steps[name] = step
+        return step
+
+    def order(self) -> list[str]:
+        """Orden topológico estable (respeta el orden de registro)."""
+        for step in self.steps.values():
+            missing = [d for d in step.depends_on
+                       if d not in self.steps and d not in self.context]
+            if missing:
+                raise ValueError(f"{step.name!r} depende de pasos inexistentes: {missing}")
+
+        done, result = set(self.context), []
+        remaining = [n for n in self.steps if n not in done]
+        while remaining:
+            ready = [n for n in remaining if set(self.steps[n].depends_on) <= done]
+            if not ready:
+                raise ValueError(f"Dependencias circulares entre: {remaining}")
+            result.append(ready[0])
+            done.add(ready[0])
+            remaining.remove(ready[0])
+        return result
+
+    def ancestors(self, name: str) -> list[str]:
+        """Dependencias directas e indirectas de `name`, en orden topológico."""
+        seen: set[str] = set()
+        stack = list(self.steps[name].depends_on) if name in self.steps else []
+        while stack:
+            dep = stack.pop()
+            if dep not in seen:
+                seen.add(dep)
+                stack.extend(self.steps[dep].depends_on if dep in self.steps else ())
+        return [n for n in (*self.context, *self.order()) if n in seen]
+
+    def run(self, max_workers: int | None = None, executor: str = "thread",
+            keep_going: bool = False) -> Dict[str, Any]:
+        """
+        Ejecuta los pasos pendientes respetando sus dependencias.
+        `executor`: "thread" (por defecto) o "process" (funciones y
+        resultados deben poder serializarse con pickle).
+        `keep_going`: un paso que falla no corta el flujo (ver `errors`);
+        el resultado sólo incluye los pasos que terminaron.
+        """
+        order = self.order()
+        pool_cls = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}[executor]
+        results: Dict[str, Any] = {}
+        keys: Dict[str, str | None] = {}
+        failed: set[str] = set()
+        with self._lock:
+            known = dict(self.context)
+            self.errors.clear()
+        pending = list(order)
+        running: Dict[Future, str] = {}
+        timed_out = False               # algún hilo colgado venció su plazo
+
+        def inputs(name: str) -> dict:
+            merged = {**known, **results}
+            return {dep: merged[dep] for dep in self.ancestors(name)}
+
+        def fail(name: str, exc: WorkflowError) -> None:
+            nonlocal timed_out
+            timed_out = timed_out or isinstance(exc.__cause__, StepTimeout)
+            if not keep_going:
+                raise exc
+            print(f"✗ {exc}")
+            failed.add(name)
+            self.errors[name] = exc
+
+        pool = pool_cls(max_workers=max_workers)
+        try:
+            while pending or running:
+                for name in list(pending):      # en orden: la omisión se propaga
+                    broken = [d for d in self.steps[name].depends_on if d in failed]
+                    if broken:
+                        pending.remove(name)
+                        fail(name, WorkflowError(name, f"omitido: falló {broken[0]!r}"))
+                ready = [n for n in pending
+                         if all(d in results or d in known
+                                for d in self.steps[n].depends_on)]
+                hits = False
+                for name in ready:
+                    if name in keys:            # ya consultado en otra vuelta
+                        continue
+                    keys[name], hit, value = self._lookup(self.steps[name], inputs(name))
+                    if hit:
+                        pending.remove(name)
+                        results[name] = value
+                        self._checkpoint(name, value)
+                        hits = True
+                if hits:
+                    continue
+                # Un paso interactivo espera a que el pool quede vacío
+                inline = next((n for n in ready if self.steps[n].interactive), None)
+                if inline is not None and not running:
+                    pending.remove(inline)
+                    try:
+                        results[inline] = self._execute_inline(inline, inputs(inline))
+                    except WorkflowError as exc:
+                        fail(inline, exc)
+                        continue
+                    self._store(self.steps[inline], keys[inline], results[inline])
+                    self._checkpoint(inline, results[inline])
+                    continue
+                for name in ready:
+                    if self.steps[name].interactive or inline is not None:
+                        continue
+                    pending.remove(name)
+                    running[self._submit(pool, name, inputs(name),
+                                         isolate=executor == "process")] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = self._collect(name, future)
+                    except WorkflowError as exc:
+                        fail(name, exc)
+                        continue
+                    self._store(self.steps[name], keys[name], results[name])
+                    self._checkpoint(name, results[name])
+        except BaseException as exc:
+            for future in running:
+                future.cancel()
+            for token in self._tokens.values():
+                token.cancel()
+            if self.run_id is not None:
+                checkpoints.finish(self.run_id, exc)
+            raise
+        finally:
+            self._tokens.clear()
+            # un hilo colgado que venció su plazo no se espera
+            pool.shutdown(wait=not timed_out, cancel_futures=True)
+            self._publish(order, results)
+        if self.run_id is not None:
+            checkpoints.finish(self.run_id, next(iter(self.errors.values()), None))
+        return {n: results[n] for n in order if n in results}
+
+    # ------------------------------------------------------------------ #
+    # Ejecución de un paso                                               #
+    # ------------------------------------------------------------------ #
+    def _lookup(self, step: Step, context: dict) -> tuple[str | None, bool, Any]:
+        """(clave, acierto, valor) en la caché; clave None si no aplica."""
+        if self.cache is None or not step.cache:
+            return None, False, None
+        try:
+            key = StepCache.key_for(step.name, step.func, context, step.kwargs, step.version)
+        except TypeError as exc:           # entradas sin hash estable
+            print(f"• {step.name}: sin caché ({exc})")
+            return None, False, None
+        hit, value = self.cache.get(key)
+        if hit:
+            print(f"✓ {step.name} (sin cambios, desde caché)")
+            if self.profile:
+                with self._lock:
+                    self.profiles.append(cached_profile(step.name))
+        return key, hit, value
+
+    def _store(self, step: Step, key: str | None, value: Any) -> None:
+        if key is not None:
+            self.cache.put(key, step.name, value)
+
+    def _submit(self, pool: Executor, name: str, context: dict,
+                isolate: bool = False) -> Future:
+        step = self.steps[name]
+        token = self._tokens[name] = CancellationToken(step.timeout)
+        args = (step.func, context, step.kwargs, self._profile_as(name), token)
+        print(f"▶ Ejecutando {name}…")
+        # con plazo en un pool de procesos no hay forma de matar sólo a ese
+        # trabajador: el paso pasa a un proceso propio
+        if step.isolate or (isolate and step.timeout is not None):
+            return run_isolated(name, _invoke, args, step.timeout, token)
+        return guard(pool.submit(_invoke, *args), name, step.timeout, token)
+
+    def _execute_inline(self, name: str, context: dict) -> Any:
+        step = self.steps[name]
+        token = CancellationToken(step.timeout)
+        print(f"▶ Ejecutando {name}…")
+        try:
+            return self._unwrap(name, lambda: _invoke(step.func, context, step.kwargs,
+                                                      self._profile_as(name), token))
+        except Exception as exc:
+            raise WorkflowError(name, str(exc)) from exc
+
+    def _collect(self, name: str, future: Future) -> Any:
+        try:
+            return self._unwrap(name, future.result)
+        except Exception as exc:
+            raise WorkflowError(name, str(exc)) from exc
+
+    def _publish(self, order: list[str], results: Dict[str, Any]) -> None:
+        # context en orden topológico, independiente del orden de llegada
+        with self._lock:
+            for name in order:
+                if name in results:
+                    self.context[name] = results[name]
@@ -9,7 +9,6 @@ ATS & Plataformas de Empleo
 • «Exportar Guía PDF» crea el PDF y lo registra en Documentos (mód. 2)
 """
 
-from datetime import date
 from typing import Dict, Any
 
 from PySide6.QtCore import Qt
@@ -21,8 +20,7 @@ from PySide6.QtWidgets import (
 from employ_toolkit.gui.forms.linkedin_widget import LinkedInWidget
 from employ_toolkit.gui.forms.generic_ats_widget import GenericATSWidget   # 🆕
 from employ_toolkit.modules.ats_guides import generate_ats_pdf
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.registry import register_document
 
 PLATFORMS = [
     "LinkedIn",                                  # 🔗 Perfil top
@@ -148,13 +146,8 @@ class ATSForm(QDialog):
         pdf_path = generate_ats_pdf(self.client, self.data)
 
         # registrar en Documentos
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=2,
-                doc_type="ats_pdf", path=str(pdf_path),
-                created_at=date.today(),
-            ))
-            s.commit()
+        register_document(self.client.id, module=2,
+                          doc_type="ats_pdf", path=pdf_path)
 
         QMessageBox.information(self, "PDF creado",
                                 f"Guía exportada: {pdf_path.name}")
@@ -1,5 +1,4 @@
 # employ_toolkit/gui/forms/brand_canvas_form.py
-from datetime import date
 
 from PySide6.QtWidgets import (
     QDialog,
@@ -10,8 +9,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules import brand_canvas
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 class BrandCanvasForm(QDialog):
@@ -65,16 +63,8 @@ class BrandCanvasForm(QDialog):
         result = brand_canvas.generate_brand_canvas(self.client, answers)
 
         # Registra documento en la base de datos
-        with get_session() as s:
-            doc = Document(
-                client_id=self.client.id,
-                module=1,
-                doc_type="brand_canvas",
-                path=str(result["pdf"]),
-                created_at=date.today(),
-            )
-            s.add(doc)
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="brand_canvas", path=result["pdf"])
 
         QMessageBox.information(
             self, "Éxito", "BrandCanvas PDF generado y registrado."
@@ -1,10 +1,8 @@
-from datetime import date
 from PySide6.QtWidgets import (
     QDialog, QFormLayout, QLineEdit, QTextEdit, QPushButton, QMessageBox, QCheckBox
 )
 from employ_toolkit.modules import personal_brand
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 class BrandStrategyForm(QDialog):
@@ -56,13 +54,8 @@ class BrandStrategyForm(QDialog):
         }
         pdf_path = personal_brand.generate_brand_strategy_pdf(self.client, data)
 
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=1,
-                doc_type="brand_strategy", path=str(pdf_path),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="brand_strategy", path=pdf_path)
 
         QMessageBox.information(self, "PDF creado", pdf_path.name)
         self.accept()
@@ -10,7 +10,6 @@ Mensajes en frío
 """
 
 from pathlib import Path
-from datetime import date
 import uuid
 from typing import Dict
 
@@ -21,8 +20,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules.cold_msg_guides import generate_cold_pdf
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.registry import register_document
 
 AUDIENCES = {
     "Recruiter / Headhunter":
@@ -131,11 +129,7 @@ class ColdMessageForm(QDialog):
                                  "Añade al menos un mensaje personalizado.")
             return
         pdf = generate_cold_pdf(self.client, self.notes)
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=2,
-                doc_type="cold_msg_pdf", path=str(pdf),
-                created_at=date.today()))
-            s.commit()
+        register_document(self.client.id, module=2,
+                          doc_type="cold_msg_pdf", path=pdf)
         QMessageBox.information(self, "PDF creado", f"Guía exportada: {pdf.name}")
         self.accept()
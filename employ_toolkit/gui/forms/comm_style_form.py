@@ -1,4 +1,3 @@
-from datetime import date
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QListWidget,
@@ -6,8 +5,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules.comm_style import generate_comm_style_pdf, DISC_DESCRIPTIONS
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.registry import register_document
 
 
 class CommStyleForm(QDialog):
@@ -86,13 +84,8 @@ class CommStyleForm(QDialog):
         category = self.cmb_cat.currentText()
         pdf_path = generate_comm_style_pdf(self.client, category, self.notes)
 
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=3,
-                doc_type="comm_style", path=str(pdf_path),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=3,
+                          doc_type="comm_style", path=pdf_path)
 
         QMessageBox.information(self, "PDF creado",
                                 f"Guía exportada: {pdf_path.name}")
@@ -1,12 +1,10 @@
-from datetime import date
 from PySide6.QtWidgets import (
     QDialog, QFormLayout, QSpinBox, QPushButton,
     QCheckBox, QHBoxLayout, QWidget, QMessageBox
 )
 
 from employ_toolkit.modules import content_plan
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import documents
 
 
 class ContentPlanForm(QDialog):
@@ -79,17 +77,12 @@ class ContentPlanForm(QDialog):
 
         paths = content_plan.generate_content_plan(self.client, params)   # {'docx':..., 'xlsx':...}
 
-        # Registrar en la base de documentos
-        with get_session() as s:
-            for kind, path in paths.items():       # kind = 'docx' | 'xlsx'
-                s.add(Document(
-                    client_id=self.client.id,
-                    module=1,
-                    doc_type=f"content_plan_{kind}",
-                    path=str(path),
-                    created_at=date.today()
-                ))
-            s.commit()
+        # Registrar en la base de documentos (una sola transacción)
+        documents.register_many(
+            self.client.id, module=1,
+            items=[(f"content_plan_{kind}", path)       # kind = 'docx' | 'xlsx'
+                   for kind, path in paths.items()],
+        )
 
         QMessageBox.information(
             self,
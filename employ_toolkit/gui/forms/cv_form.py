@@ -1,5 +1,4 @@
 from pathlib import Path
-from datetime import date
 import uuid
 import textwrap
 from typing import Dict, Any, List
@@ -14,8 +13,8 @@ from PySide6.QtWidgets import (
 from docx import Document as Docx
 from docx.shared import Pt
 
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
+from employ_toolkit.core import cv_versions
 
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -69,6 +68,7 @@ class CVForm(QDialog):
         form.addRow("Premios / Publicaciones", self.extras)
 
         main.addLayout(form)
+        self._load_last_version()
 
         gen_btn = QPushButton("Generar DOCX")
         gen_btn.clicked.connect(self._generate)
@@ -82,6 +82,22 @@ class CVForm(QDialog):
         QMessageBox.information(self, "Prompt copiado",
                                 "Se abrió ChatGPT y el prompt está en tu portapapeles.")
 
+    def _load_last_version(self):
+        """Precarga el formulario con la última versión guardada del CV."""
+        last = cv_versions.load_version(self.client.id)
+        if not last:
+            return
+        fields = {
+            "nombre": self.name, "contacto": self.contact, "titulo": self.title,
+            "resumen": self.summary, "skills": self.skills, "experiencia": self.exp,
+            "educacion": self.edu, "certs": self.certs, "idiomas": self.langs,
+            "extras": self.extras,
+        }
+        for key, widget in fields.items():
+            if key in last:
+                (widget.setText if isinstance(widget, QLineEdit)
+                 else widget.setPlainText)(last[key])
+
     def _collect(self) -> Dict[str, str]:
         return dict(
             nombre=self.name.text().strip(),
@@ -105,7 +121,7 @@ class CVForm(QDialog):
             return
 
         docx_path = self._build_docx(data)
-        self._save_in_db(docx_path)
+        self._save_in_db(docx_path, data)
 
         QMessageBox.information(self, "CV creado", f"DOCX: {docx_path.name}")
         self.accept()
@@ -166,11 +182,7 @@ class CVForm(QDialog):
         return path
 
     # ------------ DB register ----------
-    def _save_in_db(self, docx_path: Path):
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id,
-                module=2, doc_type="cv_docx",
-                path=str(docx_path), created_at=date.today()
-            ))
-            s.commit()
+    def _save_in_db(self, docx_path: Path, data: Dict[str, str]):
+        register_document(self.client.id, module=2,
+                          doc_type="cv_docx", path=docx_path)
+        cv_versions.save_version(self.client.id, data, docx_path=str(docx_path))
@@ -9,7 +9,6 @@ Competencias DISC  –  Módulo 3-B
   marcadas y registra el documento en la tabla documents (mód. 3).
 """
 
-from datetime import date
 from pathlib import Path
 import uuid
 
@@ -21,8 +20,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules.disc_comp import generate_disc_comp_pdf
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.registry import register_document
 
 # --- Tabla base de competencias ------------------------------------------ #
 BASE_COMP = {
@@ -233,13 +231,8 @@ class DISCCompForm(QDialog):
             self.cmb_secondary.currentText(), sel_secondary
         )
 
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=3,
-                doc_type="disc_competencies", path=str(pdf_path),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=3,
+                          doc_type="disc_competencies", path=pdf_path)
 
         QMessageBox.information(self, "PDF creado",
                                 f"Informe exportado: {pdf_path.name}")
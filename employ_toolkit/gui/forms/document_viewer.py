@@ -7,14 +7,17 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QDesktopServices
 
-from sqlmodel import select, delete
-from employ_toolkit.core.storage import get_session
+from sqlmodel import delete, select
+from employ_toolkit.core.storage import paginate_documents, unit_of_work
+from employ_toolkit.core.registry import flush_documents
 from employ_toolkit.core.models import Document
 
 
 class DocumentListDialog(QDialog):
     """Lista (y ahora permite eliminar) los documentos de un cliente."""
 
+    PAGE_SIZE = 100
+
     # ------------------------------------------------------------------ #
     def __init__(self, client, parent=None):
         super().__init__(parent)
@@ -41,7 +44,12 @@ class DocumentListDialog(QDialog):
         btn_close = QPushButton("Cerrar")
         btn_close.clicked.connect(self.accept)
 
+        self.btn_more = QPushButton("⬇ Cargar más")
+        self.btn_more.setVisible(False)
+        self.btn_more.clicked.connect(self._load_next_page)
+
         btn_box.addWidget(self.btn_delete)
+        btn_box.addWidget(self.btn_more)
         btn_box.addStretch()
         btn_box.addWidget(btn_close)
         main.addLayout(btn_box)
@@ -53,22 +61,31 @@ class DocumentListDialog(QDialog):
     # Cargar / refrescar lista                                           #
     # ------------------------------------------------------------------ #
     def _load_documents(self):
-        """Llena la QListWidget con los documentos del cliente."""
+        """Llena la QListWidget con la primera página de documentos."""
         self.list_widget.clear()
-        with get_session() as s:
-            docs = s.exec(
-                select(Document).where(Document.client_id == self.client.id)
-                .order_by(Document.created_at.desc())
-            ).all()
+        flush_documents()   # incluir registros aún en el buffer
+        page = paginate_documents(self.client.id, limit=self.PAGE_SIZE)
 
-        if not docs:
+        if not page.items:
             self.list_widget.addItem("Sin documentos aún.")
             self.list_widget.setEnabled(False)
             self.btn_delete.setEnabled(False)
+            self.btn_more.setVisible(False)
             return
 
         self.list_widget.setEnabled(True)
-        for doc in docs:
+        self._append_page(page)
+
+    def _load_next_page(self):
+        if self._cursor is not None:
+            self._append_page(
+                paginate_documents(self.client.id, self._cursor, limit=self.PAGE_SIZE)
+            )
+
+    def _append_page(self, page):
+        self._cursor = page.next_cursor
+        self.btn_more.setVisible(page.next_cursor is not None)
+        for doc in page.items:   # caché, más recientes primero
             item = QListWidgetItem(
                 f"[{doc.created_at:%Y-%m-%d}]  {doc.doc_type}  →  {Path(doc.path).name}"
             )
@@ -105,18 +122,23 @@ class DocumentListDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
 
-        # 1) Borrar archivo físico
-        if file_path.exists():
+        # 1) Borrar registro DB (y el archivo sólo si nadie más lo usa:
+        #    un entregable reutilizado puede estar en varios registros)
+        flush_documents()
+        with unit_of_work() as s:
+            path = s.exec(select(Document.path).where(Document.id == doc_id)).first()
+            shared = s.exec(
+                select(Document.id).where(Document.path == path, Document.id != doc_id)
+            ).first() is not None
+            s.exec(delete(Document).where(Document.id == doc_id))
+
+        # 2) Borrar archivo físico
+        if not shared and file_path.exists():
             try:
                 file_path.unlink()
             except Exception as exc:
                 QMessageBox.warning(self, "Error",
                                      f"No se pudo borrar el archivo:\n{exc}")
 
-        # 2) Borrar registro DB
-        with get_session() as s:
-            s.exec(delete(Document).where(Document.id == doc_id))
-            s.commit()
-
         # 3) Refrescar lista
         self._load_documents()
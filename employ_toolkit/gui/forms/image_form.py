@@ -1,13 +1,11 @@
 # employ_toolkit/gui/forms/image_form.py
-from datetime import date
 from PySide6.QtWidgets import (
     QDialog, QFormLayout, QLineEdit, QComboBox, QTextEdit,
     QPushButton, QMessageBox
 )
 
 from employ_toolkit.modules import image_guidelines
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 class ImageForm(QDialog):
@@ -73,13 +71,8 @@ class ImageForm(QDialog):
 
         pdf_path = image_guidelines.generate_image_guidelines_pdf(self.client, data)
 
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=1,
-                doc_type="image_guidelines", path=str(pdf_path),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="image_guidelines", path=pdf_path)
 
         QMessageBox.information(self, "PDF creado", pdf_path.name)
         self.accept()
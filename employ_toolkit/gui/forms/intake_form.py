@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (
 )
 from sqlmodel import select
 from employ_toolkit.core.models import Client
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.storage import unit_of_work
 
 DISC_TYPES = ["D", "I", "S", "C"]
 
@@ -56,7 +56,7 @@ class IntakeForm(QDialog):
             disc_type=self.disc.currentText(),
         )
 
-        with get_session() as s:
+        with unit_of_work() as s:
             existing = s.exec(select(Client)
                               .where(Client.email == cliente.email)).first()
 
@@ -67,6 +67,4 @@ class IntakeForm(QDialog):
             else:
                 s.add(cliente)
 
-            s.commit()
-
         self.accept()   # siempre Accepted al guardar correctamente
@@ -1,12 +1,10 @@
 # employ_toolkit/gui/forms/interview_form.py
-from datetime import date
 from PySide6.QtWidgets import (
     QDialog, QFormLayout, QComboBox, QTextEdit, QPushButton, QMessageBox
 )
 
 from employ_toolkit.modules import interview
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 LEVELS = ["Bajo", "Medio", "Alto"]
@@ -45,13 +43,8 @@ class InterviewForm(QDialog):
         pdf_path = interview.generate_interview_pdf(self.client, scores, notes)
 
         # Registrar
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id,
-                module=1, doc_type="interview_report",
-                path=str(pdf_path), created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="interview_report", path=pdf_path)
 
         QMessageBox.information(self, "Informe creado",
                                 f"PDF generado: {pdf_path.name}")
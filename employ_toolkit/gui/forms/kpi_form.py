@@ -1,12 +1,10 @@
-from datetime import date
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem,
     QPushButton, QMessageBox, QDoubleSpinBox, QSpinBox
 )
 
 from employ_toolkit.modules import kpi_panel
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 class KPIForm(QDialog):
@@ -54,13 +52,8 @@ class KPIForm(QDialog):
 
         xlsx = kpi_panel.generate_kpi_xlsx(self.client, current, metas)
 
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=1,
-                doc_type="linkedin_kpis", path=str(xlsx),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="linkedin_kpis", path=xlsx)
 
         QMessageBox.information(self, "XLSX creado", xlsx.name)
         self.accept()
@@ -1,5 +1,4 @@
 # employ_toolkit/gui/forms/link_form.py
-from datetime import date
 from pathlib import Path
 
 from PySide6.QtCore import QUrl
@@ -9,8 +8,7 @@ from PySide6.QtWidgets import (
     QFileDialog, QMessageBox
 )
 
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 ANALYSIS_URL = "https://reepl.io/free-tools/linkedin-profile-analysis?utm_source=chatgpt.com"
@@ -51,13 +49,8 @@ class LinkedInForm(QDialog):
             return
 
         pdf_path = Path(file)
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id,
-                module=1, doc_type="linkedin_report",
-                path=str(pdf_path), created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="linkedin_report", path=pdf_path)
 
         QMessageBox.information(
             self, "¡Informe registrado!", f"Se guardó: {pdf_path.name}"
@@ -1,12 +1,10 @@
-from datetime import date
 from PySide6.QtWidgets import (
     QDialog, QFormLayout, QSpinBox, QTextEdit, QCheckBox,
     QWidget, QHBoxLayout, QPushButton, QMessageBox
 )
 
 from employ_toolkit.modules import networking
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 class NetworkingForm(QDialog):
@@ -55,13 +53,8 @@ class NetworkingForm(QDialog):
         }
         pdf = networking.generate_networking_pdf(self.client, data)
 
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=1,
-                doc_type="networking_plan", path=str(pdf),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="networking_plan", path=pdf)
 
         QMessageBox.information(self, "PDF creado", pdf.name)
         self.accept()
@@ -11,7 +11,6 @@ Técnicas de búsqueda de ofertas
 """
 
 from pathlib import Path
-from datetime import date
 import uuid
 from typing import Dict
 
@@ -22,8 +21,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules.search_guide import generate_search_pdf
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.registry import register_document
 
 # ===================== Catálogo de técnicas ====================== #
 SEARCH_TECHNIQUES: Dict[str, str] = {
@@ -133,13 +131,8 @@ class SearchForm(QDialog):
         pdf_path = generate_search_pdf(self.client, self.notes)
 
         # registrar
-        from employ_toolkit.core.storage import get_session  # import perezoso
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=2,
-                doc_type="search_guide_pdf",
-                path=str(pdf_path), created_at=date.today()))
-            s.commit()
+        register_document(self.client.id, module=2,
+                          doc_type="search_guide_pdf", path=pdf_path)
 
         QMessageBox.information(self, "PDF creado", f"Guía exportada: {pdf_path.name}")
         self.accept()
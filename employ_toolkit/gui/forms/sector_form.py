@@ -1,5 +1,4 @@
 # employ_toolkit/gui/forms/sector_form.py
-from datetime import date
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -8,8 +7,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules import sector_market
-from employ_toolkit.core.models import Document
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.registry import register_document
 
 
 class SectorForm(QDialog):
@@ -70,13 +68,8 @@ class SectorForm(QDialog):
         ppt_path = sector_market.generate_sector_ppt(self.client, answers)
 
         # Registrar en BD
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id,
-                module=1, doc_type="sector_market",
-                path=str(ppt_path), created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=1,
+                          doc_type="sector_market", path=ppt_path)
 
         QMessageBox.information(self, "Éxito",
                                 f"Presentación creada:\n{Path(ppt_path).name}")
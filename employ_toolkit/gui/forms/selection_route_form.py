@@ -6,7 +6,6 @@ Ruta de Proceso de Selección (Módulo 3-D)
 • Exporta un PDF con la información visible y registra el documento.
 """
 
-from datetime import date
 from pathlib import Path
 from typing import Dict, List
 
@@ -18,8 +17,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules.selection_route import generate_selection_pdf
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.registry import register_document
 
 
 PHASES = [
@@ -147,13 +145,8 @@ class SelectionRouteForm(QDialog):
         pdf_path = generate_selection_pdf(self.client, data)
 
         # registrar
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=3,
-                doc_type="selection_route", path=str(pdf_path),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=3,
+                          doc_type="selection_route", path=pdf_path)
 
         QMessageBox.information(self, "PDF creado",
                                 f"Ruta exportada: {pdf_path.name}")
@@ -8,7 +8,6 @@ Skill Matrix – Módulo 3-A
 • «Exportar PDF» genera informe SOLO con las skills marcadas.
 """
 from pathlib import Path
-from datetime import date
 import uuid
 import re                                      # ← para extraer plataforma
 
@@ -20,8 +19,7 @@ from PySide6.QtWidgets import (
 )
 
 from employ_toolkit.modules.skills_matrix import generate_skill_matrix_pdf
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.registry import register_document
 
 # ---------- Catálogos iniciales ---------------------------------- #
 HARD_SKILLS = [
@@ -251,13 +249,8 @@ class SkillsMatrixForm(QDialog):
         pdf = generate_skill_matrix_pdf(self.client, soft_sel, hard_sel)
 
         # registrar en Documentos
-        with get_session() as s:
-            s.add(Document(
-                client_id=self.client.id, module=3,
-                doc_type="skill_matrix", path=str(pdf),
-                created_at=date.today()
-            ))
-            s.commit()
+        register_document(self.client.id, module=3,
+                          doc_type="skill_matrix", path=pdf)
 
         QMessageBox.information(self, "PDF creado",
                                 f"Skill Matrix exportada: {pdf.name}")
@@ -25,7 +25,7 @@ from PySide6.QtCore import Qt
 from sqlmodel import select
 from passlib.hash import bcrypt
 
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.storage import unit_of_work
 from employ_toolkit.core.models import User
 
 
@@ -73,7 +73,7 @@ class LoginWindow(QWidget):
         password = self.pwd_input.text()
         print(f">>> Intentando login con '{username}'")
 
-        with get_session() as session:
+        with unit_of_work() as session:
             user: User | None = session.exec(
                 select(User).where(User.username == username)
             ).first()
@@ -10,16 +10,16 @@ Ventana Principal
 from typing import List
 from functools import partial
 
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QTimer
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTableView, QTabWidget, QMessageBox, QLineEdit
 )
 
-from sqlmodel import select
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.storage import unit_of_work, paginate_clients
 from employ_toolkit.core.models import Client
+from employ_toolkit.core import search
 
 
 # ------------ Formularios ------------
@@ -48,10 +48,45 @@ from employ_toolkit.gui.forms.selection_route_form import SelectionRouteForm
 # --------------------------------------------------------------------------- #
 class ClientTableModel(QAbstractTableModel):
     HEADERS = ["ID", "Nombre", "Email", "Profesión"]
+    PAGE_SIZE = 200
+    # columnas con orden indexado (`storage.CLIENT_SORTS`): las únicas que se
+    # pueden ordenar sin cargar todas las páginas
+    SORT_KEYS = {0: "id", 1: "full_name"}
 
-    def __init__(self, data: List[Client]):
+    def __init__(self, data: List[Client], next_cursor: str | None = None):
         super().__init__()
         self._data = data
+        self._cursor = next_cursor   # None = no quedan páginas
+        self.order_by, self.descending = "id", True
+
+    def reset_data(self, data: List[Client], next_cursor: str | None = None):
+        self.beginResetModel()
+        self._data = list(data)
+        self._cursor = next_cursor
+        self.endResetModel()
+
+    def first_page(self) -> None:
+        """Recarga desde la primera página con el orden actual."""
+        page = paginate_clients(limit=self.PAGE_SIZE, order_by=self.order_by,
+                                descending=self.descending)
+        self.reset_data(page.items, page.next_cursor)
+
+    # Carga incremental (la vista la pide al llegar al final) ---------------
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._cursor is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        page = paginate_clients(self._cursor, limit=self.PAGE_SIZE,
+                                order_by=self.order_by, descending=self.descending)
+        self._cursor = page.next_cursor
+        if not page.items:
+            return
+        first = len(self._data)
+        self.beginInsertRows(QModelIndex(), first, first + len(page.items) - 1)
+        self._data.extend(page.items)
+        self.endInsertRows()
 
     # Requeridos -------------------------------------------------------------
     def rowCount(self, _=QModelIndex()):
@@ -79,6 +114,8 @@ class ClientTableModel(QAbstractTableModel):
 # MainWindow                                                                  #
 # --------------------------------------------------------------------------- #
 class MainWindow(QMainWindow):
+    FILTER_DELAY_MS = 200        # espera tras la última tecla antes de buscar
+
     # ------------------------------------------------------------------ #
     def __init__(self, username: str, role: str):
         super().__init__()
@@ -212,8 +249,13 @@ class MainWindow(QMainWindow):
         tab = QWidget(); lay = QVBoxLayout(tab)
 
         # Filtro
-        self.txt_filter = QLineEdit(placeholderText="Filtrar… (ID, nombre, email, profesión)")
-        self.txt_filter.textChanged.connect(self._apply_filter)
+        self.txt_filter = QLineEdit(
+            placeholderText="Buscar… (ID, nombre, email, profesión, documentos, CV)")
+        # una sola búsqueda cuando se deja de escribir, no una por tecla
+        self._filter_timer = QTimer(self, singleShot=True, interval=self.FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(
+            lambda: self._apply_filter(self.txt_filter.text()))
+        self.txt_filter.textChanged.connect(lambda _: self._filter_timer.start())
         lay.addWidget(self.txt_filter)
 
         # Nuevo cliente
@@ -235,23 +277,63 @@ class MainWindow(QMainWindow):
 
     # Cargar (y recargar) clientes
     def _load_clients(self):
-        with get_session() as s:
-            data = s.exec(select(Client).order_by(Client.id.desc())).all()
+        # sólo la primera página; el resto llega con fetchMore al hacer scroll
+        if not hasattr(self, "model"):
+            self._set_clients([])
+        self.proxy.sort(-1)                            # orden de la consulta
+        self.model.first_page()
+        self._show_model_sort()
 
+    def _set_clients(self, data: List[Client], next_cursor: str | None = None):
         if not hasattr(self, "model"):
-            self.model = ClientTableModel(data)
+            self.model = ClientTableModel(list(data), next_cursor)
             self.proxy = QSortFilterProxyModel(self)
             self.proxy.setSourceModel(self.model)
             self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
             self.proxy.setFilterKeyColumn(-1)          # todas las columnas
             self.table.setModel(self.proxy)
-            self.table.setSortingEnabled(True)
+            # Sin setSortingEnabled: el proxy sólo ordenaría las páginas ya
+            # cargadas. La cabecera vuelve a consultar con el orden elegido.
+            header = self.table.horizontalHeader()
+            header.setSectionsClickable(True)
+            header.setSortIndicatorShown(True)
+            header.sortIndicatorChanged.connect(self._sort_clients)
         else:
-            self.model._data = data
-            self.model.layoutChanged.emit()
+            self.model.reset_data(data, next_cursor)
+
+    def _sort_clients(self, column: int, order: Qt.SortOrder):
+        if self.txt_filter.text().strip():
+            # resultados de búsqueda: lista completa, se ordena en memoria
+            self.proxy.sort(column, order)
+            return
+        key = ClientTableModel.SORT_KEYS.get(column)
+        if key is None:                                # sin índice: se mantiene
+            self._show_model_sort()
+            return
+        self.model.order_by, self.model.descending = key, order == Qt.DescendingOrder
+        self._load_clients()
+
+    def _show_model_sort(self):
+        column = {v: k for k, v in ClientTableModel.SORT_KEYS.items()}[self.model.order_by]
+        self._show_sort_indicator(
+            column, Qt.DescendingOrder if self.model.descending else Qt.AscendingOrder)
+
+    def _show_sort_indicator(self, column: int, order: Qt.SortOrder):
+        header = self.table.horizontalHeader()
+        header.blockSignals(True)
+        header.setSortIndicator(column, order)
+        header.blockSignals(False)
 
     def _apply_filter(self, text: str):
-        self.proxy.setFilterFixedString(text)
+        """Búsqueda FTS (datos, documentos y CV) ordenada por relevancia."""
+        if not text.strip():
+            self._load_clients()
+            return
+        with unit_of_work() as s:
+            data = search.search_clients(s, text)
+        self.proxy.sort(-1)                            # relevancia
+        self._show_sort_indicator(-1, Qt.AscendingOrder)
+        self._set_clients(data)
 
     # ------------------------------------------------------------------ #
     # Selección y helpers                                                #
@@ -313,102 +395,24 @@ class MainWindow(QMainWindow):
 
 
     def _generate_final_report(self):
-        """Genera un PDF y un XLSX unificados con todos los entregables."""
+        """Genera (o actualiza) el PDF y el XLSX unificados con todos los entregables."""
         client = self._selected_client()
         if not client:
             return
 
-        # --- importar dentro del método ---
-        from pathlib import Path
-        from datetime import datetime
-        from PyPDF2 import PdfMerger
-        from openpyxl import Workbook, load_workbook
-        from sqlmodel import select
-        from employ_toolkit.core.storage import get_session
-        from employ_toolkit.core.models import Document
-
-        pdfs, xlsxes = [], []
-
-        # recoger documentos
-        with get_session() as s:
-            docs = s.exec(
-                select(Document)
-                .where(Document.client_id == client.id)
-                .order_by(Document.module, Document.created_at)
-            ).all()
-
-        for d in docs:
-            p = Path(d.path)
-            if p.suffix.lower() == ".pdf":
-                pdfs.append(p)
-            elif p.suffix.lower() == ".xlsx":
-                xlsxes.append(p)
-
-        output_dir = Path("workspace"); output_dir.mkdir(exist_ok=True)
-
-        # ---------- fusionar PDFs ----------
-        if pdfs:
-            merger = PdfMerger()
-            for p in pdfs:
-                if p.exists():
-                    merger.append(str(p))
-            final_pdf = output_dir / f"{client.full_name}_informe_final.pdf"
-            merger.write(final_pdf); merger.close()
-
-            with get_session() as s:
-                s.add(Document(
-                    client_id=client.id, module=0,
-                    doc_type="final_pdf", path=str(final_pdf),
-                    created_at=datetime.utcnow()
-                )); s.commit()
-
-        
-        # ---------- fusionar Excels ----------
-        if xlsxes:
-            if len(xlsxes) == 1:
-               final_xlsx = output_dir / f"{client.full_name}_informe_final.xlsx"
-               final_xlsx.write_bytes(xlsxes[0].read_bytes())
-            else:
-                from openpyxl import Workbook, load_workbook
-
-                wb_out = Workbook()
-                base_sheet = wb_out.active          # aún no la quitamos
-
-                copied_any = False
-                for src in xlsxes:
-                    wb_in = load_workbook(src, data_only=True)
-                    for sh in wb_in.worksheets:
-                        new_title = f"{src.stem}_{sh.title}"[:31]
-                        new_sh = wb_out.create_sheet(title=new_title)
-
-                        for row in sh.iter_rows(values_only=True):
-                            new_sh.append(row)
-
-                        copied_any = True
-
-                if copied_any:
-                    wb_out.remove(base_sheet)       # ya hay al menos una hoja visible
-                else:
-                    base_sheet.title = "Resumen"    # nada que copiar → deja la hoja vacía
-
-                final_xlsx = output_dir / f"{client.full_name}_informe_final.xlsx"
-                wb_out.save(final_xlsx)
-
-        # registrar el Excel unificado
-        with get_session() as s:
-           s.add(Document(
-               client_id=client.id, module=0,
-               doc_type="final_xlsx", path=str(final_xlsx),
-               created_at=datetime.utcnow()
-           ))
-           s.commit()
-
+        from employ_toolkit.modules.final_report import generate_final_report
 
+        merged = generate_final_report(client)
+        if not merged:
+            QMessageBox.information(self, "Informe Final",
+                                    "El cliente aún no tiene entregables PDF ni XLSX.")
+            return
         QMessageBox.information(
             self, "Informe Final",
-            "Se creó el PDF y (si había) el Excel unificados y se registraron."
+            "Informe unificado actualizado y registrado:\n"
+            + "\n".join(f"• {p.name}" for p in merged.values())
         )
-    
+
 # ------------------------- Debug local ------------------------- #
 if __name__ == "__main__":
     import sys
@@ -1,47 +1,44 @@
+from io import BytesIO
 from pathlib import Path
 from datetime import date
-import uuid
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer,
-    ListFlowable, ListItem
+
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import (
+    Bullets, DocSpec, Heading, Paragraph, Spacer, emit,
 )
 
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 
-def _bullets_from_dict(d: dict, styles) -> ListFlowable:
+def _bullets_from_dict(d: dict) -> Bullets:
     items = []
     for k, v in d.items():
         if v:
             label = k.capitalize().replace('_', ' ')
             text  = v.replace('\n', '<br/>')
-            items.append(ListItem(Paragraph(f"<b>{label}:</b> {text}", styles["Normal"]),
-                                  leftIndent=10, bulletFontName="Helvetica"))
-    return ListFlowable(items, bulletType="bullet")
-
-
-def generate_ats_pdf(client, data: dict) -> Path:
-    path = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_ats.pdf"
-    doc = SimpleDocTemplate(str(path), pagesize=LETTER)
-    st  = getSampleStyleSheet()
-    story = [
-        Paragraph(f"Guía de Perfiles – {client.full_name}", st["Title"]),
-        Paragraph(f"Fecha: {date.today()}", st["Normal"]),
-        Spacer(1, 12),
-    ]
-    h2 = st["Heading2"]
-    normal = st["Normal"]
+            items.append(f"<b>{label}:</b> {text}")
+    return Bullets(items, indent=10)
+
+
+def ats_spec(client, data: dict) -> DocSpec:
+    spec = DocSpec([
+        Heading(f"Guía de Perfiles – {client.full_name}", 0),
+        Paragraph(f"Fecha: {date.today()}"),
+        Spacer(12),
+    ])
 
     for site, content in data.items():
-        story.append(Paragraph(site, h2))
+        spec.add(Heading(site, 2))
         if isinstance(content, dict):
-            story.append(_bullets_from_dict(content, st))
+            spec.add(_bullets_from_dict(content))
         else:  # nunca ocurrirá ya, pero se deja por seguridad
-            story.append(Paragraph(str(content).replace('\n', '<br/>'), normal))
-        story.append(Spacer(1, 12))
+            spec.add(Paragraph(str(content).replace('\n', '<br/>')))
+        spec.add(Spacer(12))
+    return spec
+
 
-    doc.build(story)
-    return path
+@content_addressed("ats")
+def generate_ats_pdf(client, data: dict, *, in_memory: bool = False) -> Path | BytesIO:
+    spec = ats_spec(client, data)
+    return emit(spec, OUTPUT_DIR, client, "ats", "pdf", in_memory)
@@ -1,11 +1,15 @@
 # employ_toolkit/modules/brand_canvas.py
 import json, uuid
+from io import BytesIO
 from pathlib import Path
 from datetime import date
 
 from sqlmodel import Session
 from jinja2 import Environment, FileSystemLoader
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import DocSpec, Heading, Paragraph, Spacer, render_bytes
 from employ_toolkit.core.models import CandidateProfile
+from employ_toolkit.core.publish import publish
 
 # ---------- Rutas y plantillas ----------
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
@@ -40,32 +44,38 @@ def brand_canvas_wizard(context: dict):
 # --------------------------------------------------------------------------- #
 # 2) API silenciosa para la GUI                                               #
 # --------------------------------------------------------------------------- #
-def generate_brand_canvas(profile: CandidateProfile, answers: dict):
+@content_addressed("brand_canvas")
+def generate_brand_canvas(profile: CandidateProfile, answers: dict, *, in_memory: bool = False):
     """
     Genera BrandCanvas sin entrada por consola.
-    Devuelve {'json': Path, 'pdf': Path}
+    Devuelve {'json': Path, 'pdf': Path} (`BytesIO` con `in_memory=True`)
     """
-    return _render_brand_canvas(profile, answers, use_html=False)
+    return _render_brand_canvas(profile, answers, use_html=False, in_memory=in_memory)
 
 
 # --------------------------------------------------------------------------- #
 # Implementación común                                                        #
 # --------------------------------------------------------------------------- #
-def _render_brand_canvas(profile: CandidateProfile, answers: dict, *, use_html=True):
+def brand_canvas_spec(profile: CandidateProfile, answers: dict) -> DocSpec:
+    spec = DocSpec([
+        Heading(f"BrandCanvas · {profile.full_name}", 2),
+        Paragraph(f"Fecha: {date.today()}", markup=False),
+        Spacer(8),
+    ])
+    for key, val in answers.items():
+        spec.add(Heading(key.capitalize(), 3), Paragraph(val, markup=False))
+    return spec
+
+
+def _render_brand_canvas(profile: CandidateProfile, answers: dict, *, use_html=True,
+                         in_memory=False):
     canvas_id = str(uuid.uuid4())[:8]
 
     # 1. JSON ---------------------------------------------------------------
-    json_path = (
-        OUTPUT_DIR / f"{profile.full_name}_{canvas_id}_canvas.json"
-    )
     data = {"candidate_id": profile.id, "date": str(date.today()), **answers}
-    json_path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+    buffers = {"json": BytesIO(json.dumps(data, ensure_ascii=False, indent=2).encode())}
 
     # 2. PDF ---------------------------------------------------------------
-    pdf_path = (
-        OUTPUT_DIR / f"{profile.full_name}_{canvas_id}_canvas.pdf"
-    )
-
     if use_html:
         # Render Jinja + WeasyPrint (CLI versión)
         from weasyprint import HTML
@@ -75,31 +85,17 @@ def _render_brand_canvas(profile: CandidateProfile, answers: dict, *, use_html=T
         html_str = template.render(
             name=profile.full_name, answers=answers, today=date.today()
         )
-        HTML(string=html_str).write_pdf(pdf_path)
+        buffers["pdf"] = BytesIO(HTML(string=html_str).write_pdf())
     else:
         # GUI versión con ReportLab (sin dependencias nativas)
-        from reportlab.lib.pagesizes import LETTER
-        from reportlab.lib.units import inch
-        from reportlab.pdfgen import canvas
-
-        c = canvas.Canvas(str(pdf_path), pagesize=LETTER)
-        text = c.beginText(1 * inch, 10 * inch)
-        text.setFont("Helvetica-Bold", 14)
-        text.textLine(f"BrandCanvas · {profile.full_name}")
-        text.setFont("Helvetica", 11)
-        text.textLine(f"Fecha: {date.today()}\n")
-
-        for key, val in answers.items():
-            text.setFont("Helvetica-Bold", 12)
-            text.textLine(key.capitalize())
-            text.setFont("Helvetica", 11)
-            for line in val.splitlines():
-                text.textLine(line)
-            text.textLine("")
-
-        c.drawText(text)
-        c.showPage()
-        c.save()
-
-    print(f"✓ BrandCanvas generado:\n  • {json_path}\n  • {pdf_path}\n")
-    return {"json": json_path, "pdf": pdf_path}
+        buffers["pdf"] = render_bytes(brand_canvas_spec(profile, answers), "pdf")
+
+    if in_memory:
+        return buffers
+
+    paths = {
+        ext: publish(buf, OUTPUT_DIR / f"{profile.full_name}_{canvas_id}_canvas.{ext}")
+        for ext, buf in buffers.items()
+    }
+    print(f"✓ BrandCanvas generado:\n  • {paths['json']}\n  • {paths['pdf']}\n")
+    return paths
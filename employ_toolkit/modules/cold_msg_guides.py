@@ -1,27 +1,26 @@
+from io import BytesIO
 from pathlib import Path
 from datetime import date
-import uuid
 
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import (
+    DocSpec, Heading, Paragraph, Spacer, emit,
+)
 
 OUTPUT_DIR = Path("workspace"); OUTPUT_DIR.mkdir(exist_ok=True)
 
-def generate_cold_pdf(client, messages: dict) -> Path:
-    path = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_cold_msgs.pdf"
-    doc = SimpleDocTemplate(str(path), pagesize=LETTER)
-    styles = getSampleStyleSheet()
-    story = [Paragraph(f"Mensajes en frío – {client.full_name}", styles["Title"]),
-             Paragraph(f"Fecha: {date.today()}", styles["Normal"]),
-             Spacer(1, 12)]
+def cold_spec(client, messages: dict) -> DocSpec:
+    spec = DocSpec([Heading(f"Mensajes en frío – {client.full_name}", 0),
+                    Paragraph(f"Fecha: {date.today()}"),
+                    Spacer(12)])
 
     for aud, msg in messages.items():
-        story += [
-            Paragraph(aud, styles["Heading2"]),
-            Paragraph(msg.replace("\n", "<br/>"), styles["Normal"]),
-            Spacer(1, 12)
-        ]
-    doc.build(story)
-    return path
+        spec.add(Heading(aud, 2),
+                 Paragraph(msg.replace("\n", "<br/>")),
+                 Spacer(12))
+    return spec
 
+@content_addressed("cold_msgs")
+def generate_cold_pdf(client, messages: dict, *, in_memory: bool = False) -> Path | BytesIO:
+    spec = cold_spec(client, messages)
+    return emit(spec, OUTPUT_DIR, client, "cold_msgs", "pdf", in_memory)
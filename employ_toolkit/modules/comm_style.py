@@ -1,12 +1,11 @@
 # employ_toolkit/modules/comm_style.py
+from io import BytesIO
 from pathlib import Path
 from datetime import date
-import uuid
 
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import (
+    Bullets, DocSpec, Heading, Paragraph, Spacer, emit,
 )
 
 OUTPUT_DIR = Path("workspace")
@@ -19,29 +18,25 @@ DISC_DESCRIPTIONS = {
     "C": "Analítico, preciso y estructurado. Exige datos, lógica y documentación de soporte.",
 }
 
-def generate_comm_style_pdf(client, category: str, notes: list[str]) -> Path:
-    """Genera el PDF de guía de comunicación DISC."""
-    file = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_comm_style.pdf"
-
-    doc    = SimpleDocTemplate(str(file), pagesize=LETTER)
-    styles = getSampleStyleSheet()
-    story  = [
-        Paragraph(f"Guía de Comunicación DISC – {client.full_name}", styles["Title"]),
-        Paragraph(f"Fecha: {date.today()}", styles["Normal"]),
-        Spacer(1, 12),
-        Paragraph(f"Categoría seleccionada: <b>{category}</b>", styles["Heading2"]),
-        Paragraph(DISC_DESCRIPTIONS[category], styles["BodyText"]),
-        Spacer(1, 12),
-    ]
+def comm_style_spec(client, category: str, notes: list[str]) -> DocSpec:
+    spec = DocSpec([
+        Heading(f"Guía de Comunicación DISC – {client.full_name}", 0),
+        Paragraph(f"Fecha: {date.today()}"),
+        Spacer(12),
+        Heading(f"Categoría seleccionada: <b>{category}</b>", 2),
+        Paragraph(DISC_DESCRIPTIONS[category], "BodyText"),
+        Spacer(12),
+    ])
 
     if notes:
-        story.append(Paragraph("Observaciones del consultor:", styles["Heading2"]))
-        story.append(
-            ListFlowable(
-                [ListItem(Paragraph(n, styles["BodyText"])) for n in notes],
-                bulletType="bullet"
-            )
-        )
+        spec.add(Heading("Observaciones del consultor:", 2),
+                 Bullets(notes, "BodyText"))
+    return spec
 
-    doc.build(story)
-    return file
+
+@content_addressed("comm_style")
+def generate_comm_style_pdf(client, category: str, notes: list[str],
+                            *, in_memory: bool = False) -> Path | BytesIO:
+    """Genera el PDF de guía de comunicación DISC."""
+    spec = comm_style_spec(client, category, notes)
+    return emit(spec, OUTPUT_DIR, client, "comm_style", "pdf", in_memory)
@@ -1,12 +1,15 @@
 # employ_toolkit/modules/content_plan.py
-import uuid
+from io import BytesIO
 from pathlib import Path
 from datetime import date, timedelta
 
-from docx import Document
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Font
 
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import DocSpec, Heading, Paragraph, output_path, render_bytes
+from employ_toolkit.core.publish import publish
+
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
@@ -17,24 +20,64 @@ def _week_start(reference: date, n: int) -> date:
     return ref_monday + timedelta(weeks=n)
 
 
-def generate_content_plan(client, params: dict) -> dict:
+# --------------------------------------------------------------------------- #
+# Wizard CLI                                                                  #
+# --------------------------------------------------------------------------- #
+def _ask(label: str, default: str = "") -> str:
+    """Entrada por consola; vacía → `default` (si no hay, se repite)."""
+    while True:
+        value = input(f"{label}{f' [{default}]' if default else ''}\n> ").strip() or default
+        if value:
+            return value
+        print("  ⚠ Dato obligatorio")
+
+
+def _ask_int(label: str, default: int) -> int:
+    while True:
+        value = _ask(label, str(default))
+        if value.isdigit() and int(value) > 0:
+            return int(value)
+        print("  ⚠ Debe ser un entero positivo")
+
+
+def content_plan_wizard(context: dict) -> dict:
+    """Interfaz CLI: pregunta los parámetros del plan y genera DOCX + XLSX."""
+    print("\n=== Wizard · Plan de Contenidos ===")
+    params = {
+        "pilares": [p.strip() for p in _ask("Pilares de contenido (separados por coma)").split(",")
+                    if p.strip()],
+        "freq": _ask_int("Publicaciones por semana", 3),
+        "formatos": [f.strip() for f in _ask("Formatos (separados por coma)", "Post").split(",")
+                     if f.strip()],
+        "semanas": _ask_int("Semanas del piloto", 4),
+    }
+    paths = generate_content_plan(context["intake"], params)
+    print(f"✓ Plan de contenidos generado:\n  • {paths['docx']}\n  • {paths['xlsx']}\n")
+    return paths
+
+
+def content_plan_spec(client, params: dict) -> DocSpec:
+    """Resumen del plan (el calendario va aparte, en XLSX)."""
+    return DocSpec([
+        Heading(f"Parrilla de Contenidos – {client.full_name}", 0),
+        Paragraph(f"Pilares: {', '.join(params['pilares'])}", markup=False),
+        Paragraph(f"Frecuencia: {params['freq']} publicaciones / semana", markup=False),
+        Paragraph(f"Formatos permitidos: {', '.join(params['formatos'])}", markup=False),
+        Paragraph(f"Duración piloto: {params['semanas']} semanas", markup=False),
+    ])
+
+
+@content_addressed("content_plan")
+def generate_content_plan(client, params: dict, *, in_memory: bool = False) -> dict:
     """
     Genera un DOCX resumen + XLSX calendario.
     params = {pilares: [...], freq: int, formatos:[...], semanas:int}
-    Devuelve {'docx': Path, 'xlsx': Path}
+    Devuelve {'docx': Path, 'xlsx': Path} (`BytesIO` con `in_memory=True`)
     """
     # ---------- DOCX RESUMEN ----------
-    docx_path = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_plan.docx"
-    doc = Document()
-    doc.add_heading(f"Parrilla de Contenidos – {client.full_name}", 0)
-    doc.add_paragraph(f"Pilares: {', '.join(params['pilares'])}")
-    doc.add_paragraph(f"Frecuencia: {params['freq']} publicaciones / semana")
-    doc.add_paragraph(f"Formatos permitidos: {', '.join(params['formatos'])}")
-    doc.add_paragraph(f"Duración piloto: {params['semanas']} semanas")
-    doc.save(docx_path)
+    buffers = {"docx": render_bytes(content_plan_spec(client, params), "docx")}
 
     # ---------- XLSX CALENDARIO ----------
-    xlsx_path = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_plan.xlsx"
     wb = Workbook()
     ws = wb.active
     ws.title = "Calendario"
@@ -79,6 +122,12 @@ def generate_content_plan(client, params: dict) -> dict:
     for col, width in zip("ABCDE", [12, 16, 14, 40, 60]):
         ws.column_dimensions[col].width = width
 
-    wb.save(xlsx_path)
-    return {"docx": docx_path, "xlsx": xlsx_path}
+    buffers["xlsx"] = BytesIO()
+    wb.save(buffers["xlsx"])
+    buffers["xlsx"].seek(0)
+
+    if in_memory:
+        return buffers
+    return {ext: publish(buf, output_path(OUTPUT_DIR, client, "plan", ext))
+            for ext, buf in buffers.items()}
 
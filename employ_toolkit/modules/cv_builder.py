@@ -6,10 +6,15 @@ cv_builder.py
 • Renderiza PDF y DOCX finales
 """
 
+from io import BytesIO
 from pathlib import Path
 import uuid, json
 from datetime import date
 
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import DocSpec, Heading, Paragraph, render_bytes
+from employ_toolkit.core.publish import publish
+
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
@@ -39,32 +44,24 @@ def analyse_cv_with_gpt(original_text: str, role: str) -> dict:
         "keywords_missing": ["ETL", "Docker"],
     }
 
-# ---------- 2. Renderizadores ----------
-def _build_docx(data: dict, filename: Path):
-    from docx import Document
-    doc = Document()
-    doc.add_heading(data["role_target"], level=1)
-    doc.add_paragraph(data["summary"])
-    doc.save(filename)
-
-def _build_pdf(data: dict, filename: Path):
-    from reportlab.lib.pagesizes import LETTER
-    from reportlab.platypus import SimpleDocTemplate, Paragraph
-    from reportlab.lib.styles import getSampleStyleSheet
-    doc = SimpleDocTemplate(str(filename), pagesize=LETTER)
-    doc.build([Paragraph(data["summary"], getSampleStyleSheet()["Normal"])])
+# ---------- 2. Contenido ----------
+def cv_spec(data: dict) -> DocSpec:
+    """Mismo contenido para PDF y DOCX."""
+    return DocSpec([Heading(data["role_target"], 1),
+                    Paragraph(data["summary"], markup=False)])
 
 # ---------- 3. Función principal ----------
-def generate_cv_files(client, data: dict) -> dict[str, Path]:
+@content_addressed("cv")
+def generate_cv_files(client, data: dict,
+                      *, in_memory: bool = False) -> dict[str, Path | BytesIO]:
     """
     data := formulario completo (campos mostrados en GUI)
-    Devuelve {"pdf": Path, "docx": Path}
+    Devuelve {"pdf": Path, "docx": Path} (`BytesIO` con `in_memory=True`)
     """
-    stem = f"{client.full_name}_{uuid.uuid4().hex[:6]}_cv"
-    pdf = OUTPUT_DIR / f"{stem}.pdf"
-    docx = OUTPUT_DIR / f"{stem}.docx"
+    spec = cv_spec(data)
+    buffers = {ext: render_bytes(spec, ext) for ext in ("pdf", "docx")}
+    if in_memory:
+        return buffers
 
-    _build_pdf(data, pdf)
-    _build_docx(data, docx)
-
-    return {"pdf": pdf, "docx": docx}
+    stem = f"{client.full_name}_{uuid.uuid4().hex[:6]}_cv"
+    return {ext: publish(buf, OUTPUT_DIR / f"{stem}.{ext}") for ext, buf in buffers.items()}
@@ -2,5 +2,11 @@ def demand_analysis(context, skills: list[str] | None = None):
     """Paso provisional: ingresa cargos manualmente."""
     print("Ingresa 3 cargos relevantes separados por coma:")
     cargos = input("> ").split(",")
-    positions = [{"title": c.strip(), "sector": "N/A", "score": 0.8} for c in cargos]
+    return demand_analysis_from_titles(context, cargos)
+
+
+def demand_analysis_from_titles(context, cargos: list[str]):
+    """Variante sin consola (batch): recibe los cargos ya escritos."""
+    positions = [{"title": c.strip(), "sector": "N/A", "score": 0.8}
+                 for c in cargos if c.strip()]
     return positions
@@ -1,51 +1,194 @@
+# employ_toolkit/modules/final_report.py
+"""
+Informe final incremental
+-------------------------
+Une los entregables PDF del cliente (orden: módulo → fecha) en
+`<nombre>_informe_final.pdf` y los XLSX en `<nombre>_informe_final.xlsx`.
+
+Un manifiesto por cliente (`MANIFEST_DIR/<client_id>.json`) guarda qué
+`Document` (id + sha256) entraron en el último informe y el tamaño/mtime
+del informe escrito. Al regenerar:
+
+• mismos documentos                       → no se toca nada;
+• los anteriores intactos + nuevos al final → se anexan con una
+  actualización incremental (`core.pdf_merge.append_pdfs`);
+• cualquier otro cambio (un documento editado, borrado, reordenado, o el
+  informe modificado fuera de aquí)         → se reconstruye entero.
+
+El sha256 de cada entregable sólo se recalcula si cambió su tamaño o mtime.
+La reconstrucción usa `core.pdf_merge.merge_pdfs` (streaming, un origen a
+la vez, recursos compartidos deduplicados) directamente sobre el temporal.
+El XLSX (pequeño) se reconstruye sólo si cambió su lista de documentos.
+"""
+
+import hashlib
+import json
+from io import BytesIO
 from pathlib import Path
-from datetime import date
-import uuid
-from PyPDF2 import PdfMerger
+
 from openpyxl import load_workbook, Workbook
-from sqlalchemy import select
 
-from employ_toolkit.core.storage import get_session
-from employ_toolkit.core.models import Document
+from employ_toolkit.core.pdf_merge import append_pdfs, merge_pdfs
+from employ_toolkit.core.publish import atomic_writer, publish
+from employ_toolkit.core.storage import get_documents
+from employ_toolkit.core.registry import flush_documents, register_document
 
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
+MANIFEST_DIR = OUTPUT_DIR / ".final_reports"
 
-
-def _merge_pdfs(files, out):
-    merger = PdfMerger()
-    for f in files:
-        merger.append(f)
-    merger.write(out)
-    merger.close()
+FINAL_MODULE = 0          # módulo con el que se registran los informes finales
 
 
+# --------------------------------------------------------------------------- #
+# Fusión                                                                      #
+# --------------------------------------------------------------------------- #
 def _merge_xlsx(files, out):
-    wb_out = Workbook(); wb_out.remove(wb_out.active)
-    for f in files:
-        wb = load_workbook(f)
-        for ws in wb.worksheets:
-            wb_out._add_sheet(ws)
+    """Copia los valores de cada hoja en un libro nuevo (`<archivo>_<hoja>`)."""
+    files = [Path(f) for f in files]
+    if len(files) == 1:
+        out.write(files[0].read_bytes())
+        return
+    wb_out = Workbook()
+    wb_out.remove(wb_out.active)
+    for src in files:
+        wb_in = load_workbook(src, data_only=True)
+        for sh in wb_in.worksheets:
+            new_sh = wb_out.create_sheet(title=f"{src.stem}_{sh.title}"[:31])
+            for row in sh.iter_rows(values_only=True):
+                new_sh.append(row)
+    if not wb_out.worksheets:
+        wb_out.create_sheet("Resumen")
     wb_out.save(out)
 
 
-def generate_final_report(client):
-    with get_session() as s:
-        docs = s.exec(select(Document).where(Document.client_id == client.id)).all()
+# --------------------------------------------------------------------------- #
+# Manifiesto                                                                  #
+# --------------------------------------------------------------------------- #
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _fingerprints(docs, previous: list[dict]) -> list[dict]:
+    """[{id, path, size, mtime_ns, sha256}] reutilizando hashes sin cambios."""
+    known = {(e["id"], e["path"], e["size"], e["mtime_ns"]): e["sha256"] for e in previous}
+    entries = []
+    for d in docs:
+        st = Path(d.path).stat()
+        key = (d.id, d.path, st.st_size, st.st_mtime_ns)
+        entries.append({"id": d.id, "path": d.path, "size": st.st_size,
+                        "mtime_ns": st.st_mtime_ns,
+                        "sha256": known.get(key) or _sha256(Path(d.path))})
+    return entries
+
+
+def _same(a: list[dict], b: list[dict]) -> bool:
+    return [(e["id"], e["sha256"]) for e in a] == [(e["id"], e["sha256"]) for e in b]
+
+
+def _output_intact(section: dict, path: Path) -> bool:
+    """El informe sigue siendo el que escribimos (nadie lo tocó)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return section.get("path") == str(path) and \
+        (section.get("size"), section.get("mtime_ns")) == (st.st_size, st.st_mtime_ns)
+
+
+def _stamp(path: Path, entries: list[dict], mode: str) -> dict:
+    st = path.stat()
+    return {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+            "mode": mode, "docs": entries}
+
+
+def _load_manifest(client_id) -> dict:
+    try:
+        return json.loads((MANIFEST_DIR / f"{client_id}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(client_id, manifest: dict) -> None:
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+    publish(data, MANIFEST_DIR / f"{client_id}.json")
+
+
+# --------------------------------------------------------------------------- #
+# Informe                                                                     #
+# --------------------------------------------------------------------------- #
+def _deliverables(client_id) -> list:
+    """Entregables existentes del cliente, sin informes finales ni repetidos."""
+    seen: set[str] = set()
+    docs = []
+    for d in sorted(get_documents(client_id), key=lambda d: (d.module, d.created_at)):
+        if d.module == FINAL_MODULE or d.path in seen or not Path(d.path).is_file():
+            continue
+        seen.add(d.path)
+        docs.append(d)
+    return docs
+
+
+def _update_pdf(path: Path, entries: list[dict], previous: dict) -> dict:
+    old = previous.get("docs", [])
+    if _output_intact(previous, path) and _same(entries[:len(old)], old):
+        if len(entries) == len(old):
+            return {**previous, "mode": "unchanged"}
+        try:
+            append_pdfs(path, [e["path"] for e in entries[len(old):]])
+            return _stamp(path, entries, "append")
+        except Exception:            # destino ilegible / cifrado → reconstruir
+            pass
+    with atomic_writer(path) as fh:          # streaming: nunca el PDF entero en RAM
+        merge_pdfs([e["path"] for e in entries], fh)
+    return _stamp(path, entries, "rebuild")
+
+
+def _update_xlsx(path: Path, entries: list[dict], previous: dict) -> dict:
+    if _output_intact(previous, path) and _same(entries, previous.get("docs", [])):
+        return {**previous, "mode": "unchanged"}
+    buffer = BytesIO()
+    _merge_xlsx([e["path"] for e in entries], buffer)
+    publish(buffer, path)
+    return _stamp(path, entries, "rebuild")
+
+
+def generate_final_report(client) -> dict[str, Path]:
+    """
+    Crea/actualiza el PDF y el XLSX unificados del cliente y los registra
+    (una sola vez) como documentos del módulo 0.
+    Devuelve {'pdf': Path, 'xlsx': Path} con los que existan.
+    """
+    flush_documents()
+    docs = _deliverables(client.id)
+    manifest = _load_manifest(client.id)
+    outputs = {
+        "pdf": OUTPUT_DIR / f"{client.full_name}_informe_final.pdf",
+        "xlsx": OUTPUT_DIR / f"{client.full_name}_informe_final.xlsx",
+    }
+    update = {"pdf": _update_pdf, "xlsx": _update_xlsx}
 
-    # ordenar por módulo -> fecha
-    docs.sort(key=lambda d: (d.module, d.created_at))
+    merged: dict[str, Path] = {}
+    for ext, path in outputs.items():
+        selected = [d for d in docs if d.path.lower().endswith(f".{ext}")]
+        if not selected:
+            manifest.pop(ext, None)
+            continue
+        previous = manifest.get(ext, {})
+        entries = _fingerprints(selected, previous.get("docs", []))
+        manifest[ext] = update[ext](path, entries, previous)
+        merged[ext] = path
 
-    pdfs  = [d.path for d in docs if d.path.lower().endswith(".pdf")]
-    excels= [d.path for d in docs if d.path.lower().endswith(".xlsx")]
+    _save_manifest(client.id, manifest)
 
-    merged = {}
-    if pdfs:
-        pdf_out = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_FINAL.pdf"
-        _merge_pdfs(pdfs, pdf_out)
-        merged["pdf"] = pdf_out
-    if excels:
-        xls_out = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_FINAL.xlsx"
-        _merge_xlsx(excels, xls_out)
-        merged["xlsx"] = xls_out
+    registered = {d.path for d in get_documents(client.id) if d.module == FINAL_MODULE}
+    for ext, path in merged.items():
+        if str(path) not in registered:
+            register_document(client.id, module=FINAL_MODULE,
+                              doc_type=f"final_{ext}", path=path)
+    flush_documents()
     return merged
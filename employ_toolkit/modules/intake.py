@@ -8,7 +8,7 @@ SQLite. Si el email ya existe, actualiza el registro.
 from typing import Callable
 from sqlmodel import select
 from employ_toolkit.core.models import CandidateProfile
-from employ_toolkit.core.storage import get_session
+from employ_toolkit.core.storage import unit_of_work
 
 VALID_DISC = ("D", "I", "S", "C")
 
@@ -43,6 +43,32 @@ def intake_wizard(context: dict) -> CandidateProfile:
         error="Debe ser D, I, S o C",
     ).upper()
 
+    stored = save_profile(full_name, email, location, disc)
+    print(f"✓ Registro guardado con id={stored.id}\n")
+    return stored  # Devolvemos la instancia persistente
+
+
+# --------------------------------------------------------------------------- #
+# Variante sin consola (batch)                                                #
+# --------------------------------------------------------------------------- #
+def intake_from_answers(context: dict, answers: dict) -> CandidateProfile:
+    """Paso no interactivo: valida `answers` y guarda el perfil."""
+    missing = [k for k in ("full_name", "email", "location", "disc_type")
+               if not str(answers.get(k, "")).strip()]
+    if missing:
+        raise ValueError(f"Faltan datos de intake: {', '.join(missing)}")
+    disc = str(answers["disc_type"]).strip().upper()
+    if disc not in VALID_DISC:
+        raise ValueError(f"Tipo DISC inválido {disc!r}: debe ser D, I, S o C")
+    return save_profile(answers["full_name"].strip(), answers["email"].strip(),
+                        answers["location"].strip(), disc)
+
+
+# --------------------------------------------------------------------------- #
+# Persistencia                                                                #
+# --------------------------------------------------------------------------- #
+def save_profile(full_name: str, email: str, location: str, disc: str) -> CandidateProfile:
+    """Crea el perfil o, si el email ya existe, lo actualiza."""
     profile = CandidateProfile(
         full_name=full_name,
         email=email,
@@ -50,8 +76,7 @@ def intake_wizard(context: dict) -> CandidateProfile:
         disc_type=disc,
     )
 
-    # ----------------- Persistencia --------------------------------------- #
-    with get_session() as session:
+    with unit_of_work() as session:
         already = session.exec(
             select(CandidateProfile).where(CandidateProfile.email == email)
         ).first()
@@ -65,8 +90,7 @@ def intake_wizard(context: dict) -> CandidateProfile:
             session.add(profile)
             stored = profile
 
-        session.commit()
+        session.flush()
         session.refresh(stored)
 
-    print(f"✓ Registro guardado con id={stored.id}\n")
-    return stored  # Devolvemos la instancia persistente
+    return stored
@@ -1,12 +1,12 @@
 # employ_toolkit/modules/interview.py
 from datetime import date
-import uuid
+from io import BytesIO
 from pathlib import Path
 
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import (
+    DocSpec, Heading, Paragraph, Spacer, Table, emit,
+)
 
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -22,18 +22,8 @@ BLOCKS = [
 ]
 
 
-def generate_interview_pdf(client, scores: dict[str, str], notes: str) -> Path:
-    """Crea informe PDF y devuelve la ruta."""
-    file_path = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_interview.pdf"
-    doc = SimpleDocTemplate(str(file_path), pagesize=LETTER)
-    story = []
-    styles = getSampleStyleSheet()
-
-    # Título
-    story.append(Paragraph(f"Informe de Entrevista – {client.full_name}", styles["Title"]))
-    story.append(Paragraph(f"Fecha: {date.today()}", styles["Normal"]))
-    story.append(Spacer(1, 12))
-
+def interview_spec(client, scores: dict[str, str], notes: str) -> DocSpec:
+    """Contenido del informe de entrevista."""
     # Tabla de puntajes
     data = [["Bloque", "Calificación", "Puntos"]]
     for block in BLOCKS:
@@ -41,25 +31,22 @@ def generate_interview_pdf(client, scores: dict[str, str], notes: str) -> Path:
         points = SCORE_MAP[level]
         data.append([block, level, str(points)])
 
-    tbl = Table(data, colWidths=[180, 120, 60])
-    tbl.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0B6FA4")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-            ]
-        )
-    )
-    story.append(tbl)
-    story.append(Spacer(1, 18))
-
-    # Observaciones
-    story.append(Paragraph("Observaciones", styles["Heading3"]))
-    story.append(Paragraph(notes.replace("\n", "<br/>"), styles["Normal"]))
-
-    doc.build(story)
-    return file_path
+    return DocSpec([
+        Heading(f"Informe de Entrevista – {client.full_name}", 0),
+        Paragraph(f"Fecha: {date.today()}"),
+        Spacer(12),
+        Table(data, col_widths=[180, 120, 60], grid=0.5, grid_color="black",
+              align="CENTER"),
+        Spacer(18),
+        # Observaciones
+        Heading("Observaciones", 3),
+        Paragraph(notes.replace("\n", "<br/>")),
+    ])
+
+
+@content_addressed("interview")
+def generate_interview_pdf(client, scores: dict[str, str], notes: str,
+                           *, in_memory: bool = False) -> Path | BytesIO:
+    """Crea informe PDF y devuelve la ruta."""
+    spec = interview_spec(client, scores, notes)
+    return emit(spec, OUTPUT_DIR, client, "interview", "pdf", in_memory)
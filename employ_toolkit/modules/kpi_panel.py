@@ -1,12 +1,16 @@
 # employ_toolkit/modules/kpi_panel.py
+from io import BytesIO
 from pathlib import Path
-import uuid
 from datetime import date
 
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill   # ← PatternFill
 from openpyxl.formatting.rule import CellIsRule
 
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import output_path
+from employ_toolkit.core.publish import publish
+
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
@@ -21,7 +25,9 @@ INDICATORS = [
 ]
 
 
-def generate_kpi_xlsx(client, current: dict[str, float], metas: dict[str, float]) -> Path:
+@content_addressed("kpis")
+def generate_kpi_xlsx(client, current: dict[str, float], metas: dict[str, float],
+                      *, in_memory: bool = False) -> Path | BytesIO:
     """
     Crea un panel KPI en XLSX con formato condicional de colores.
     """
@@ -59,6 +65,9 @@ def generate_kpi_xlsx(client, current: dict[str, float], metas: dict[str, float]
     ws.conditional_formatting.add(rng, green_rule)
 
     # Guardar
-    path = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_kpis.xlsx"
-    wb.save(path)
-    return path
+    buffer = BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    if in_memory:
+        return buffer
+    return publish(buffer, output_path(OUTPUT_DIR, client, "kpis", "xlsx"))
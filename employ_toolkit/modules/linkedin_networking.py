@@ -1,34 +1,35 @@
+from io import BytesIO
 from pathlib import Path
-from pptx import Presentation
+
+from employ_toolkit.core.docspec import DocSpec, Heading, Paragraph, render, render_bytes
 
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-def networking_ppt(context):
-    profile_name = context["intake"].full_name
-    prs = Presentation()
-    
-    # Portada
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
-    slide.shapes.title.text = "Networking en LinkedIn"
-    slide.placeholders[1].text = f"Guía para {profile_name}"
+def networking_spec(profile_name: str) -> DocSpec:
+    return DocSpec([
+        # Portada
+        Heading("Networking en LinkedIn", 0),
+        Paragraph(f"Guía para {profile_name}", markup=False),
 
-    # Diapositiva perfil
-    s = prs.slides.add_slide(prs.slide_layouts[1])
-    s.shapes.title.text = "Optimiza tu Perfil"
-    s.shapes.placeholders[1].text = "- Foto profesional\n- Titular con PROBLEMA + RESULTADO\n- About orientado a tu oferta de valor"
+        # Diapositiva perfil
+        Heading("Optimiza tu Perfil", 1),
+        Paragraph("- Foto profesional\n- Titular con PROBLEMA + RESULTADO\n- About orientado a tu oferta de valor", markup=False),
 
-    # Diapositiva búsqueda
-    s = prs.slides.add_slide(prs.slide_layouts[1])
-    s.shapes.title.text = "Búsquedas Avanzadas"
-    s.shapes.placeholders[1].text = "- Filtros por industria y cargo\n- Guardar búsquedas\n- Crear alertas"
+        # Diapositiva búsqueda
+        Heading("Búsquedas Avanzadas", 1),
+        Paragraph("- Filtros por industria y cargo\n- Guardar búsquedas\n- Crear alertas", markup=False),
 
-    # Diapositiva mensajes
-    s = prs.slides.add_slide(prs.slide_layouts[1])
-    s.shapes.title.text = "Mensajes de Contacto en Frío"
-    s.shapes.placeholders[1].text = "Ejemplo:\nHola {{nombre}}, vi que lideras {{equipo}} en {{empresa}} …"
+        # Diapositiva mensajes
+        Heading("Mensajes de Contacto en Frío", 1),
+        Paragraph("Ejemplo:\nHola {{nombre}}, vi que lideras {{equipo}} en {{empresa}} …", markup=False),
+    ])
 
+def networking_ppt(context, *, in_memory: bool = False) -> Path | BytesIO:
+    profile_name = context["intake"].full_name
+    if in_memory:
+        return render_bytes(networking_spec(profile_name), "pptx")
     file_path = OUTPUT_DIR / f"networking_linkedin_{profile_name}.pptx"
-    prs.save(file_path)
+    render(networking_spec(profile_name), file_path)
     print(f"✓ Presentación LinkedIn guardada en {file_path}")
     return file_path
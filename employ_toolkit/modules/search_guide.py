@@ -1,10 +1,11 @@
+from io import BytesIO
 from pathlib import Path
 from datetime import date
-import uuid
 
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from employ_toolkit.core.artifacts import content_addressed
+from employ_toolkit.core.docspec import (
+    DocSpec, Heading, Paragraph, Spacer, emit,
+)
 
 OUTPUT_DIR = Path("workspace")
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -28,25 +29,26 @@ DESCRIPTIONS = {
         "Identifica conexiones mutuas y solicita presentación personalizada.",
 }
 
-def generate_search_pdf(client, data: dict) -> Path:
-    path = OUTPUT_DIR / f"{client.full_name}_{uuid.uuid4().hex[:6]}_search.pdf"
-    doc = SimpleDocTemplate(str(path), pagesize=LETTER)
-    st  = getSampleStyleSheet()
-    story = [Paragraph("Guía de Búsqueda Activa de Empleo", st["Title"]),
-             Paragraph(f"{client.full_name} – {date.today()}", st["Normal"]),
-             Spacer(1, 12)]
+def search_spec(client, data: dict) -> DocSpec:
+    spec = DocSpec([Heading("Guía de Búsqueda Activa de Empleo", 0),
+                    Paragraph(f"{client.full_name} – {date.today()}"),
+                    Spacer(12)])
 
     for name, notes in data.items():
         if not notes.strip():
             continue
-        story += [
-            Paragraph(name, st["Heading2"]),
-            Paragraph(DESCRIPTIONS.get(name, ""), st["BodyText"]),
-            Spacer(1, 4),
+        spec.add(
+            Heading(name, 2),
+            Paragraph(DESCRIPTIONS.get(name, ""), "BodyText"),
+            Spacer(4),
             Paragraph(f"<b>Ejemplo / Parámetros:</b><br/>{notes.replace(chr(10), '<br/>')}",
-                      st["BodyText"]),
-            Spacer(1, 12),
-        ]
+                      "BodyText"),
+            Spacer(12),
+        )
+    return spec
 
-    doc.build(story)
-    return path
+
+@content_addressed("search")
+def generate_search_pdf(client, data: dict, *, in_memory: bool = False) -> Path | BytesIO:
+    spec = search_spec(client, data)
+    return emit(spec, OUTPUT_DIR, client, "search", "pdf", in_memory)
@@ -1,16 +1,20 @@
-import pytest, sqlalchemy
+import pytest
 from employ_toolkit.core import storage
 from sqlmodel import create_engine
+from sqlalchemy.pool import StaticPool
 
 @pytest.fixture(autouse=True)
-def _isolate_db(monkeypatch, tmp_path):
-    # engine sólo para el test
-    test_engine = create_engine("sqlite:///:memory:", echo=False)
+def _isolate_db():
+    # engine sólo para el test (una única conexión compartida entre hilos)
+    test_engine = create_engine(
+        "sqlite://", echo=False,
+        connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
     storage.SQLModel.metadata.create_all(test_engine)
 
-    # parchea get_session para que use el engine temporal
-    def _session():
-        return sqlalchemy.orm.Session(test_engine, expire_on_commit=False)
-
-    monkeypatch.setattr(storage, "get_session", _session)
+    # registro de sesiones e init_db() apuntan al engine temporal
+    previous = storage.engine
+    storage.bind_engine(test_engine)
     yield
+    storage.bind_engine(previous)
+    test_engine.dispose()
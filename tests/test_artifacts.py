@@ -0,0 +1,59 @@
+# tests/test_artifacts.py
+from types import SimpleNamespace
+
+import pytest
+
+from employ_toolkit.core import artifacts
+from employ_toolkit.modules import content_plan, networking
+
+DATA = {"meta": 10, "tipos": ["Pares"], "mensaje": "Hola", "tiempo": 30}
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_DIR", tmp_path / ".artifacts")
+    monkeypatch.setattr(networking, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(content_plan, "OUTPUT_DIR", tmp_path)
+    return tmp_path
+
+
+def test_identical_export_reuses_file(workspace):
+    client = SimpleNamespace(full_name="Tester", id=1)
+    first = networking.generate_networking_pdf(client, DATA)
+    mtime = first.stat().st_mtime_ns
+
+    again = networking.generate_networking_pdf(
+        client, {"tiempo": 30, "mensaje": "Hola ", "tipos": ["Pares"], "meta": 10})
+
+    assert again == first and first.stat().st_mtime_ns == mtime
+    assert len(list(workspace.glob("*.pdf"))) == 1
+
+
+def test_key_depends_on_client_and_data(workspace):
+    a = networking.generate_networking_pdf(SimpleNamespace(full_name="A", id=1), DATA)
+    b = networking.generate_networking_pdf(SimpleNamespace(full_name="A", id=2), DATA)
+    c = networking.generate_networking_pdf(SimpleNamespace(full_name="A", id=1),
+                                           {**DATA, "meta": 11})
+    assert len({a, b, c}) == 3
+
+
+def test_key_depends_on_client_name_and_type(workspace):
+    class CandidateProfile(SimpleNamespace):
+        pass
+
+    a = networking.generate_networking_pdf(SimpleNamespace(full_name="A", id=1), DATA)
+    b = networking.generate_networking_pdf(SimpleNamespace(full_name="B", id=1), DATA)
+    c = networking.generate_networking_pdf(CandidateProfile(full_name="A", id=1), DATA)
+    assert len({a, b, c}) == 3 and b.name.startswith("B")
+
+
+def test_missing_artifact_is_rendered_again(workspace):
+    client = SimpleNamespace(full_name="Tester", id=1)
+    params = {"pilares": ["Datos"], "freq": 1, "formatos": ["Post"], "semanas": 1}
+    first = content_plan.generate_content_plan(client, params)
+    first["xlsx"].unlink()
+
+    second = content_plan.generate_content_plan(client, params)
+
+    assert second["xlsx"].is_file() and second != first
+    assert content_plan.generate_content_plan(client, params) == second
@@ -0,0 +1,39 @@
+import asyncio
+from datetime import datetime
+
+from employ_toolkit.core import async_storage, storage
+from employ_toolkit.core.models import Client, Document, User
+
+
+def test_async_queries_match_sync_schema(tmp_path):
+    db = tmp_path / "async.db"
+    storage.configure_engine(db)
+    storage.init_db()
+    with storage.unit_of_work() as s:
+        client = Client(full_name="Async", email="a@a.com", phone="1",
+                        profession="Dev", age=30, disc_type="C")
+        s.add(client); s.flush()
+        s.add(Document(client_id=client.id, module=1, doc_type="x",
+                       path="a.pdf", created_at=datetime(2024, 1, 1)))
+        s.add(Document(client_id=client.id, module=1, doc_type="y",
+                       path="b.pdf", created_at=datetime(2024, 2, 1)))
+        s.add(User(username="ana", password_hash="h"))
+        client_id = client.id
+
+    async def scenario():
+        async_storage.configure_async_engine(db)
+        try:
+            clients, docs, user = await asyncio.gather(
+                async_storage.list_clients(),
+                async_storage.documents_for_client(client_id),
+                async_storage.user_by_username("ana"),
+            )
+        finally:
+            await async_storage.dispose_async_engine()
+        return clients, docs, user
+
+    clients, docs, user = asyncio.run(scenario())
+    assert [c.email for c in clients] == ["a@a.com"]
+    assert [d.path for d in docs] == ["b.pdf", "a.pdf"]
+    assert user.username == "ana"
+    storage.engine.dispose()
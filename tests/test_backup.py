@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+from sqlmodel import select
+
+from employ_toolkit.core import backup, storage
+from employ_toolkit.core.models import Client
+
+
+def _client(name):
+    with storage.unit_of_work() as s:
+        c = Client(full_name=name, email=f"{name}@x.com", phone="0", profession="QA",
+                   age=30, disc_type="D")
+        s.add(c)
+    return c.id
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    storage.configure_engine(tmp_path / "live.db")
+    storage.init_db()
+    yield tmp_path
+    storage.engine.dispose()
+
+
+def test_backup_rotate_and_restore(file_db):
+    kept = file_db / "bk"
+    service = backup.BackupService(kept, keep=2, pages=1)
+    cid = _client("antes")
+    paths = [service.submit().result() for _ in range(3)]
+    service.shutdown()
+
+    assert backup.list_backups(kept) == paths[1:]
+    assert not list(kept.glob("*.partial"))
+
+    _client("despues")
+    storage.get_client(cid)                          # llena la caché
+    backup.restore(paths[-1])
+
+    with storage.unit_of_work() as s:
+        names = [c.full_name for c in s.exec(select(Client)).all()]
+    assert names == ["antes"]
+
+
+def test_writers_progress_during_backup(file_db):
+    for i in range(200):
+        _client(f"c{i}")
+    steps = []
+    gate = threading.Event()
+
+    def progress(_status, remaining, total):
+        steps.append(remaining)
+        if len(steps) == 1:
+            _client("escrito-durante")               # no queda bloqueado
+            gate.set()
+
+    backup.backup(file_db / "bk", pages=1, progress=progress)
+    assert gate.is_set() and len(steps) > 1
+
+
+def test_memory_db_is_rejected():
+    with pytest.raises(ValueError):
+        backup.backup()
@@ -0,0 +1,68 @@
+import csv
+import json
+from pathlib import Path
+
+from sqlmodel import SQLModel, select
+
+from employ_toolkit.core import batch, storage
+from employ_toolkit.core.models import CandidateProfile
+from employ_toolkit.modules import brand_canvas, content_plan, linkedin_networking
+
+
+def _client(n, disc="D"):
+    return {
+        "intake": {"full_name": f"Cliente {n}", "email": f"c{n}@mail.com",
+                   "location": "Santiago", "disc_type": disc},
+        "brand_canvas": {"propósito": "Ayudar", "audiencia": "Reclutadores"},
+        "content_plan": {"pilares": ["Datos", "Carrera"], "freq": 2, "semanas": 1},
+        "demand_analysis": {"cargos": ["Analista", "Data Engineer"]},
+    }
+
+
+def test_csv_columns_are_nested_and_typed(tmp_path):
+    path = tmp_path / "cohorte.csv"
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        w = csv.writer(fh)
+        w.writerow(["intake.email", "content_plan.pilares", "content_plan.freq",
+                    "demand_analysis.cargos"])
+        w.writerow(["a@b.cl", "Datos; Carrera", "3", "Analista;PM"])
+    [record] = batch.read_records(path)
+    assert record == {"intake": {"email": "a@b.cl"},
+                      "content_plan": {"pilares": ["Datos", "Carrera"], "freq": 3},
+                      "demand_analysis": {"cargos": ["Analista", "PM"]}}
+
+
+def test_batch_runs_clients_in_processes_and_logs_errors(tmp_path, monkeypatch):
+    for module in (brand_canvas, content_plan, linkedin_networking):
+        monkeypatch.setattr(module, "OUTPUT_DIR", tmp_path)
+    # base en archivo: los procesos hijos no ven una base en memoria
+    file_engine = storage.make_engine(tmp_path / "batch.db")
+    SQLModel.metadata.create_all(file_engine)
+    storage.bind_engine(file_engine)
+
+    source = tmp_path / "cohorte.jsonl"
+    rows = [_client(1), _client(2, disc="X"), _client(3)]
+    source.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in rows) + "\n",
+                      encoding="utf-8")
+
+    summary = batch.run_batch(source, tmp_path / "log.ndjson", workers=2)
+    file_engine.dispose()
+
+    assert (summary.total, summary.ok, summary.partial, summary.failed) == (3, 2, 0, 1)
+    lines = {l["client"]: l for l in map(json.loads,
+                                         summary.log_path.read_text().splitlines())}
+    bad = lines["c2@mail.com"]
+    assert bad["status"] == "error" and "DISC" in bad["errors"]["intake"]
+    # sin intake el resto del cliente se omite, no se ejecuta
+    assert "omitido" in bad["errors"]["content_plan"]
+
+    good = lines["c1@mail.com"]
+    assert good["status"] == "ok" and good["errors"] == {}
+    assert set(good["outputs"]) == {"brand_canvas", "content_plan",
+                                    "linkedin_networking", "demand_analysis"}
+    assert Path(good["outputs"]["content_plan"]["xlsx"]).exists()
+    assert [p["title"] for p in good["outputs"]["demand_analysis"]] == ["Analista",
+                                                                        "Data Engineer"]
+    with storage.SessionFactory(bind=file_engine) as s:
+        emails = sorted(p.email for p in s.exec(select(CandidateProfile)))
+    assert emails == ["c1@mail.com", "c3@mail.com"]
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from employ_toolkit.core import checkpoints, storage
+from employ_toolkit.core.models import CandidateProfile, WorkflowRun
+from employ_toolkit.core.workflow import WorkflowError, WorkflowManager
+
+
+def _intake(ctx):
+    profile = CandidateProfile(full_name="Ana", email="a@x.com", location="X", disc_type="D")
+    with storage.unit_of_work() as s:
+        s.add(profile)
+    return profile
+
+
+def test_roundtrip_encoding():
+    profile = _intake({})
+    value = {"pdf": Path("out/a.pdf"), "scores": (1, 2.5), "perfil": profile,
+             "tmp": CandidateProfile(full_name="B", email="b", location="Y", disc_type="I"),
+             "tags": {"x", "y"}}
+    with storage.SessionFactory() as s:
+        back = checkpoints.decode(checkpoints.encode(value), s)
+    assert back["pdf"] == Path("out/a.pdf") and back["scores"] == (1, 2.5)
+    assert back["perfil"].id == profile.id and back["perfil"].full_name == "Ana"
+    assert back["tmp"].full_name == "B" and back["tags"] == {"x", "y"}
+
+
+def _register(wm, calls, fail=False):
+    def step(name, result):
+        def run(ctx):
+            calls.append(name)
+            if name == "demand_analysis" and fail:
+                raise RuntimeError("caída")
+            return result(ctx)
+        return run
+
+    wm.add_step("intake", step("intake", _intake))
+    wm.add_step("brand_canvas", step("brand_canvas", lambda c: Path("bc.pdf")), ["intake"])
+    wm.add_step("demand_analysis",
+                step("demand_analysis", lambda c: [c["intake"].full_name]), ["brand_canvas"])
+
+
+def test_resume_skips_finished_steps():
+    calls = []
+    wm = WorkflowManager(checkpoint=True)
+    _register(wm, calls, fail=True)
+    with pytest.raises(WorkflowError):
+        wm.run()
+    run_id = wm.run_id
+    with storage.SessionFactory() as s:
+        assert s.get(WorkflowRun, run_id).status == "failed"
+
+    again = WorkflowManager()
+    _register(again, calls)
+    ctx = again.resume(run_id)
+
+    assert calls == ["intake", "brand_canvas", "demand_analysis", "demand_analysis"]
+    assert ctx["brand_canvas"] == Path("bc.pdf") and ctx["demand_analysis"] == ["Ana"]
+    with storage.SessionFactory() as s:
+        assert s.get(WorkflowRun, run_id).status == "done"
+
+
+def test_resume_sequential_run_step_and_unknown_run():
+    calls = []
+    wm = WorkflowManager(checkpoint=True)
+    wm.run_step("intake", lambda c: calls.append(1) or "perfil")
+    again = WorkflowManager()
+    again.resume(wm.run_id)
+    assert again.run_step("intake", lambda c: calls.append(2)) == "perfil"
+    assert calls == [1]
+    with pytest.raises(LookupError):
+        WorkflowManager().resume("no-existe")
@@ -0,0 +1,28 @@
+# tests/test_cli.py
+import argparse
+from types import SimpleNamespace
+
+import cli
+from employ_toolkit.modules import content_plan
+
+
+def test_cli_workflow_builds(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    wm = cli.build_workflow(argparse.Namespace(trace=None, step_timeout=None))
+
+    order = wm.order()
+    assert order[0] == "intake"
+    assert set(order) == {"intake", "brand_canvas", "content_plan",
+                          "linkedin_networking", "demand_analysis"}
+    assert all(callable(step.func) for step in wm.steps.values())
+    assert wm.steps["content_plan"].interactive
+
+
+def test_content_plan_wizard(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    answers = iter(["Conocimiento, Cultura", "", "", "2"])   # vacío → por defecto
+    monkeypatch.setattr("builtins.input", lambda _: next(answers))
+
+    paths = content_plan.content_plan_wizard(
+        {"intake": SimpleNamespace(full_name="User", id=1)})
+    assert paths["docx"].exists() and paths["xlsx"].exists()
@@ -0,0 +1,64 @@
+import random
+
+from employ_toolkit.core import cv_versions, storage
+from employ_toolkit.core.models import CVData, Client
+from sqlmodel import select
+
+
+def _client():
+    with storage.unit_of_work() as s:
+        c = Client(full_name="Ana", email="a@x.com", phone="0", profession="QA",
+                   age=30, disc_type="D")
+        s.add(c)
+    return c.id
+
+
+def _cv(n_jobs=30):
+    return {
+        "nombre": "Ana", "titulo": "QA Lead", "resumen": "Perfil " * 40,
+        "experiencia": "\n".join(f"Puesto {i} · Empresa {i} · logros" for i in range(n_jobs)),
+        "skills": ["python", "sql"],
+    }
+
+
+def test_every_version_reconstructs_and_deltas_stay_small():
+    cid = _client()
+    rnd = random.Random(1)
+    cv, versions = _cv(), []
+    for i in range(40):
+        lines = cv["experiencia"].splitlines()
+        lines[rnd.randrange(len(lines))] = f"Puesto editado {i}"
+        cv = {**cv, "experiencia": "\n".join(lines), "skills": cv["skills"] + [f"s{i}"]}
+        if i % 7 == 0:
+            cv.pop("titulo", None) if i % 14 == 0 else cv.update(titulo=f"QA {i}")
+        cv_versions.save_version(cid, cv)
+        versions.append(cv)
+
+    for n, expected in enumerate(versions, start=1):
+        assert cv_versions.load_version(cid, n) == expected
+    info = cv_versions.history(cid)
+    fulls = [v for v in info if v.kind == "full"]
+    deltas = [v for v in info if v.kind == "delta"]
+    avg_delta = sum(d.size for d in deltas) / len(deltas)
+    assert len(fulls) == 3 and avg_delta < min(f.size for f in fulls) / 2
+
+
+def test_unchanged_save_is_noop_and_snapshot_kept():
+    cid = _client()
+    first = cv_versions.save_version(cid, _cv(), docx_path="cv.docx")
+    assert cv_versions.save_version(cid, _cv()).version == first.version
+    with storage.unit_of_work() as s:
+        snap = s.exec(select(CVData).where(CVData.client_id == cid)).one()
+    assert snap.docx_path == "cv.docx" and "QA Lead" in snap.json_blob
+    assert cv_versions.load_version(cid + 1) is None
+
+
+def test_diff_versions():
+    cid = _client()
+    cv_versions.save_version(cid, {"titulo": "A", "skills": ["x"]})
+    cv_versions.save_version(cid, {"titulo": "B", "skills": ["x", "y"], "idiomas": "es"})
+    assert cv_versions.diff_versions(cid, 1, 2) == [
+        cv_versions.Change("add", ("idiomas",), None, "es"),
+        cv_versions.Change("add", ("skills", 1), None, "y"),
+        cv_versions.Change("change", ("titulo",), "A", "B"),
+    ]
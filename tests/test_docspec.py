@@ -0,0 +1,46 @@
+import pytest
+from docx import Document
+from pptx import Presentation
+
+from employ_toolkit.core.docspec import (
+    Bullets, Chart, DocSpec, Heading, PageBreak, Paragraph, Spacer, Table, render,
+)
+
+
+def _spec():
+    return DocSpec([
+        Heading("Informe – Tester", 0),
+        Paragraph("Fecha: hoy"),
+        Heading("Resumen", 1),
+        Paragraph("Texto con <b>negrita</b><br/>y salto"),
+        Bullets(["uno", "dos"]),
+        Table.key_value([("Meta", "10"), ("Tiempo", "30")]),
+        PageBreak(),
+        Heading("Salarios", 1),
+        Chart(["Junior", "Senior"], [20, 45], series="Salario medio"),
+        Spacer(12),
+    ], title="Informe")
+
+
+def test_same_spec_renders_to_every_format(tmp_path):
+    paths = render(_spec(), tmp_path / "a.pdf", tmp_path / "a.docx", tmp_path / "a.pptx")
+    assert all(p.stat().st_size > 0 for p in paths)
+    assert (tmp_path / "a.pdf").read_bytes().startswith(b"%PDF")
+
+    doc = Document(tmp_path / "a.docx")
+    texts = [p.text for p in doc.paragraphs]
+    assert "Informe – Tester" in texts and "uno" in texts
+    bold = [r.text for p in doc.paragraphs for r in p.runs if r.bold]
+    assert "negrita" in bold
+    assert doc.tables[0].cell(1, 0).text == "Tiempo"
+    assert doc.tables[1].cell(2, 1).text == "45"          # gráfico como tabla
+
+    slides = Presentation(tmp_path / "a.pptx").slides
+    titles = [s.shapes.title.text for s in slides]
+    assert titles == ["Informe – Tester", "Resumen", "Resumen", "Salarios"]
+    assert any(sh.has_chart for sh in slides[3].shapes)
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="no soportado"):
+        render(_spec(), tmp_path / "a.odt")
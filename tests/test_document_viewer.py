@@ -0,0 +1,26 @@
+# tests/test_document_viewer.py
+from types import SimpleNamespace
+
+from PySide6.QtWidgets import QMessageBox
+
+from employ_toolkit.core.registry import flush_documents, register_document
+from employ_toolkit.core.storage import get_documents
+from employ_toolkit.gui.forms import document_viewer
+from employ_toolkit.gui.forms.document_viewer import DocumentListDialog
+
+
+def test_shared_file_survives_until_last_row(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setattr(document_viewer.QMessageBox, "question",
+                        lambda *a, **k: QMessageBox.Yes)
+    shared = tmp_path / "plan.pdf"
+    shared.write_bytes(b"%PDF")
+    register_document(1, 1, "plan", shared)
+    register_document(2, 1, "plan", shared)          # mismo entregable, otro cliente
+    flush_documents()
+
+    for client_id, exists in ((1, True), (2, False)):
+        dialog = DocumentListDialog(SimpleNamespace(id=client_id, full_name="T"))
+        qtbot.addWidget(dialog)
+        dialog.list_widget.setCurrentRow(0)
+        dialog._delete_selected()
+        assert not get_documents(client_id) and shared.exists() is exists
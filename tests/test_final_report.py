@@ -0,0 +1,81 @@
+# tests/test_final_report.py
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from PyPDF2 import PdfReader
+from openpyxl import Workbook, load_workbook
+
+from employ_toolkit.core.docspec import DocSpec, Heading, Paragraph, render
+from employ_toolkit.core.registry import documents
+from employ_toolkit.core.storage import get_documents
+from employ_toolkit.modules import final_report
+
+CLIENT = SimpleNamespace(id=1, full_name="Tester")
+T0 = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(final_report, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(final_report, "MANIFEST_DIR", tmp_path / ".final_reports")
+    return tmp_path
+
+
+def _deliverable(directory, name, module, minute, text=None):
+    path = directory / f"{name}.pdf"
+    render(DocSpec([Heading(name, 0), Paragraph(text or f"Contenido de {name}")]), path)
+    documents.register(CLIENT.id, module, name, path, created_at=T0 + timedelta(minutes=minute))
+    return path
+
+
+def _mode(workspace):
+    manifest = json.loads((workspace / ".final_reports" / "1.json").read_text())
+    return manifest["pdf"]["mode"]
+
+
+def _titles(path):
+    return [p.extract_text().splitlines()[0] for p in PdfReader(path).pages]
+
+
+def test_new_documents_are_appended(workspace):
+    first = _deliverable(workspace, "canvas", 1, 0)
+    _deliverable(workspace, "ats", 2, 1)
+    pdf = final_report.generate_final_report(CLIENT)["pdf"]
+    assert _mode(workspace) == "rebuild"
+    before = pdf.read_bytes()
+
+    _deliverable(workspace, "entrevista", 3, 2)
+    final_report.generate_final_report(CLIENT)
+    assert _mode(workspace) == "append"
+    assert pdf.read_bytes().startswith(before)                   # sólo el delta
+    assert _titles(pdf) == ["canvas", "ats", "entrevista"]
+
+    final_report.generate_final_report(CLIENT)
+    assert _mode(workspace) == "unchanged"
+
+    render(DocSpec([Heading("canvas v2", 0)]), first)            # cambia uno anterior
+    final_report.generate_final_report(CLIENT)
+    assert _mode(workspace) == "rebuild"
+    assert _titles(pdf) == ["canvas v2", "ats", "entrevista"]
+
+    finals = [d for d in get_documents(CLIENT.id) if d.module == final_report.FINAL_MODULE]
+    assert [d.doc_type for d in finals] == ["final_pdf"]          # registrado una vez
+
+
+def test_xlsx_only_when_there_are_spreadsheets(workspace):
+    _deliverable(workspace, "canvas", 1, 0)
+    merged = final_report.generate_final_report(CLIENT)
+    assert set(merged) == {"pdf"}
+
+    for i in range(2):
+        wb = Workbook()
+        wb.active.append(["KPI", i])
+        wb.save(workspace / f"kpis{i}.xlsx")
+        documents.register(CLIENT.id, 3, "kpis", workspace / f"kpis{i}.xlsx",
+                           created_at=T0 + timedelta(minutes=5 + i))
+    merged = final_report.generate_final_report(CLIENT)
+
+    sheets = load_workbook(merged["xlsx"]).sheetnames
+    assert sheets == ["kpis0_Sheet", "kpis1_Sheet"]
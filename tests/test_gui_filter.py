@@ -0,0 +1,41 @@
+# tests/test_gui_filter.py
+from PySide6.QtCore import Qt
+
+from employ_toolkit.core.models import Client
+from employ_toolkit.core.storage import init_db, unit_of_work
+from employ_toolkit.gui.main import MainWindow
+
+
+def test_filter_is_debounced(qtbot, monkeypatch):
+    init_db()
+    calls = []
+    monkeypatch.setattr(MainWindow, "_apply_filter", lambda self, text: calls.append(text))
+    win = MainWindow("qa", "consultor")
+    qtbot.addWidget(win)
+
+    for text in ("a", "an", "ana"):
+        win.txt_filter.setText(text)
+    assert calls == []                                 # aún escribiendo
+
+    qtbot.waitUntil(lambda: calls == ["ana"], timeout=2000)
+    qtbot.wait(MainWindow.FILTER_DELAY_MS + 100)
+    assert calls == ["ana"]
+
+
+def test_header_sort_requeries_indexed_order(qtbot):
+    init_db()
+    with unit_of_work() as s:
+        s.add_all(Client(full_name=name, email=f"{name}@x.com", phone="0",
+                         profession="QA", age=30, disc_type="D")
+                  for name in ("Carla", "Ana", "Beto"))
+    win = MainWindow("qa", "consultor")
+    qtbot.addWidget(win)
+    win.model.PAGE_SIZE = 2                          # la 3ª fila aún sin cargar
+    win._load_clients()
+    header = win.table.horizontalHeader()
+
+    header.setSortIndicator(1, Qt.AscendingOrder)      # Nombre: indexado
+    assert [win.model.client_at(r).full_name for r in range(2)] == ["Ana", "Beto"]
+
+    header.setSortIndicator(2, Qt.AscendingOrder)      # Email: sin índice
+    assert (header.sortIndicatorSection(), win.model.order_by) == (1, "full_name")
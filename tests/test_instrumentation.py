@@ -0,0 +1,52 @@
+import logging
+
+import pytest
+from sqlmodel import select
+
+from employ_toolkit.core import instrumentation, storage
+from employ_toolkit.core.models import Client
+
+
+@pytest.fixture
+def traced():
+    instrumentation.reset()
+    instrumentation.enable(slow_ms=10_000, n_plus_one=5)
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_off_by_default_registers_nothing():
+    assert not instrumentation.enabled()
+    with storage.unit_of_work() as s:
+        s.exec(select(Client)).all()
+    assert instrumentation.stats() == {}
+
+
+def test_histogram_and_n_plus_one(traced, caplog):
+    caplog.set_level(logging.WARNING, logger="employ_toolkit.sql")
+    with storage.unit_of_work() as s:
+        for i in range(6):
+            s.exec(select(Client).where(Client.id == i)).all()
+
+    (sql, st), = [(k, v) for k, v in instrumentation.stats().items() if "FROM client" in k]
+    assert st.count == 6 and sum(st.buckets) == 6
+    n1 = [r for r in caplog.records if r.getMessage().startswith("N+1")]
+    assert len(n1) == 1 and "test_instrumentation:" in n1[0].getMessage()
+
+
+def test_counter_resets_per_transaction(traced, caplog):
+    caplog.set_level(logging.WARNING, logger="employ_toolkit.sql")
+    for _ in range(3):
+        with storage.unit_of_work() as s:
+            for i in range(2):
+                s.exec(select(Client).where(Client.id == i)).all()
+    assert not [r for r in caplog.records if r.getMessage().startswith("N+1")]
+
+
+def test_slow_query_logs_caller(traced, caplog):
+    caplog.set_level(logging.WARNING, logger="employ_toolkit.sql")
+    instrumentation.enable(slow_ms=0)
+    storage.get_client(1)
+    slow = [r.getMessage() for r in caplog.records if r.getMessage().startswith("SLOW")]
+    assert slow and "test_instrumentation:" in slow[0] and "core.storage" not in slow[0]
@@ -0,0 +1,56 @@
+from sqlmodel import delete, select
+
+from employ_toolkit.core import maintenance, storage
+from employ_toolkit.core.models import Client, Document
+
+
+def _grow_and_shrink():
+    with storage.unit_of_work() as s:
+        c = Client(full_name="A", email="a@x.com", phone="0", profession="QA",
+                   age=30, disc_type="D")
+        s.add(c)
+        s.flush()
+        s.add_all(Document(client_id=c.id, module=1, doc_type="pdf", path="p" * 400)
+                  for _ in range(2000))
+    with storage.unit_of_work() as s:
+        s.exec(delete(Document))
+
+
+def test_run_reclaims_free_pages_and_is_recorded(monkeypatch):
+    storage.init_db()                       # v4: auto_vacuum=INCREMENTAL
+    _grow_and_shrink()
+
+    monkeypatch.setattr(maintenance, "VACUUM_BATCH", 7)      # varias transacciones
+    run = maintenance.run_maintenance()
+
+    assert run.freelist_before > 0 and run.freelist_after == 0
+    assert run.page_count_after < run.page_count_before
+    assert run.tasks == "optimize,analyze,incremental_vacuum"
+    assert [r.id for r in maintenance.recent_runs()] == [run.id]
+
+
+def test_scheduler_triggers():
+    sched = maintenance.MaintenanceScheduler(interval=100, idle_after=10)
+    start = sched._last_run
+    assert sched.due(start + 5) is None
+    sched.touch()
+    assert sched.due(sched._last_write + 11) == "idle"
+    sched._last_write = None
+    assert sched.due(start + 101) == "schedule"
+
+
+def test_only_commits_with_changes_count_as_writes():
+    storage.init_db()
+    sched = maintenance.MaintenanceScheduler(poll=3600)
+    sched.start()
+    try:
+        with storage.unit_of_work() as s:                   # sólo lectura
+            s.exec(select(Client)).all()
+        assert sched._last_write is None
+
+        with storage.unit_of_work() as s:
+            s.add(Client(full_name="B", email="b@x.com", phone="0", profession="QA",
+                         age=30, disc_type="D"))
+        assert sched._last_write is not None
+    finally:
+        sched.stop()
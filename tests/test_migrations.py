@@ -0,0 +1,31 @@
+import sqlite3
+
+from sqlalchemy import text
+
+from employ_toolkit.core import migrations, storage
+
+
+def test_init_db_upgrades_legacy_file(tmp_path):
+    db = tmp_path / "legacy.db"
+    raw = sqlite3.connect(db)
+    raw.executescript("""
+        CREATE TABLE client (id INTEGER PRIMARY KEY, full_name VARCHAR, email VARCHAR,
+            phone VARCHAR, profession VARCHAR, age INTEGER, disc_type VARCHAR);
+        CREATE TABLE document (id INTEGER PRIMARY KEY, client_id INTEGER, module INTEGER,
+            doc_type VARCHAR, path VARCHAR, created_at DATETIME);
+    """)
+    raw.close()
+
+    storage.configure_engine(db)
+    storage.init_db()
+
+    with storage.engine.connect() as conn:
+        names = set(conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+        assert migrations.schema_version(conn) == len(migrations.MIGRATIONS)
+    assert {"ix_client_email", "ix_document_client_id_module_created_at",
+            "ix_document_client_id_created_at"} <= names
+
+    # idempotente: una segunda pasada no hace nada
+    assert migrations.migrate(storage.engine) == len(migrations.MIGRATIONS)
+    storage.engine.dispose()
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from employ_toolkit.core import storage
+from employ_toolkit.core.models import Client, Document
+
+
+def _seed(n_clients=7, n_docs=9):
+    base = datetime(2025, 1, 1)
+    with storage.unit_of_work() as s:
+        clients = [Client(full_name=f"Cliente {i % 3}", email=f"c{i}@x.com", phone="0",
+                          profession="QA", age=30, disc_type="D") for i in range(n_clients)]
+        s.add_all(clients)
+        s.flush()
+        cid = clients[0].id
+        # marcas de tiempo repetidas: el id desempata
+        s.add_all(Document(client_id=cid, module=1, doc_type="pdf", path=f"d{i}.pdf",
+                           created_at=base + timedelta(days=i // 2)) for i in range(n_docs))
+    return cid
+
+
+def _walk(fetch):
+    items, cursor = [], None
+    while True:
+        page = fetch(cursor)
+        items += page.items
+        if page.next_cursor is None:
+            return items
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("order_by", ["id", "full_name"])
+def test_clients_pages_cover_everything_in_order(order_by):
+    _seed()
+    got = _walk(lambda c: storage.paginate_clients(c, limit=3, order_by=order_by))
+    keys = [tuple(getattr(c, col.key) for col in storage.CLIENT_SORTS[order_by]) for c in got]
+    assert keys == sorted(keys, reverse=True) and len(set(keys)) == 7
+
+
+def test_documents_pages_follow_created_at_desc():
+    cid = _seed()
+    got = _walk(lambda c: storage.paginate_documents(cid, c, limit=4))
+    assert [(d.created_at, d.id) for d in got] == sorted(
+        ((d.created_at, d.id) for d in got), reverse=True)
+    assert len(got) == 9
+
+
+def test_unindexed_sort_and_bad_cursor_rejected():
+    with pytest.raises(ValueError):
+        storage.paginate_clients(order_by="email")
+    with pytest.raises(ValueError):
+        storage.paginate_clients("no-es-un-cursor")
+
+
+def test_name_sort_uses_index():
+    storage.init_db()
+    with storage.engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM client "
+            "WHERE (full_name, id) < ('m', 5) ORDER BY full_name DESC, id DESC LIMIT 10")))
+    assert "ix_client_full_name" in plan and "TEMP B-TREE" not in plan
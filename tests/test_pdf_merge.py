@@ -0,0 +1,77 @@
+# tests/test_pdf_merge.py
+import mmap
+
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, DictionaryObject, NameObject, NumberObject
+
+from employ_toolkit.core.docspec import DocSpec, Heading, Paragraph, render
+from employ_toolkit.core import pdf_merge
+from employ_toolkit.core.pdf_merge import append_pdfs, merge_pdfs
+
+
+def _doc(path, title):
+    render(DocSpec([Heading(title, 0), Paragraph(f"Contenido de {title}")]), path)
+    return path
+
+
+def _titles(path):
+    return [p.extract_text().splitlines()[0] for p in PdfReader(path, strict=True).pages]
+
+
+def test_streaming_merge_shares_resources(tmp_path):
+    sources = [_doc(tmp_path / f"{n}.pdf", n) for n in ("uno", "dos", "tres")]
+    out = tmp_path / "final.pdf"
+    with out.open("wb") as fh:
+        stats = merge_pdfs(sources, fh)
+
+    assert _titles(out) == ["uno", "dos", "tres"]
+    assert stats.pages == 3 and stats.deduplicated > 0          # fuentes compartidas
+    fonts = {ref.idnum for p in PdfReader(out).pages
+             for ref in p["/Resources"].raw_get("/Font").get_object().values()}
+    assert len(fonts) == len(PdfReader(sources[0]).pages[0]["/Resources"]["/Font"])
+
+    append_pdfs(out, [_doc(tmp_path / "cuatro.pdf", "cuatro")])
+    assert _titles(out) == ["uno", "dos", "tres", "cuatro"]
+
+
+def test_append_maps_every_file(tmp_path, monkeypatch):
+    out = tmp_path / "final.pdf"
+    with out.open("wb") as fh:
+        merge_pdfs([_doc(tmp_path / "uno.pdf", "uno")], fh)
+    opened = []
+    monkeypatch.setattr(pdf_merge, "PdfReader",
+                        lambda stream: opened.append(stream) or PdfReader(stream))
+
+    assert append_pdfs(out, [_doc(tmp_path / f"{n}.pdf", n) for n in ("dos", "tres")]) == 2
+    assert _titles(out) == ["uno", "dos", "tres"]
+    assert len(opened) == 3 and all(isinstance(s, mmap.mmap) for s in opened)
+
+
+def test_reference_cycles_are_copied(tmp_path):
+    writer = PdfWriter()
+    writer.add_blank_page(200, 200)
+    page = writer.pages[0]
+    field = DictionaryObject({NameObject("/T"): NameObject("/campo")})
+    widget = DictionaryObject({
+        NameObject("/Type"): NameObject("/Annot"),
+        NameObject("/Subtype"): NameObject("/Widget"),
+        NameObject("/Rect"): ArrayObject([NumberObject(0)] * 4),
+        NameObject("/P"): page.indirect_reference,
+    })
+    field_ref, widget_ref = writer._add_object(field), writer._add_object(widget)
+    widget[NameObject("/Parent")] = field_ref                   # widget ↔ campo
+    field[NameObject("/Kids")] = ArrayObject([widget_ref])
+    page[NameObject("/Annots")] = ArrayObject([widget_ref])
+    src = tmp_path / "form.pdf"
+    with src.open("wb") as fh:
+        writer.write(fh)
+
+    out = tmp_path / "final.pdf"
+    with out.open("wb") as fh:
+        merge_pdfs([_doc(tmp_path / "a.pdf", "a"), src], fh)
+
+    merged = PdfReader(out, strict=True).pages[1]
+    widget_ref = merged["/Annots"][0]
+    annot = widget_ref.get_object()
+    assert annot.raw_get("/P").idnum == merged.indirect_reference.idnum
+    assert annot["/Parent"]["/Kids"][0].idnum == widget_ref.idnum
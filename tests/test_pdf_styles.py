@@ -0,0 +1,25 @@
+from reportlab.lib import colors
+
+from employ_toolkit.core import pdf_styles
+
+
+def test_stylesheet_and_table_styles_are_built_once():
+    assert pdf_styles.stylesheet() is pdf_styles.stylesheet()
+    top = ("VALIGN", (0, 0), (-1, -1), "TOP")
+    assert pdf_styles.header_table_style(top, grid=0.3) is \
+        pdf_styles.header_table_style(top, grid=0.3)
+    assert pdf_styles.header_table_style() is not pdf_styles.header_table_style(top)
+
+
+def test_header_table_style_commands():
+    cmds = pdf_styles.header_table_style(("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                                         grid=0.5, grid_color=colors.black).getCommands()
+    assert cmds[0] == ("GRID", (0, 0), (-1, -1), 0.5, colors.black)
+    assert ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0B6FA4")) in cmds
+    assert cmds[-1] == ("ALIGN", (0, 0), (-1, -1), "CENTER")
+
+
+def test_derive_does_not_touch_shared_style():
+    small = pdf_styles.derive("Normal", fontSize=8)
+    assert small is pdf_styles.derive("Normal", fontSize=8)
+    assert small.fontSize == 8 and pdf_styles.stylesheet()["Normal"].fontSize == 10
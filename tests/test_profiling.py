@@ -0,0 +1,74 @@
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from employ_toolkit.core.profiling import summary_table
+from employ_toolkit.core.step_cache import StepCache
+from employ_toolkit.core.workflow import WorkflowError, WorkflowManager
+
+
+def _busy(ctx, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return seconds
+
+
+def _alloc(ctx):
+    blob = bytearray(8 * 2**20)
+    return len(blob)
+
+
+def test_profiles_wall_cpu_memory_and_trace(tmp_path):
+    wm = WorkflowManager(profile=True)
+    wm.add_step("busy", _busy, seconds=0.1)
+    wm.add_step("sleep", lambda ctx: time.sleep(0.1))
+    wm.add_step("alloc", _alloc, depends_on=["busy", "sleep"])
+    wm.run()
+
+    by = {p.name: p for p in wm.profiles}
+    assert by["busy"].wall_s >= 0.1 and by["busy"].cpu_s >= 0.05
+    assert by["sleep"].wall_s >= 0.1 and by["sleep"].cpu_s < 0.05
+    assert by["alloc"].peak_bytes >= 8 * 2**20
+
+    trace = json.loads(wm.write_trace(tmp_path / "t.json").read_text())
+    events = {e["name"]: e for e in trace["traceEvents"]}
+    assert events["busy"]["ph"] == "X" and events["busy"]["dur"] >= 100_000
+    assert events["alloc"]["ts"] >= events["busy"]["ts"] + events["busy"]["dur"]
+    rows = wm.summary().splitlines()[2:]
+    assert rows[-1].startswith("alloc") and len(rows) == 3
+
+
+def test_process_executor_cache_hits_and_errors(tmp_path):
+    wm = WorkflowManager(profile=True, cache=StepCache(tmp_path))
+    wm.add_step("busy", _busy, seconds=0.05)
+    wm.run(executor="process")
+    again = WorkflowManager(profile=True, cache=StepCache(tmp_path))
+    again.add_step("busy", _busy, seconds=0.05)
+    again.run()
+    assert wm.profiles[0].wall_s >= 0.05 and again.profiles[0].cached
+    assert "caché" in summary_table(again.profiles)
+
+    failing = WorkflowManager(profile=True)
+    failing.add_step("boom", lambda ctx: 1 / 0)
+    with pytest.raises(WorkflowError):
+        failing.run()
+    assert failing.profiles[0].error.startswith("ZeroDivisionError")
+
+
+def test_external_tracemalloc_is_left_running():
+    tracemalloc.start()
+    try:
+        wm = WorkflowManager(profile=True)
+        wm.add_step("alloc", _alloc)
+        wm.run()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    wm = WorkflowManager(profile=True)
+    wm.add_step("alloc", _alloc)
+    wm.run()
+    assert not tracemalloc.is_tracing()              # el que arrancó, lo para
@@ -0,0 +1,64 @@
+# tests/test_publish.py
+import os
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+
+from employ_toolkit.core import doc_backends  # noqa: F401  (registra backends)
+from employ_toolkit.core import docspec
+from employ_toolkit.core.docspec import DocSpec, Heading, render
+from employ_toolkit.core.publish import publish
+from employ_toolkit.modules import content_plan, networking
+
+
+def test_in_memory_does_not_touch_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(networking, "OUTPUT_DIR", tmp_path)
+    client = SimpleNamespace(full_name="Tester", id=1)
+    data = {"meta": 10, "tipos": ["Pares"], "mensaje": "Hola", "tiempo": 30}
+
+    pdf = networking.generate_networking_pdf(client, data, in_memory=True)
+
+    assert isinstance(pdf, BytesIO)
+    assert pdf.read(4) == b"%PDF"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_in_memory_multi_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(content_plan, "OUTPUT_DIR", tmp_path)
+    client = SimpleNamespace(full_name="Tester", id=1)
+    params = {"pilares": ["Datos"], "freq": 2, "formatos": ["Post"], "semanas": 1}
+
+    out = content_plan.generate_content_plan(client, params, in_memory=True)
+
+    assert set(out) == {"docx", "xlsx"}
+    assert all(buf.read(2) == b"PK" for buf in out.values())    # ZIP (OOXML)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_publish_replaces_atomically(tmp_path):
+    target = tmp_path / "sub" / "doc.bin"
+    publish(b"viejo", target)
+    publish(BytesIO(b"nuevo"), target)
+
+    assert target.read_bytes() == b"nuevo"
+    if os.name == "posix":                      # mkstemp crea con 0600
+        assert target.stat().st_mode & 0o777 == 0o644
+    assert [p.name for p in target.parent.iterdir()] == ["doc.bin"]
+
+
+def test_failed_render_leaves_previous_file(tmp_path, monkeypatch):
+    target = tmp_path / "a.pdf"
+    target.write_bytes(b"previo")
+
+    def broken(spec, out):
+        out.write(b"%PDF a medias")
+        raise RuntimeError("falla a mitad de render")
+
+    monkeypatch.setitem(docspec.BACKENDS, "pdf", broken)
+    with pytest.raises(RuntimeError):
+        render(DocSpec([Heading("x")]), target)
+
+    assert target.read_bytes() == b"previo"
+    assert [p.name for p in tmp_path.iterdir()] == ["a.pdf"]
+
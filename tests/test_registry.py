@@ -0,0 +1,88 @@
+import time
+
+import pytest
+
+from sqlmodel import select
+
+from employ_toolkit.core.models import Document
+from employ_toolkit.core import registry
+from employ_toolkit.core.registry import DocumentRegistry
+from employ_toolkit.core.storage import unit_of_work
+
+
+def _count():
+    with unit_of_work() as s:
+        return len(s.exec(select(Document)).all())
+
+
+def test_flush_on_size_threshold():
+    reg = DocumentRegistry(max_pending=3, max_age=60)
+    reg.register(1, 1, "a", "a.pdf")
+    reg.register(1, 1, "b", "b.pdf")
+    assert _count() == 0 and reg.pending() == 2
+
+    reg.register(1, 1, "c", "c.pdf")          # alcanza el umbral
+    assert _count() == 3 and reg.pending() == 0
+
+
+def test_explicit_and_timed_flush():
+    reg = DocumentRegistry(max_pending=100, max_age=0.05)
+    reg.register_many(7, 1, [("plan_docx", "p.docx"), ("plan_xlsx", "p.xlsx")])
+    deadline = time.time() + 2
+    while reg.pending() and time.time() < deadline:
+        time.sleep(0.01)
+    assert _count() == 2
+
+    reg.register(7, 2, "cv", "cv.docx")
+    assert reg.flush() == 1 and _count() == 3
+
+
+def test_same_path_is_registered_once_per_client():
+    reg = DocumentRegistry(max_pending=100, max_age=60)
+    first = reg.register(1, 1, "plan", "p.pdf")
+    assert reg.register(1, 1, "plan", "p.pdf") is first        # aún pendiente
+    reg.flush()
+
+    assert reg.register(1, 1, "plan", "p.pdf").id == first.id  # ya en BD
+    reg.register_many(1, 1, [("plan", "p.pdf"), ("x", "x.pdf"), ("x", "x.pdf")])
+    reg.register(2, 1, "plan", "p.pdf")                        # otro cliente
+    assert reg.flush() == 2 and _count() == 3
+
+
+def _flaky(monkeypatch, failures):
+    real = registry.unit_of_work
+    calls = []
+
+    def flaky():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise RuntimeError("database is locked")
+        return real()
+
+    monkeypatch.setattr(registry, "unit_of_work", flaky)
+    return calls
+
+
+def test_failed_size_flush_is_retried(monkeypatch):
+    calls = _flaky(monkeypatch, failures=1)
+    reg = DocumentRegistry(max_pending=1, max_age=0.02)
+    with pytest.raises(RuntimeError):
+        reg.register(1, 1, "a", "a.pdf")           # el flush por tamaño falla
+
+    deadline = time.time() + 2
+    while reg.pending() and time.time() < deadline:
+        time.sleep(0.01)
+    assert _count() == 1 and len(calls) == 2
+
+
+def test_failed_timed_flush_is_retried(monkeypatch):
+    calls = _flaky(monkeypatch, failures=2)
+    reg = DocumentRegistry(max_pending=100, max_age=0.02)
+    reg.register(1, 1, "a", "a.pdf")
+
+    deadline = time.time() + 2
+    while reg.pending() and time.time() < deadline:
+        time.sleep(0.01)
+    assert _count() == 1 and len(calls) == 3
+    assert calls[2] - calls[1] > calls[1] - calls[0]         # espera creciente
+    assert reg._failures == 0
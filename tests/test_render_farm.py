@@ -0,0 +1,39 @@
+# tests/test_render_farm.py
+import os
+from io import BytesIO
+
+import pytest
+
+from employ_toolkit.core.render_farm import RenderFarm, RenderJob
+
+CLIENT = {"id": 1, "full_name": "Tester"}
+DATA = {"meta": 10, "tipos": ["Pares"], "mensaje": "Hola", "tiempo": 30}
+
+
+def whoami(client) -> int:
+    return os.getpid()
+
+
+def test_jobs_render_in_warm_workers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    jobs = [RenderJob("networking", CLIENT, (DATA,), {"in_memory": True}),
+            RenderJob("networking", CLIENT, (DATA,)),
+            RenderJob("networking", CLIENT, ({},))]          # faltan claves
+
+    with RenderFarm(workers=2) as farm:
+        pdf, path, error = farm.render(jobs)
+
+    assert isinstance(pdf, BytesIO) and pdf.read(4) == b"%PDF"
+    assert (tmp_path / path).read_bytes().startswith(b"%PDF")   # cwd del padre
+    assert isinstance(error, Exception)
+
+
+def test_workers_are_recycled():
+    with RenderFarm(workers=1, max_tasks_per_child=1) as farm:
+        pids = farm.render([RenderJob(f"{__name__}:whoami", CLIENT) for _ in range(3)])
+    assert len(set(pids)) == 3 and os.getpid() not in pids
+
+
+def test_unknown_generator():
+    with RenderFarm(workers=1) as farm, pytest.raises(KeyError):
+        farm.submit(RenderJob("no_existe", CLIENT))
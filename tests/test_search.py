@@ -0,0 +1,38 @@
+import json
+from datetime import date
+
+from employ_toolkit.core import search
+from employ_toolkit.core.models import Client, CVData, Document
+from employ_toolkit.core.storage import unit_of_work
+
+
+def _client(name, email, profession):
+    return Client(full_name=name, email=email, phone="1",
+                  profession=profession, age=30, disc_type="I")
+
+
+def test_triggers_keep_index_in_sync():
+    with unit_of_work() as s:
+        ana = _client("Ana Pérez", "ana@demo.com", "Contadora")
+        luis = _client("Luis Gómez", "luis@demo.com", "Desarrollador")
+        s.add_all([ana, luis]); s.flush()
+        s.add(Document(client_id=luis.id, module=1, doc_type="brand_canvas",
+                       path="workspace/Luis_ab12_canvas.pdf"))
+        s.add(CVData(client_id=ana.id, updated_at=date.today(), pdf_path="",
+                     docx_path="", json_blob=json.dumps({"skills": ["Kubernetes"]})))
+
+    with unit_of_work() as s:
+        # acentos y prefijos
+        assert [c.full_name for c in search.search_clients(s, "perez")] == ["Ana Pérez"]
+        assert [c.full_name for c in search.search_clients(s, "canv")] == ["Luis Gómez"]
+        assert [c.full_name for c in search.search_clients(s, "kubernetes")] == ["Ana Pérez"]
+        hits = search.search(s, "luis", kinds=("client",))
+        assert [h.kind for h in hits] == ["client"]
+
+    with unit_of_work() as s:
+        luis.profession = "Arquitecto"
+        s.add(luis)
+    with unit_of_work() as s:
+        assert search.search_clients(s, "desarrollador") == []
+        assert search.search_clients(s, "arquitecto")[0].id == luis.id
+        assert search.search_clients(s, "") == []
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from employ_toolkit.core.models import CandidateProfile
+from employ_toolkit.core.step_cache import StepCache, stable_hash, step_version
+from employ_toolkit.core.workflow import WorkflowManager
+
+
+def test_unchanged_steps_come_from_cache(tmp_path):
+    calls = []
+
+    @step_version("1")
+    def render(ctx, suffix):
+        calls.append(suffix)
+        out = tmp_path / f"{ctx['intake'].full_name}{suffix}"
+        out.write_text("x")
+        return out
+
+    def run(name="Ana", suffix=".pptx"):
+        wm = WorkflowManager(cache=StepCache(tmp_path / "cache"))
+        wm.context["intake"] = CandidateProfile(full_name=name, email="a@x.com",
+                                                location="X", disc_type="D")
+        wm.add_step("ppt", render, depends_on=["intake"], suffix=suffix)
+        return wm.run()["ppt"], wm.cache
+
+    first, _ = run()
+    t0 = time.perf_counter()
+    again, cache = run()
+    assert again == first and calls == [".pptx"] and cache.stats()["hits"] == 1
+    assert time.perf_counter() - t0 < 0.1
+
+    run(name="Bea")                       # entradas distintas
+    run(suffix=".pdf")                    # kwargs distintos
+    first.unlink()                        # artefacto borrado → se regenera
+    run()
+    render.step_version = "2"             # generador nuevo
+    run()
+    assert calls == [".pptx", ".pptx", ".pdf", ".pptx", ".pptx"]
+
+
+def test_models_hash_by_content_not_primary_key():
+    a = CandidateProfile(id=1, full_name="Ana", email="a", location="X", disc_type="D")
+    b = CandidateProfile(id=7, full_name="Ana", email="a", location="X", disc_type="D")
+    assert stable_hash({"intake": a}) == stable_hash({"intake": b})
+
+
+def test_lru_eviction(tmp_path):
+    cache = StepCache(tmp_path, max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, "s", key)
+    assert cache.get("a") == (True, "a")   # "b" pasa a ser el menos usado
+    cache.put("c", "s", "c")
+    assert cache.get("b") == (False, None)
+    assert cache.get("a")[0] and cache.get("c")[0]
+    assert not (tmp_path / "b.pkl").exists()
+
+
+def test_run_step_memoizes_and_interactive_is_skipped(tmp_path):
+    calls = []
+    wm = WorkflowManager(cache=StepCache(tmp_path))
+    step = lambda ctx: calls.append(1) or len(calls)
+    wm.run_step("s", step)
+    wm.run_step("s", step)
+    wm.add_step("ask", step, interactive=True)
+    wm.run()
+    wm.steps.clear()
+    wm.context.pop("ask")
+    wm.add_step("ask", step, interactive=True)
+    wm.run()
+    assert len(calls) == 3
+
+
+def test_key_changes_with_function_body_not_repr():
+    ctx, kw = {"intake": "Ana"}, {}
+    one = StepCache.key_for("s", lambda c: 1, ctx, kw)
+    assert StepCache.key_for("s", lambda c: 1, ctx, kw) == one
+    assert StepCache.key_for("s", lambda c: 2, ctx, kw) != one
+
+    with pytest.raises(TypeError):
+        stable_hash({"x": object()})
+
+
+def test_unhashable_inputs_run_without_cache(tmp_path):
+    calls = []
+    for _ in range(2):
+        wm = WorkflowManager(cache=StepCache(tmp_path))
+        wm.context["intake"] = object()
+        wm.add_step("s", lambda ctx: calls.append(1), depends_on=["intake"])
+        wm.run()
+    assert len(calls) == 2
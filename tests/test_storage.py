@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import select
+
+from employ_toolkit.core import storage
+from employ_toolkit.core.models import Client
+
+
+def test_wal_profile_pragmas(tmp_path):
+    engine = storage.make_engine(tmp_path / "wal.db", "wal")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1   # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    engine.dispose()
+
+
+def test_legacy_profile_keeps_rollback_journal(tmp_path):
+    engine = storage.make_engine(tmp_path / "legacy.db", "legacy")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    engine.dispose()
+
+
+def _client(email):
+    return Client(full_name="UoW", email=email, phone="1",
+                  profession="QA", age=30, disc_type="D")
+
+
+def test_unit_of_work_commits_and_rolls_back():
+    with storage.unit_of_work() as s:
+        s.add(_client("ok@test.com"))
+
+    with pytest.raises(RuntimeError):
+        with storage.unit_of_work() as s:
+            s.add(_client("ko@test.com"))
+            raise RuntimeError("falla a mitad")
+
+    with storage.unit_of_work() as s:
+        emails = s.exec(select(Client.email)).all()
+    assert emails == ["ok@test.com"]
+
+
+def test_one_session_per_thread():
+    mine = storage.session_registry()
+    assert storage.session_registry() is mine
+
+    other = []
+    t = threading.Thread(target=lambda: other.append(storage.session_registry()))
+    t.start(); t.join()
+    assert other[0] is not mine
+
+
+def test_get_session_does_not_close_the_thread_session():
+    with storage.unit_of_work() as s:
+        client = _client("outer@test.com")
+        s.add(client)
+        with storage.get_session() as other:
+            assert other is not s
+            other.exec(select(Client)).all()
+        assert client in s                      # sigue en la sesión del hilo
+
+    with storage.get_session() as s:
+        assert s.exec(select(Client.email)).all() == ["outer@test.com"]
+
+
+def test_pool_status_reports_checkout_waits(tmp_path):
+    storage.bind_engine(storage.make_engine(tmp_path / "pool.db"))
+    storage.init_db()
+    with storage.unit_of_work() as s:
+        s.exec(select(Client)).all()
+    status = storage.pool_status()
+    assert status["checkouts"] >= 1
+    assert status["wait_max_ms"] >= 0
+    storage.engine.dispose()
+
+
+def test_document_cache_invalidated_on_commit():
+    from sqlmodel import delete
+    from employ_toolkit.core.models import Document
+    from employ_toolkit.core.registry import DocumentRegistry
+
+    with storage.unit_of_work() as s:
+        client = _client("cache@test.com")
+        s.add(client); s.flush()
+        client_id = client.id
+
+    assert storage.get_documents(client_id) == ()
+    assert storage.get_documents(client_id) == ()
+    before = storage.cache_stats()
+    assert before["hits"] >= 1
+
+    reg = DocumentRegistry(max_pending=10, max_age=60)
+    reg.register(client_id, 1, "plan", "plan.docx")
+    assert storage.get_documents(client_id) == ()      # aún en el buffer
+    reg.flush()                                         # commit → invalida
+    assert [d.path for d in storage.get_documents(client_id)] == ["plan.docx"]
+
+    with storage.unit_of_work() as s:                   # delete masivo
+        s.exec(delete(Document).where(Document.client_id == client_id))
+    assert storage.get_documents(client_id) == ()
+    assert storage.get_client(client_id).email == "cache@test.com"
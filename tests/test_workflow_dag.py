@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from employ_toolkit.core.workflow import WorkflowError, WorkflowManager
+
+
+def _sleep_step(value, seconds=0.2):
+    def step(ctx):
+        time.sleep(seconds)
+        return (value, sorted(ctx))
+    return step
+
+
+def test_independent_steps_run_concurrently():
+    wm = WorkflowManager()
+    wm.add_step("intake", _sleep_step("i", 0.05))
+    for name in ("brand_canvas", "content_plan", "linkedin_networking"):
+        wm.add_step(name, _sleep_step(name), depends_on=["intake"])
+    wm.add_step("report", _sleep_step("r", 0.05),
+                depends_on=["content_plan", "linkedin_networking"])
+
+    t0 = time.perf_counter()
+    wm.run(max_workers=4)
+    assert time.perf_counter() - t0 < 0.5            # cadena más larga ≈ 0.3 s
+
+    assert list(wm.context) == ["intake", "brand_canvas", "content_plan",
+                                "linkedin_networking", "report"]
+    # cada paso sólo ve sus dependencias (directas e indirectas)
+    assert wm.context["brand_canvas"] == ("brand_canvas", ["intake"])
+    assert wm.context["report"][1] == ["content_plan", "intake", "linkedin_networking"]
+
+
+def test_interactive_steps_run_alone_on_caller_thread():
+    wm, active, log = WorkflowManager(), [], []
+    lock = threading.Lock()
+
+    def step(name, interactive):
+        def run(ctx):
+            with lock:
+                active.append(name)
+                log.append((name, len(active), threading.current_thread() is threading.main_thread()))
+            time.sleep(0.05)
+            with lock:
+                active.remove(name)
+        return run
+
+    wm.add_step("intake", step("intake", True), interactive=True)
+    wm.add_step("a", step("a", False), depends_on=["intake"])
+    wm.add_step("ask", step("ask", True), depends_on=["intake"], interactive=True)
+    wm.add_step("b", step("b", False), depends_on=["intake"])
+    wm.run(max_workers=4)
+
+    by_name = {n: (concurrent, main) for n, concurrent, main in log}
+    assert by_name["intake"] == (1, True) and by_name["ask"] == (1, True)
+
+
+def test_errors_cycles_and_missing_dependencies():
+    wm = WorkflowManager()
+    wm.add_step("a", lambda ctx: 1 / 0)
+    with pytest.raises(WorkflowError) as err:
+        wm.run()
+    assert err.value.step == "a" and isinstance(err.value.__cause__, ZeroDivisionError)
+
+    wm = WorkflowManager()
+    wm.add_step("a", lambda ctx: 1, depends_on=["b"])
+    wm.add_step("b", lambda ctx: 1, depends_on=["a"])
+    with pytest.raises(ValueError, match="circulares"):
+        wm.run()
+
+    wm = WorkflowManager()
+    wm.add_step("a", lambda ctx: 1, depends_on=["nada"])
+    with pytest.raises(ValueError, match="inexistentes"):
+        wm.run()
+
+
+def _double(ctx, key):
+    return ctx[key] * 2
+
+
+def test_process_executor():
+    wm = WorkflowManager()
+    wm.context["seed"] = 21
+    wm.add_step("x", _double, depends_on=["seed"], key="seed")
+    wm.add_step("y", _double, depends_on=["x"], key="x")
+    assert wm.run(max_workers=2, executor="process") == {"x": 42, "y": 84}
@@ -0,0 +1,75 @@
+import os
+import time
+
+import pytest
+
+from employ_toolkit.core.cancellation import CancellationToken, StepTimeout
+from employ_toolkit.core.workflow import WorkflowError, WorkflowManager
+
+
+def _hang(ctx):
+    time.sleep(30)
+
+
+def _cooperative(ctx, cancel: CancellationToken):
+    while not cancel.cancelled:
+        time.sleep(0.01)
+    return "parado"
+
+
+def _pid(ctx):
+    return os.getpid()
+
+
+def test_hung_isolated_step_is_killed_and_others_keep_going():
+    wm = WorkflowManager()
+    wm.add_step("base", lambda ctx: 1)
+    wm.add_step("render", _hang, depends_on=["base"], timeout=0.3, isolate=True)
+    wm.add_step("report", lambda ctx: "r", depends_on=["render"])
+    wm.add_step("demand", lambda ctx: ctx["base"] + 1, depends_on=["base"])
+
+    t0 = time.perf_counter()
+    results = wm.run(keep_going=True)
+    assert time.perf_counter() - t0 < 5
+
+    assert results == {"base": 1, "demand": 2}
+    assert isinstance(wm.errors["render"].__cause__, StepTimeout)
+    assert "omitido" in str(wm.errors["report"])
+
+
+def test_timeout_raises_without_keep_going():
+    wm = WorkflowManager(step_timeout=0.2)
+    wm.add_step("render", _hang, isolate=True)
+    with pytest.raises(WorkflowError, match="límite"):
+        wm.run()
+
+
+def test_hung_thread_does_not_block_run_without_keep_going():
+    wm = WorkflowManager()
+    wm.add_step("render", lambda ctx: time.sleep(4), timeout=0.3)   # hilo, no proceso
+
+    t0 = time.perf_counter()
+    with pytest.raises(WorkflowError, match="límite"):
+        wm.run()
+    assert time.perf_counter() - t0 < 2
+
+
+def test_token_reaches_steps_that_accept_it():
+    wm = WorkflowManager()
+    wm.add_step("loop", _cooperative, timeout=5)
+    wm.add_step("pid", _pid, isolate=True)
+    t0 = time.perf_counter()
+    # el token vence a los 5 s; lo cancelamos antes desde otro paso
+    wm.add_step("stop", lambda ctx: wm._tokens["loop"].cancel())
+    results = wm.run(max_workers=3)
+    assert results["loop"] == "parado" and time.perf_counter() - t0 < 4
+    assert results["pid"] != os.getpid()
+
+
+def test_token_pickles_with_its_deadline():
+    import pickle
+    token = CancellationToken(timeout=0.05)
+    copy = pickle.loads(pickle.dumps(token))
+    assert copy.deadline == token.deadline and not copy.cancelled
+    time.sleep(0.06)
+    assert copy.cancelled